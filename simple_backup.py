@@ -145,18 +145,17 @@ class SimpleBackup:
                         print(f"    🔄 轉換為 {office_name}")
                         converted_count += 1
                     
-                    # 下載檔案內容
-                    content = self.file_handler.download_file_content(file_id, preferred_format=preferred_format)
-                    
                     # 生成檔案名稱
                     safe_filename = self.file_handler.generate_safe_filename(file_info, preferred_format)
                     file_path = output_path / safe_filename
-                    
-                    # 儲存檔案
-                    self.file_handler.save_file(content, file_path, file_info)
-                    
+
+                    # 串流下載直接寫入檔案
+                    bytes_written = self.file_handler.download_file_to_path(
+                        file_id, file_path, preferred_format=preferred_format
+                    )
+
                     downloaded_count += 1
-                    print(f"    ✅ 完成 ({format_bytes(len(content))})")
+                    print(f"    ✅ 完成 ({format_bytes(bytes_written)})")
                     
                 except Exception as e:
                     failed_count += 1
@@ -206,12 +205,11 @@ class SimpleBackup:
             # 下載檔案
             print("📥 正在下載...")
             preferred_format = None if not office_format else None  # 使用預設 Office 格式
-            content = self.file_handler.download_file_content(file_id, preferred_format=preferred_format)
-            
-            # 儲存檔案
             safe_filename = self.file_handler.generate_safe_filename(file_info, preferred_format)
             file_path = output_path / safe_filename
-            self.file_handler.save_file(content, file_path, file_info)
+
+            # 串流下載直接寫入檔案
+            self.file_handler.download_file_to_path(file_id, file_path, preferred_format=preferred_format)
             
             print(f"✅ 下載完成!")
             if is_google_workspace and office_format:
@@ -6,6 +6,7 @@ from .auth import AuthManager, GoogleOAuthProvider
 from .downloader import AsyncDownloader, DownloadManager, DownloadTask, DownloadStatus
 from .progress import ProgressTracker, ProgressSnapshot
 from .file_handler import FileHandler, GoogleFileConverter
+from .async_file_handler import AsyncFileHandler, run_async
 from .paginated_loader import (
     PaginatedFolderLoader,
     CachedFolderLoader,
@@ -27,6 +28,8 @@ __all__ = [
     'ProgressSnapshot',
     'FileHandler',
     'GoogleFileConverter',
+    'AsyncFileHandler',
+    'run_async',
     # 分頁載入
     'PaginatedFolderLoader',
     'CachedFolderLoader',
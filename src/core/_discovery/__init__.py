@@ -0,0 +1,54 @@
+"""
+隨附的 Drive API discovery 文件
+讓 build 服務時不必向 Google 取回 discovery JSON
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+# 隨 repo 出貨的 Drive v3 discovery 文件（取自 googleapiclient 內建快取）
+_DRIVE_V3_DOC = Path(__file__).parent / 'drive.v3.json'
+
+
+@lru_cache(maxsize=1)
+def get_drive_discovery_document() -> str:
+    """讀取 Drive v3 discovery 文件（每個行程只讀一次磁碟）
+
+    Returns:
+        discovery 文件的 JSON 字串
+    """
+    return _DRIVE_V3_DOC.read_text(encoding='utf-8')
+
+
+def build_drive_service(credentials):
+    """以本地 discovery 文件建立 Drive v3 服務
+
+    build_from_document 完全繞過 discovery 快取與網路取回，
+    冷啟動時省下一次同步 HTTPS 往返；文件不存在時退回一般
+    build()（不使用 discovery 檔案快取）。
+
+    Args:
+        credentials: Google 認證憑證
+
+    Returns:
+        Drive 服務實例
+    """
+    from ..fast_json_model import FastJsonModel
+
+    try:
+        document = get_drive_discovery_document()
+    except OSError:
+        from googleapiclient.discovery import build
+        return build(
+            'drive', 'v3',
+            credentials=credentials,
+            cache_discovery=False,
+            model=FastJsonModel()
+        )
+
+    from googleapiclient.discovery import build_from_document
+    return build_from_document(
+        document,
+        credentials=credentials,
+        model=FastJsonModel()
+    )
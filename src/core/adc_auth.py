@@ -8,6 +8,7 @@ from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 from .base_auth import BaseAuth
+from .fast_json_model import FastJsonModel
 from ..utils.exceptions import AuthenticationError
 
 
@@ -61,7 +62,8 @@ class ADCAuth(BaseAuth):
                 'drive', 
                 'v3', 
                 credentials=self._credentials,
-                cache_discovery=False
+                cache_discovery=False,
+                model=FastJsonModel()
             )
             
             # 測試連線
@@ -0,0 +1,307 @@
+"""
+非同步 Google Drive 檔案處理器
+以 aiohttp 直接呼叫 Drive REST API，單一事件循環即可維持大量並行請求
+"""
+
+import asyncio
+from typing import List, Dict, Any, Optional
+
+import aiohttp
+
+from ..utils.logger import LoggerMixin
+from ..utils.helpers import fast_json_loads, validate_file_id
+from ..utils.exceptions import (
+    AuthenticationError,
+    FileNotFoundError,
+    FilePermissionError,
+    NetworkError,
+    RetryableError,
+    ValidationError
+)
+from .auth import auth_manager
+from .retry_manager import RetryManager, RetryStrategy
+
+# Drive REST API 基底位址
+DRIVE_API_BASE = 'https://www.googleapis.com/drive/v3'
+
+
+def run_async(coro):
+    """同步執行協程（CLI 等同步呼叫端的便利函數）
+
+    Args:
+        coro: 要執行的協程
+
+    Returns:
+        協程執行結果
+    """
+    return asyncio.run(coro)
+
+
+class AsyncFileHandler(LoggerMixin):
+    """非同步 Google Drive 檔案處理器
+
+    繞過 googleapiclient 的阻塞式 execute()，
+    直接以 aiohttp 對 Drive REST API 發出請求，
+    獨立呼叫以 asyncio.gather 並行展開。
+    """
+
+    # 與 FileHandler 相同的欄位投影
+    FILE_FIELDS = 'id,name,mimeType,size,createdTime,modifiedTime,parents,webViewLink'
+
+    # 單一查詢可合併的資料夾數量上限
+    BATCH_QUERY_SIZE = 50
+
+    # 連線池大小
+    MAX_CONNECTIONS = 50
+
+    # 可重試的 HTTP 狀態碼
+    RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+    def __init__(self, access_token: str = None):
+        """
+        初始化非同步檔案處理器
+
+        Args:
+            access_token: 存取令牌（預設從認證管理器取得）
+        """
+        self._access_token = access_token
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        self.retry_manager = RetryManager(
+            max_retries=3,
+            base_delay=1.0,
+            max_delay=30.0,
+            strategy=RetryStrategy.EXPONENTIAL,
+            jitter=True
+        )
+
+        self.logger.info("非同步檔案處理器已初始化")
+
+    def _get_access_token(self) -> str:
+        """取得 Bearer 令牌"""
+        if self._access_token:
+            return self._access_token
+
+        if not auth_manager.is_authenticated():
+            if not auth_manager.authenticate():
+                raise AuthenticationError("認證失敗，無法執行操作")
+
+        credentials = auth_manager.get_credentials()
+        if not credentials or not credentials.token:
+            raise AuthenticationError("無法取得存取令牌，請先進行認證")
+
+        return credentials.token
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """取得 HTTP 會話（重複使用連線池）"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.MAX_CONNECTIONS),
+                timeout=aiohttp.ClientTimeout(total=300)
+            )
+        return self._session
+
+    async def close(self):
+        """關閉 HTTP 會話"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+            self.logger.debug("HTTP 會話已關閉")
+
+    async def _request_json(self, path: str, params: Dict[str, Any] = None,
+                            file_id: str = None) -> Dict[str, Any]:
+        """對 Drive API 發出 GET 請求並解析 JSON
+
+        Args:
+            path: API 路徑（相對於 DRIVE_API_BASE）
+            params: 查詢參數
+            file_id: 關聯的檔案 ID（用於錯誤訊息）
+
+        Returns:
+            回應 JSON
+        """
+        session = await self._get_session()
+        headers = {'Authorization': f'Bearer {self._get_access_token()}'}
+        url = f'{DRIVE_API_BASE}{path}'
+
+        async def do_request():
+            async with session.get(url, params=params, headers=headers) as resp:
+                if resp.status in self.RETRYABLE_STATUS:
+                    retry_after = resp.headers.get('Retry-After')
+                    raise RetryableError(
+                        f"HTTP 錯誤: {resp.status}",
+                        retry_after=float(retry_after) if retry_after else None,
+                        file_id=file_id
+                    )
+                if resp.status == 404:
+                    raise FileNotFoundError(file_id or url, "檔案不存在")
+                if resp.status == 403:
+                    raise FilePermissionError(file_id or url, "沒有檔案存取權限")
+                if resp.status >= 400:
+                    raise NetworkError(
+                        f"HTTP 錯誤: {resp.status}",
+                        status_code=resp.status,
+                        file_id=file_id
+                    )
+                return fast_json_loads(await resp.read())
+
+        result = await self.retry_manager.retry_async(
+            do_request,
+            custom_exceptions=(RetryableError, aiohttp.ClientError, asyncio.TimeoutError)
+        )
+
+        if not result.success:
+            self.logger.error(f"API 呼叫失敗，已重試 {result.attempts} 次: {result.error}")
+            raise result.error
+
+        return result.result
+
+    async def get_file_info(self, file_id: str) -> Dict[str, Any]:
+        """取得檔案資訊
+
+        Args:
+            file_id: Google Drive 檔案 ID
+
+        Returns:
+            檔案資訊字典
+        """
+        if not validate_file_id(file_id):
+            raise ValidationError('file_id', file_id, "無效的檔案 ID 格式")
+
+        file_info = await self._request_json(
+            f'/files/{file_id}',
+            params={'fields': self.FILE_FIELDS},
+            file_id=file_id
+        )
+
+        self.logger.debug(f"取得檔案資訊: {file_info.get('name')}")
+        return file_info
+
+    async def get_file_info_many(self, file_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """並行取得多個檔案的資訊
+
+        Args:
+            file_ids: 檔案 ID 清單
+
+        Returns:
+            {檔案 ID: 檔案資訊} 字典
+        """
+        infos = await asyncio.gather(
+            *(self.get_file_info(file_id) for file_id in file_ids)
+        )
+        return {info['id']: info for info in infos}
+
+    async def _list_page(self, query: str, page_token: str = None) -> Dict[str, Any]:
+        """取得單一列表分頁"""
+        params = {
+            'q': query,
+            'pageSize': 1000,
+            'fields': f'nextPageToken,files({self.FILE_FIELDS})'
+        }
+        if page_token:
+            params['pageToken'] = page_token
+
+        return await self._request_json('/files', params=params)
+
+    async def _list_children_chunk(self, chunk: List[str]) -> List[Dict[str, Any]]:
+        """列出一組資料夾（最多 BATCH_QUERY_SIZE 個）的所有子項目"""
+        parents_clause = ' or '.join(f"'{fid}' in parents" for fid in chunk)
+        query = f"trashed=false and ({parents_clause})"
+
+        files = []
+        page_token = None
+        while True:
+            results = await self._list_page(query, page_token)
+            files.extend(results.get('files', []))
+
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
+
+        return files
+
+    async def get_folder_contents(self, folder_id: str, recursive: bool = False,
+                                  max_depth: int = 10) -> List[Dict[str, Any]]:
+        """取得資料夾內容
+
+        遞迴模式以 BFS 處理：每層的資料夾合併為批次查詢並以
+        asyncio.gather 並行發出。
+
+        Args:
+            folder_id: 資料夾 ID
+            recursive: 是否遞迴取得子資料夾內容
+            max_depth: 最大遞迴深度
+
+        Returns:
+            檔案清單
+        """
+        if not validate_file_id(folder_id):
+            raise ValidationError('folder_id', folder_id, "無效的資料夾 ID 格式")
+
+        folder_info = await self.get_file_info(folder_id)
+        if folder_info.get('mimeType') != 'application/vnd.google-apps.folder':
+            raise ValidationError('folder_id', folder_id, "指定的 ID 不是資料夾")
+
+        all_files: List[Dict[str, Any]] = []
+        seen = {folder_id}
+        frontier = [folder_id]
+        depth = 0
+
+        while frontier and depth <= max_depth:
+            chunks = [
+                frontier[start:start + self.BATCH_QUERY_SIZE]
+                for start in range(0, len(frontier), self.BATCH_QUERY_SIZE)
+            ]
+            chunk_results = await asyncio.gather(
+                *(self._list_children_chunk(chunk) for chunk in chunks)
+            )
+
+            next_frontier = []
+            for files in chunk_results:
+                for file_info in files:
+                    all_files.append(file_info)
+                    if file_info.get('mimeType') == 'application/vnd.google-apps.folder':
+                        child_id = file_info['id']
+                        if child_id not in seen:
+                            seen.add(child_id)
+                            next_frontier.append(child_id)
+
+            if not recursive:
+                break
+
+            frontier = next_frontier
+            depth += 1
+
+        self.logger.info(f"取得資料夾內容: {len(all_files)} 個項目")
+        return all_files
+
+    async def search_files(self, query: str, folder_id: str = None,
+                           file_type: str = None) -> List[Dict[str, Any]]:
+        """搜尋檔案
+
+        Args:
+            query: 搜尋關鍵字
+            folder_id: 限制搜尋範圍的資料夾 ID
+            file_type: 檔案類型篩選
+
+        Returns:
+            搜尋結果清單
+        """
+        escaped = query.replace('\\', '\\\\').replace("'", "\\'")
+        parts = [f"name contains '{escaped}'", "trashed=false"]
+
+        if folder_id:
+            parts.append(f"'{folder_id}' in parents")
+
+        if file_type:
+            if file_type == 'folder':
+                parts.append("mimeType='application/vnd.google-apps.folder'")
+            elif file_type == 'document':
+                parts.append("mimeType contains 'document'")
+            elif file_type == 'image':
+                parts.append("mimeType contains 'image'")
+
+        results = await self._list_page(' and '.join(parts))
+
+        files = results.get('files', [])
+        self.logger.info(f"搜尋結果: {len(files)} 個檔案")
+        return files
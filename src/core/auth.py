@@ -15,6 +15,8 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
+from .fast_json_model import FastJsonModel
+
 from ..utils.logger import LoggerMixin
 from ..utils.config import get_config
 from ..utils.exceptions import AuthenticationError, ConfigurationError
@@ -63,7 +65,8 @@ class GoogleOAuthProvider(LoggerMixin):
             token_path.parent.mkdir(parents=True, exist_ok=True)
             
             with open(token_path, 'wb') as token_file:
-                pickle.dump(credentials, token_file)
+                # 最高協定序列化更快、令牌檔也更小
+                pickle.dump(credentials, token_file, protocol=pickle.HIGHEST_PROTOCOL)
                 
             self.logger.info(f"認證令牌已儲存: {token_path}")
         except Exception as e:
@@ -359,7 +362,8 @@ class AuthManager(LoggerMixin):
                         'drive', 
                         'v3', 
                         credentials=credentials,
-                        cache_discovery=False
+                        cache_discovery=False,
+                        model=FastJsonModel()
                     )
                     self.logger.debug("Google Drive 服務已建立 (透過 OAuth)")
                     
@@ -368,7 +372,46 @@ class AuthManager(LoggerMixin):
                     raise AuthenticationError(f"無法建立 Google Drive 服務: {e}")
         
         return self._drive_service
-    
+
+    def get_credentials(self):
+        """取得當前認證方式的憑證
+
+        Returns:
+            認證憑證，未認證時為 None
+        """
+        if self._current_auth_method == "adc" and self.adc_auth:
+            return self.adc_auth.get_credentials()
+        return self.oauth_provider.get_credentials()
+
+    def create_drive_service(self):
+        """建立全新的 Drive 服務實例（不進入快取）
+
+        googleapiclient 的 http 物件不是執行緒安全的，
+        平行處理時每個工作執行緒需要專屬的服務實例。
+
+        Returns:
+            新的 Google Drive 服務實例
+        """
+        credentials = self.get_credentials()
+
+        if not credentials:
+            raise AuthenticationError("無法取得認證憑證，請先進行認證")
+
+        try:
+            service = build(
+                'drive',
+                'v3',
+                credentials=credentials,
+                cache_discovery=False,
+                model=FastJsonModel()
+            )
+            self.logger.debug("新的 Google Drive 服務已建立")
+            return service
+
+        except Exception as e:
+            self.logger.error(f"建立 Drive 服務失敗: {e}")
+            raise AuthenticationError(f"無法建立 Google Drive 服務: {e}")
+
     def get_service(self, service_name: str, version: str = 'v3'):
         """取得指定的 Google API 服務
         
@@ -392,7 +435,8 @@ class AuthManager(LoggerMixin):
                     service_name,
                     version,
                     credentials=credentials,
-                    cache_discovery=False
+                    cache_discovery=False,
+                    model=FastJsonModel()
                 )
                 self._service_cache[cache_key] = service
                 self.logger.debug(f"Google {service_name} v{version} 服務已建立")
@@ -537,6 +581,19 @@ def get_authenticated_service(service_name: str = 'drive', version: str = 'v3'):
         return auth_manager.get_service(service_name, version)
 
 
+def create_authenticated_service():
+    """便利函數：建立全新的已認證 Drive 服務（供工作執行緒使用）
+
+    Returns:
+        新的 Google Drive 服務實例
+    """
+    if not auth_manager.is_authenticated():
+        if not auth_manager.authenticate():
+            raise AuthenticationError("認證失敗，無法取得服務")
+
+    return auth_manager.create_drive_service()
+
+
 def ensure_authenticated(func):
     """裝飾器：確保函數執行前已認證
     
@@ -3,17 +3,84 @@
 定義所有認證方式的統一介面
 """
 
+import hashlib
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Callable, Optional, Dict, Any
 from ..utils.logger import LoggerMixin
 
 
+# 跨認證實例共用的 Drive 服務快取：build() 每次都要解析 discovery
+# 文件並建立新的 HTTP 連線池，對「每請求建一個認證」的使用模式是
+# 重複浪費。以憑證指紋＋權限範圍為鍵，相同組態直接重用同一服務，
+# 也因此沿用既有連線的 keep-alive。
+_SERVICE_CACHE: Dict[tuple, Any] = {}
+_SERVICE_CACHE_LOCK = threading.Lock()
+
+
+def get_cached_drive_service(cache_key: tuple, builder: Callable):
+    """取得（或建立並快取）指定鍵的 Drive 服務
+
+    Args:
+        cache_key: 可雜湊的快取鍵（認證方式、憑證指紋、scopes）
+        builder: 快取未命中時建立服務的無參數函數
+
+    Returns:
+        Drive 服務實例
+    """
+    with _SERVICE_CACHE_LOCK:
+        service = _SERVICE_CACHE.get(cache_key)
+        if service is None:
+            service = builder()
+            _SERVICE_CACHE[cache_key] = service
+        return service
+
+
+# 已通過連線測試的服務鍵：about().get 探測純為確認連通性，
+# 同一（憑證, scopes）組合每個行程只需付一次網路往返
+_PROBED_KEYS = set()
+
+
+def probe_needed(cache_key: tuple) -> bool:
+    """判斷指定服務鍵是否仍需連線測試
+
+    Args:
+        cache_key: 與服務快取相同的鍵
+
+    Returns:
+        是否需要執行 about().get 探測
+    """
+    with _SERVICE_CACHE_LOCK:
+        return cache_key not in _PROBED_KEYS
+
+
+def mark_probed(cache_key: tuple):
+    """記錄指定服務鍵已通過連線測試（探測成功後呼叫）"""
+    with _SERVICE_CACHE_LOCK:
+        _PROBED_KEYS.add(cache_key)
+
+
+@lru_cache(maxsize=32)
+def credentials_file_fingerprint(path: str, mtime: float, size: int) -> str:
+    """計算憑證檔案內容的指紋（依 (路徑, mtime, 大小) 快取）
+
+    檔案未變動時不重讀內容；變動會改變 mtime/size 而自然失效。
+    """
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
 class BaseAuth(LoggerMixin, ABC):
     """基礎認證抽象類別
     
     所有認證提供者的基底類別，定義統一的認證介面
     """
-    
+
+    # __slots__ 省去每實例的 __dict__（認證實例常被大量持有），
+    # 屬性存取也走更快的插槽描述器
+    __slots__ = ('scopes', '_credentials', '_drive_service', '_authenticated')
+
     def __init__(self, scopes: list = None):
         """
         初始化基礎認證
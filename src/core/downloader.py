@@ -4,7 +4,6 @@
 """
 
 import asyncio
-import aiofiles
 import aiohttp
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
@@ -155,14 +154,6 @@ class AsyncDownloader(LoggerMixin):
                 # 使用執行緒池執行同步的 Google API 呼叫
                 loop = asyncio.get_event_loop()
                 with ThreadPoolExecutor() as executor:
-                    # 下載檔案內容
-                    content = await loop.run_in_executor(
-                        executor,
-                        file_handler.download_file_content,
-                        file_id,
-                        preferred_format
-                    )
-                    
                     # 生成安全檔案名稱
                     safe_filename = await loop.run_in_executor(
                         executor,
@@ -170,18 +161,24 @@ class AsyncDownloader(LoggerMixin):
                         file_info,
                         preferred_format
                     )
-                
-                # 建立完整檔案路徑
-                file_path = output_path / safe_filename
-                
-                # 非同步寫入檔案
-                await self._write_file_async(file_path, content)
-                
+
+                    # 建立完整檔案路徑
+                    file_path = output_path / safe_filename
+
+                    # 串流下載直接寫入目的檔案，避免整個檔案緩衝在記憶體
+                    bytes_written = await loop.run_in_executor(
+                        executor,
+                        file_handler.download_file_to_path,
+                        file_id,
+                        file_path,
+                        preferred_format
+                    )
+
                 # 更新進度
                 if progress_tracker:
                     current_files = progress_tracker._downloaded_files + 1
-                    current_bytes = progress_tracker._downloaded_bytes + len(content)
-                    
+                    current_bytes = progress_tracker._downloaded_bytes + bytes_written
+
                     progress_tracker.update_file_progress(current_files, file_name)
                     progress_tracker.update_bytes_progress(current_bytes)
                 
@@ -195,22 +192,6 @@ class AsyncDownloader(LoggerMixin):
                 self.logger.error(f"下載檔案失敗 {file_name}: {e}")
                 raise DownloadError(f"下載檔案失敗: {e}", file_id=file_id)
     
-    async def _write_file_async(self, file_path: Path, content: bytes):
-        """非同步寫入檔案"""
-        try:
-            # 確保目錄存在
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # 非同步寫入
-            async with aiofiles.open(file_path, 'wb') as f:
-                await f.write(content)
-                
-            self.logger.debug(f"檔案已寫入: {file_path}")
-            
-        except Exception as e:
-            self.logger.error(f"寫入檔案失敗 {file_path}: {e}")
-            raise
-    
     async def download_multiple_files(self,
                                     file_list: List[Dict[str, Any]],
                                     output_path: Path,
@@ -0,0 +1,24 @@
+"""
+Drive API 回應的快速 JSON 模型
+以 fast_json_loads 解析回應內容，有 orjson 時為 C 實作
+"""
+
+from googleapiclient.model import JsonModel
+
+from ..utils.helpers import fast_json_loads
+
+
+class FastJsonModel(JsonModel):
+    """以加速 JSON 解析器反序列化回應的模型
+
+    Drive 的列表回應是字典為主的大型 JSON，解壓後的解析屬 CPU 密集；
+    orjson 對這類載荷約有數倍於標準庫的速度。序列化端（請求本體）
+    量小且不在熱路徑，維持父類別的標準庫實作。
+    未安裝 orjson 時 fast_json_loads 退回標準庫，行為不變。
+    """
+
+    def deserialize(self, content):
+        body = fast_json_loads(content)
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
@@ -3,9 +3,14 @@ Google Drive 檔案處理器
 提供檔案清單、轉換和管理功能
 """
 
-import io
+import os
+import shutil
 import ssl
-import time
+import tempfile
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from typing import List, Dict, Any, Optional, Generator
 from pathlib import Path
 import mimetypes
@@ -14,11 +19,12 @@ from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaIoBaseDownload
 import requests.exceptions
 
+from ..utils.cache import TTLCache
 from ..utils.logger import LoggerMixin
 from ..utils.helpers import (
     get_file_extension_from_mime_type,
     is_google_workspace_file,
-    slugify,
+    fast_slugify,
     validate_file_id
 )
 from ..utils.exceptions import (
@@ -27,7 +33,9 @@ from ..utils.exceptions import (
     NetworkError,
     ValidationError
 )
-from .auth import get_authenticated_service, ensure_authenticated
+from .auth import get_authenticated_service, create_authenticated_service, ensure_authenticated
+from .listing_cache import ListingCache
+from .pacer import pacer
 from .retry_manager import RetryManager, RetryStrategy
 
 
@@ -73,37 +81,42 @@ class GoogleFileConverter(LoggerMixin):
         'application/vnd.google-apps.drawing': 'png',         # Google Drawings → PNG
         'application/vnd.google-apps.form': 'zip'             # Google Forms → ZIP
     }
-    
+
+    # 類別載入時建立的反向索引：匯出格式 MIME → 副檔名，
+    # 以及每種來源類型的預設匯出格式（對應表的第一個項目即 Office 預設）
+    _EXTENSION_BY_EXPORT_MIME = {}
+    _DEFAULT_EXPORT = {}
+    for _src_mime, _exports in EXPORT_FORMATS.items():
+        _EXTENSION_BY_EXPORT_MIME[_src_mime] = {fmt: ext for ext, fmt in _exports.items()}
+        _DEFAULT_EXPORT[_src_mime] = next(iter(_exports.values()))
+    del _src_mime, _exports
+
     def __init__(self):
         self.logger.debug("Google 檔案轉換器已初始化")
-    
+
+    @lru_cache(maxsize=128)
     def get_export_format(self, mime_type: str, preferred_format: str = None) -> Optional[str]:
         """取得匯出格式（預設為 Office 格式）
-        
+
         Args:
             mime_type: Google Workspace 檔案的 MIME 類型
             preferred_format: 偏好的格式（如 'pdf', 'docx'）
-            
+
         Returns:
             匯出格式的 MIME 類型
         """
-        if mime_type not in self.EXPORT_FORMATS:
+        available_formats = self.EXPORT_FORMATS.get(mime_type)
+        if available_formats is None:
             return None
-        
-        available_formats = self.EXPORT_FORMATS[mime_type]
-        
+
         # 如果指定了偏好格式且可用
-        if preferred_format and preferred_format in available_formats:
-            return available_formats[preferred_format]
-        
-        # 如果沒有指定格式，使用預設的 Office 格式
-        if mime_type in self.DEFAULT_OFFICE_FORMATS:
-            office_format = self.DEFAULT_OFFICE_FORMATS[mime_type]
-            if office_format in available_formats:
-                return available_formats[office_format]
-        
-        # 最後退回到第一個可用格式
-        return next(iter(available_formats.values()))
+        if preferred_format:
+            preferred = available_formats.get(preferred_format)
+            if preferred:
+                return preferred
+
+        # 沒有指定格式時使用預設的 Office 格式
+        return self._DEFAULT_EXPORT[mime_type]
     
     def get_office_format_name(self, mime_type: str) -> str:
         """取得 Office 格式名稱（用於顯示）
@@ -133,12 +146,11 @@ class GoogleFileConverter(LoggerMixin):
         Returns:
             檔案副檔名
         """
-        # 從匯出格式對應表中找到對應的副檔名
-        if mime_type in self.EXPORT_FORMATS:
-            for ext, format_mime in self.EXPORT_FORMATS[mime_type].items():
-                if format_mime == export_format:
-                    return f'.{ext}'
-        
+        # 以類別載入時建立的反向索引做 O(1) 查詢
+        ext = self._EXTENSION_BY_EXPORT_MIME.get(mime_type, {}).get(export_format)
+        if ext:
+            return f'.{ext}'
+
         # 退回到一般 MIME 類型對應
         return get_file_extension_from_mime_type(export_format)
 
@@ -149,10 +161,64 @@ class FileHandler(LoggerMixin):
     提供檔案清單、下載和管理功能
     """
     
+    # 單一查詢可合併的資料夾數量上限（Drive q 長度限制的安全值）
+    BATCH_QUERY_SIZE = 50
+
+    # Drive batch 端點單一批次的子請求數量上限
+    BATCH_REQUEST_SIZE = 100
+
+    # 檔案資訊查詢使用的欄位投影
+    FILE_FIELDS = 'id,name,mimeType,size,createdTime,modifiedTime,parents,webViewLink'
+
+    # 列舉用的欄位設定：較窄的投影可明顯縮小回應 JSON 與解析成本。
+    # 呼叫端請選擇夠用的最輕設定（統計只需 mimeType,size；
+    # 檔名生成只需 name,mimeType）
+    FIELDS_PROFILES = {
+        'minimal': 'id,name,mimeType',
+        'standard': 'id,name,mimeType,size,modifiedTime',
+        'full': FILE_FIELDS,
+    }
+
+    # 中繼資料快取設定
+    META_CACHE_SIZE = 10000
+    META_CACHE_TTL = 300  # 秒
+
+    # 平行列舉的工作執行緒數量上限
+    MAX_LIST_WORKERS = 8
+
+    # 下載分塊大小：大分塊減少每次 range 請求的 HTTP 開銷
+    DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+    # download_file_content 的記憶體緩衝上限，超過則溢出到暫存檔
+    SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+    # 遞迴遍歷可累積的項目總數軟上限
+    MAX_TRAVERSAL_ITEMS = 100000
+
+    # 統計計算改走 pandas 向量化路徑的清單長度門檻
+    STATS_VECTORIZE_THRESHOLD = 10000
+
     def __init__(self, drive_service=None):
         self.drive_service = drive_service
         self.converter = GoogleFileConverter()
-        
+
+        # 外部注入的服務可直接共用（如測試）；否則各執行緒建立專屬服務
+        self._service_injected = drive_service is not None
+        self._thread_services = threading.local()
+
+        # 檔案中繼資料快取：同一 ID 重複查詢時免除 API 往返
+        self._meta_cache = TTLCache(maxsize=self.META_CACHE_SIZE, ttl=self.META_CACHE_TTL)
+
+        # 列表持久化快取（延遲建立，避免不必要的磁碟操作）
+        self._listing_cache = None
+
+        # Workspace 副檔名查詢快取（組合輸入種類極少，命中率接近 100%）
+        self._workspace_extension = lru_cache(maxsize=128)(self._resolve_workspace_extension)
+
+        # 快取的 files 資源（見 _get_files_resource）
+        self._files_resource = None
+        self._files_resource_service = None
+
         # 初始化重試管理器
         self.retry_manager = RetryManager(
             max_retries=3,
@@ -169,6 +235,29 @@ class FileHandler(LoggerMixin):
         if self.drive_service is None:
             self.drive_service = get_authenticated_service('drive')
         return self.drive_service
+
+    def _get_files_resource(self):
+        """取得快取的 files 資源
+
+        每次 service.files() 都會重新走訪探索文件建構資源物件，
+        緊密迴圈中值得快取；服務實例更換時自動重建。
+        """
+        service = self._get_drive_service()
+        if self._files_resource is None or self._files_resource_service is not service:
+            self._files_resource = service.files()
+            self._files_resource_service = service
+        return self._files_resource
+
+    def _get_worker_files_resource(self):
+        """取得目前執行緒專用的 files 資源（與 _get_worker_service 對應）"""
+        if self._service_injected:
+            return self._get_files_resource()
+
+        files = getattr(self._thread_services, 'files', None)
+        if files is None:
+            files = self._get_worker_service().files()
+            self._thread_services.files = files
+        return files
     
     def _safe_api_call(self, api_call_func, *args, **kwargs):
         """安全的 API 呼叫，帶有重試機制
@@ -193,12 +282,20 @@ class FileHandler(LoggerMixin):
         )
         
         def wrapped_call():
+            # 先取得令牌，配額吃緊時在此阻塞而非收到 429 後才退避
+            pacer.acquire()
             try:
                 return api_call_func(*args, **kwargs)
             except retryable_exceptions as e:
                 self.logger.warning(f"網路錯誤，將重試: {e}")
                 raise
             except HttpError as e:
+                # 伺服器回報限流時降低全域請求速率
+                if e.resp.status == 429 or (
+                    e.resp.status == 403 and 'ratelimitexceeded' in str(e).lower()
+                ):
+                    pacer.throttle()
+
                 # 某些 HTTP 錯誤也可以重試
                 if e.resp.status in [429, 500, 502, 503, 504]:
                     self.logger.warning(f"HTTP 錯誤 {e.resp.status}，將重試: {e}")
@@ -218,6 +315,131 @@ class FileHandler(LoggerMixin):
         
         return result.result
     
+    def _get_listing_cache(self) -> Optional[ListingCache]:
+        """取得列表持久化快取（首次使用時建立）"""
+        if self._listing_cache is None:
+            try:
+                self._listing_cache = ListingCache()
+            except Exception as e:
+                self.logger.warning(f"列表快取初始化失敗，停用持久化快取: {e}")
+                return None
+        return self._listing_cache
+
+    def _cache_file_info(self, file_info: Dict[str, Any]):
+        """將檔案資訊寫入中繼資料快取
+
+        files.list 的回應已包含 get_file_info 所需的全部欄位，
+        列表結果可順便填入快取，讓後續的單檔查詢直接命中。
+        """
+        file_id = file_info.get('id')
+        if file_id:
+            self._meta_cache.set((file_id, self.FILE_FIELDS), file_info)
+
+    def invalidate(self, file_id: str):
+        """使指定檔案的中繼資料快取失效"""
+        self._meta_cache.pop((file_id, self.FILE_FIELDS))
+
+    def _get_worker_service(self):
+        """取得目前執行緒專用的 Drive 服務
+
+        googleapiclient 的 http 物件不是執行緒安全的，
+        平行列舉時每個工作執行緒需要自己的服務實例。
+        外部注入的服務（如測試）則直接共用。
+        """
+        if self._service_injected:
+            return self.drive_service
+
+        service = getattr(self._thread_services, 'service', None)
+        if service is None:
+            service = create_authenticated_service()
+            self._thread_services.service = service
+        return service
+
+    def _list_children_chunk(self, chunk: List[str], fields: str = None) -> List[Dict[str, Any]]:
+        """列出一組資料夾（最多 BATCH_QUERY_SIZE 個）的所有子項目"""
+        files_resource = self._get_worker_files_resource()
+        fields = fields or self.FILE_FIELDS
+        parents_clause = ' or '.join(f"'{fid}' in parents" for fid in chunk)
+        query = f"trashed=false and ({parents_clause})"
+
+        files = []
+        page_token = None
+        while True:
+            def api_call(token=page_token):
+                return files_resource.list(
+                    q=query,
+                    pageSize=1000,
+                    pageToken=token,
+                    fields=f'nextPageToken,files({fields})'
+                ).execute()
+
+            try:
+                results = self._safe_api_call(api_call)
+            except Exception as e:
+                # 單一批次失敗時跳過該批次，不中斷整體遍歷
+                self.logger.error(f"批次列出子項目失敗，跳過: {e}")
+                break
+
+            files.extend(results.get('files', []))
+
+            page_token = results.get('nextPageToken')
+            if not page_token:
+                break
+
+        return files
+
+    def _list_children_batch(self, folder_ids: List[str],
+                             fields: str = None) -> Dict[str, List[Dict[str, Any]]]:
+        """批次列出多個資料夾的直接子項目
+
+        將多個資料夾 ID 合併為單一 `'id' in parents or ...` 查詢，
+        每次請求最多涵蓋 BATCH_QUERY_SIZE 個資料夾，
+        多個批次則以工作執行緒平行發出，
+        大幅減少深層樹狀結構所需的 API 往返與等待時間。
+
+        Args:
+            folder_ids: 資料夾 ID 清單
+            fields: 欄位投影（一律補上 parents 以便將結果分組回所屬資料夾）
+
+        Returns:
+            {資料夾 ID: 子項目清單} 字典
+        """
+        fields = fields or self.FILE_FIELDS
+        if 'parents' not in fields:
+            fields += ',parents'
+
+        chunks = [
+            folder_ids[start:start + self.BATCH_QUERY_SIZE]
+            for start in range(0, len(folder_ids), self.BATCH_QUERY_SIZE)
+        ]
+
+        list_chunk = partial(self._list_children_chunk, fields=fields)
+
+        if len(chunks) <= 1:
+            chunk_results = [list_chunk(chunk) for chunk in chunks]
+        else:
+            workers = min(self.MAX_LIST_WORKERS, len(chunks))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                chunk_results = list(executor.map(list_chunk, chunks))
+
+        # 只有完整投影的結果才寫入中繼資料快取，避免缺欄位的項目污染快取
+        cache_results = fields == self.FILE_FIELDS
+
+        id_set = set(folder_ids)
+        children: Dict[str, List[Dict[str, Any]]] = {fid: [] for fid in folder_ids}
+
+        for files in chunk_results:
+            for file_info in files:
+                if cache_results:
+                    self._cache_file_info(file_info)
+                # 依照所屬父資料夾分組（同一檔案可能有多個父項）
+                for parent_id in file_info.get('parents', []):
+                    if parent_id in id_set:
+                        children[parent_id].append(file_info)
+                        break
+
+        return children
+
     @ensure_authenticated
     def get_file_info(self, file_id: str) -> Dict[str, Any]:
         """取得檔案資訊
@@ -230,19 +452,26 @@ class FileHandler(LoggerMixin):
         """
         if not validate_file_id(file_id):
             raise ValidationError('file_id', file_id, "無效的檔案 ID 格式")
-        
+
+        # 先查快取，避免重複的 API 往返
+        cached = self._meta_cache.get((file_id, self.FILE_FIELDS))
+        if cached is not None:
+            self.logger.debug(f"快取命中: {cached.get('name')}")
+            return dict(cached)
+
         try:
-            drive_service = self._get_drive_service()
-            
+            files_resource = self._get_files_resource()
+
             # 使用安全的 API 呼叫
             def api_call():
-                return drive_service.files().get(
+                return files_resource.get(
                     fileId=file_id,
-                    fields='id,name,mimeType,size,createdTime,modifiedTime,parents,webViewLink'
+                    fields=self.FILE_FIELDS
                 ).execute()
-            
+
             file_info = self._safe_api_call(api_call)
-            
+            self._cache_file_info(file_info)
+
             self.logger.debug(f"取得檔案資訊: {file_info.get('name')}")
             return file_info
             
@@ -260,20 +489,100 @@ class FileHandler(LoggerMixin):
             raise
     
     @ensure_authenticated
-    def get_folder_contents(self, folder_id: str, recursive: bool = False, max_depth: int = 10, current_depth: int = 0) -> List[Dict[str, Any]]:
+    def get_file_info_many(self, file_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """批次取得多個檔案的資訊
+
+        透過 Drive batch 端點將多個 `files().get` 合併為單一 HTTP 請求
+        （每批最多 BATCH_REQUEST_SIZE 個子請求），
+        取代逐一呼叫 get_file_info 的 N 次往返。
+
+        Args:
+            file_ids: 檔案 ID 清單
+
+        Returns:
+            {檔案 ID: 檔案資訊} 字典
+
+        Raises:
+            FileNotFoundError/FilePermissionError/NetworkError: 任一子請求失敗時，
+            錯誤對應方式與 get_file_info 相同
+        """
+        for file_id in file_ids:
+            if not validate_file_id(file_id):
+                raise ValidationError('file_id', file_id, "無效的檔案 ID 格式")
+
+        infos: Dict[str, Dict[str, Any]] = {}
+        errors: Dict[str, Exception] = {}
+
+        # 先從快取取得已知的檔案資訊，只對未命中的 ID 發出請求
+        missing = []
+        for file_id in file_ids:
+            cached = self._meta_cache.get((file_id, self.FILE_FIELDS))
+            if cached is not None:
+                infos[file_id] = dict(cached)
+            else:
+                missing.append(file_id)
+
+        drive_service = self._get_drive_service() if missing else None
+
+        def callback(request_id, response, exception):
+            if exception is not None:
+                errors[request_id] = exception
+            else:
+                self._cache_file_info(response)
+                infos[request_id] = response
+
+        for start in range(0, len(missing), self.BATCH_REQUEST_SIZE):
+            chunk = missing[start:start + self.BATCH_REQUEST_SIZE]
+            batch = drive_service.new_batch_http_request(callback=callback)
+
+            for file_id in chunk:
+                batch.add(
+                    self._get_files_resource().get(
+                        fileId=file_id,
+                        fields=self.FILE_FIELDS
+                    ),
+                    request_id=file_id
+                )
+
+            self._safe_api_call(batch.execute)
+
+        # 子請求錯誤對應方式與 get_file_info 一致
+        for file_id, error in errors.items():
+            if isinstance(error, HttpError):
+                error_code = error.resp.status
+                if error_code == 404:
+                    raise FileNotFoundError(file_id, "檔案不存在")
+                elif error_code == 403:
+                    raise FilePermissionError(file_id, "沒有檔案存取權限")
+                else:
+                    raise NetworkError(f"HTTP 錯誤: {error}", status_code=error_code, file_id=file_id)
+            raise error
+
+        self.logger.debug(f"批次取得 {len(infos)} 個檔案資訊")
+        return infos
+
+    @ensure_authenticated
+    def get_folder_contents(self, folder_id: str, recursive: bool = False, max_depth: int = 10,
+                            current_depth: int = 0, fields_profile: str = 'standard') -> List[Dict[str, Any]]:
         """取得資料夾內容
-        
+
         Args:
             folder_id: 資料夾 ID
             recursive: 是否遞迴取得子資料夾內容
             max_depth: 最大遞迴深度（防止無限遞迴）
             current_depth: 當前遞迴深度
-            
+            fields_profile: 欄位設定（FIELDS_PROFILES 之一），
+                呼叫端應選擇夠用的最輕設定以縮小回應
+
         Returns:
             檔案清單
         """
         if not validate_file_id(folder_id):
             raise ValidationError('folder_id', folder_id, "無效的資料夾 ID 格式")
+
+        if fields_profile not in self.FIELDS_PROFILES:
+            raise ValidationError('fields_profile', fields_profile, "未知的欄位設定")
+        fields = self.FIELDS_PROFILES[fields_profile]
         
         # 檢查遞迴深度
         if current_depth > max_depth:
@@ -282,13 +591,26 @@ class FileHandler(LoggerMixin):
         
         try:
             files = []
-            drive_service = self._get_drive_service()
-            
+            files_resource = self._get_files_resource()
+
             # 檢查是否為資料夾
             folder_info = self.get_file_info(folder_id)
             if folder_info.get('mimeType') != 'application/vnd.google-apps.folder':
                 raise ValidationError('folder_id', folder_id, "指定的 ID 不是資料夾")
-            
+
+            # 以 modifiedTime 驗證持久化快取：資料夾未變動時直接返回快取結果
+            modified_time = folder_info.get('modifiedTime')
+            cache_variant = (
+                f'recursive:{max_depth}:{fields_profile}' if recursive else fields_profile
+            )
+            listing_cache = self._get_listing_cache()
+
+            if listing_cache is not None:
+                cached_files = listing_cache.get(folder_id, modified_time, cache_variant)
+                if cached_files is not None:
+                    self.logger.info(f"列表快取命中: {folder_info.get('name')} ({len(cached_files)} 個項目)")
+                    return cached_files
+
             self.logger.info(f"處理資料夾: {folder_info.get('name')} (深度: {current_depth})")
             
             # 取得資料夾內容
@@ -306,11 +628,11 @@ class FileHandler(LoggerMixin):
                 
                 # 使用安全的 API 呼叫
                 def api_call():
-                    return drive_service.files().list(
+                    return files_resource.list(
                         q=query,
-                        pageSize=50,  # 進一步降低每次請求的數量
+                        pageSize=1000,  # Drive API 的單頁上限，減少往返次數
                         pageToken=page_token,
-                        fields='nextPageToken,files(id,name,mimeType,size,createdTime,modifiedTime,parents,webViewLink)'
+                        fields=f'nextPageToken,files({fields})'
                     ).execute()
                 
                 try:
@@ -321,57 +643,75 @@ class FileHandler(LoggerMixin):
                     break
                 
                 items = results.get('files', [])
+                if fields == self.FILE_FIELDS:
+                    for file_info in items:
+                        self._cache_file_info(file_info)
                 files.extend(items)
                 
                 page_token = results.get('nextPageToken')
                 if not page_token:
                     break
-                
-                # 短暫延遲，避免過快的請求
-                time.sleep(0.2)
-                
+
                 # 每 10 頁給出進度日誌
                 if page_count % 10 == 0:
                     self.logger.info(f"已載入 {page_count} 頁，共 {len(files)} 個項目")
             
             self.logger.info(f"取得資料夾內容: {len(files)} 個項目 (共 {page_count} 頁)")
-            
-            # 遞迴處理子資料夾
+
+            # 以批次 BFS 處理子資料夾：每次請求合併多個資料夾的查詢，
+            # 取代逐一遞迴呼叫，大幅減少 API 往返次數
             if recursive and current_depth < max_depth:
-                all_files = []
-                folder_count = 0
-                
+                all_files = list(files)
+
+                # seen 集合去除重複資料夾：捷徑或多重父項可能讓
+                # 同一資料夾出現多次，甚至形成循環
+                seen = {folder_id}
+                frontier = []
                 for file_info in files:
-                    all_files.append(file_info)
-                    
                     if file_info.get('mimeType') == 'application/vnd.google-apps.folder':
-                        folder_count += 1
-                        
-                        # 限制每層最多處理的資料夾數量
-                        if folder_count > 50:
-                            self.logger.warning(f"達到單層資料夾數量限制 50，停止處理更多子資料夾")
-                            break
-                        
-                        try:
-                            # 短暫延遲，避免過快的遞迴請求
-                            time.sleep(0.3)
-                            self.logger.debug(f"遞迴處理子資料夾: {file_info['name']} (深度: {current_depth + 1})")
-                            
-                            sub_files = self.get_folder_contents(
-                                file_info['id'], 
-                                recursive=True, 
-                                max_depth=max_depth,
-                                current_depth=current_depth + 1
-                            )
-                            all_files.extend(sub_files)
-                            
-                        except Exception as e:
-                            self.logger.warning(f"無法存取子資料夾 {file_info['name']}: {e} (檔案ID: {file_info['id']})")
-                            # 繼續處理下一個資料夾，而不是停止整個過程
-                            continue
-                
+                        if file_info['id'] not in seen:
+                            seen.add(file_info['id'])
+                            frontier.append(file_info['id'])
+
+                depth = current_depth + 1
+                total_items = len(all_files)
+
+                while frontier and depth <= max_depth:
+                    self.logger.debug(f"批次處理 {len(frontier)} 個子資料夾 (深度: {depth})")
+                    children = self._list_children_batch(frontier, fields)
+
+                    next_frontier = []
+                    for folder in frontier:
+                        for file_info in children.get(folder, []):
+                            all_files.append(file_info)
+                            total_items += 1
+                            if file_info.get('mimeType') == 'application/vnd.google-apps.folder':
+                                child_id = file_info['id']
+                                if child_id not in seen:
+                                    seen.add(child_id)
+                                    next_frontier.append(child_id)
+
+                    # 全域軟上限：取代原本每層資料夾數與頁數的零散限制
+                    if total_items >= self.MAX_TRAVERSAL_ITEMS:
+                        self.logger.warning(
+                            f"達到遍歷項目上限 {self.MAX_TRAVERSAL_ITEMS}，停止載入更多內容"
+                        )
+                        next_frontier = []
+
+                    frontier = next_frontier
+                    depth += 1
+
+                if frontier:
+                    self.logger.warning(f"達到最大遞迴深度 {max_depth}，停止遞迴")
+
+                if listing_cache is not None:
+                    listing_cache.set(folder_id, modified_time, all_files, cache_variant)
+
                 return all_files
-            
+
+            if listing_cache is not None:
+                listing_cache.set(folder_id, modified_time, files, cache_variant)
+
             return files
             
         except HttpError as e:
@@ -393,60 +733,53 @@ class FileHandler(LoggerMixin):
             self.logger.error(f"取得資料夾內容失敗: {e} (資料夾ID: {folder_id})")
             raise
     
-    @ensure_authenticated
-    def download_file_content(self, file_id: str, preferred_format: str = None) -> bytes:
-        """下載檔案內容
-        
+    def _download_to_fileobj(self, file_id: str, fp, preferred_format: str = None) -> int:
+        """將檔案內容串流寫入檔案物件
+
         Args:
             file_id: 檔案 ID
+            fp: 可寫入的二進位檔案物件
             preferred_format: 偏好的匯出格式（針對 Google Workspace 檔案）
-            
+
         Returns:
-            檔案內容（位元組）
+            寫入的位元組數
         """
-        if not validate_file_id(file_id):
-            raise ValidationError('file_id', file_id, "無效的檔案 ID 格式")
-        
         try:
-            drive_service = self._get_drive_service()
+            files_resource = self._get_files_resource()
             file_info = self.get_file_info(file_id)
-            
+
             mime_type = file_info.get('mimeType')
-            
+
             # 處理 Google Workspace 檔案
             if is_google_workspace_file(mime_type):
                 export_format = self.converter.get_export_format(mime_type, preferred_format)
-                
+
                 if not export_format:
                     raise ValidationError('mime_type', mime_type, "不支援的 Google Workspace 檔案類型")
-                
+
                 self.logger.debug(f"匯出 Google Workspace 檔案: {mime_type} -> {export_format}")
-                
-                request = drive_service.files().export_media(
+
+                request = files_resource.export_media(
                     fileId=file_id,
                     mimeType=export_format
                 )
             else:
                 # 一般檔案直接下載
                 self.logger.debug(f"下載一般檔案: {mime_type}")
-                
-                request = drive_service.files().get_media(fileId=file_id)
-            
-            # 執行下載
-            file_buffer = io.BytesIO()
-            downloader = MediaIoBaseDownload(file_buffer, request)
-            
+
+                request = files_resource.get_media(fileId=file_id)
+
+            # 分塊串流下載，避免整個檔案堆積在記憶體
+            downloader = MediaIoBaseDownload(fp, request, chunksize=self.DOWNLOAD_CHUNK_SIZE)
+
             done = False
             while not done:
                 status, done = downloader.next_chunk()
                 if status:
                     self.logger.debug(f"下載進度: {int(status.progress() * 100)}%")
-            
-            content = file_buffer.getvalue()
-            self.logger.info(f"檔案下載完成: {len(content)} 位元組")
-            
-            return content
-            
+
+            return fp.tell()
+
         except HttpError as e:
             error_code = e.resp.status
             if error_code == 404:
@@ -455,10 +788,63 @@ class FileHandler(LoggerMixin):
                 raise FilePermissionError(file_id, "沒有檔案下載權限")
             else:
                 raise NetworkError(f"HTTP 錯誤: {e}", status_code=error_code, file_id=file_id)
-        
+
         except Exception as e:
             self.logger.error(f"下載檔案失敗: {e}")
             raise
+
+    @ensure_authenticated
+    def download_file_to_path(self, file_id: str, dest_path: Path, preferred_format: str = None) -> int:
+        """下載檔案並直接串流寫入本地路徑
+
+        不經過記憶體緩衝，峰值記憶體維持在分塊大小，
+        適合大型檔案與已知目的路徑的呼叫端。
+
+        Args:
+            file_id: 檔案 ID
+            dest_path: 目的檔案路徑
+            preferred_format: 偏好的匯出格式（針對 Google Workspace 檔案）
+
+        Returns:
+            寫入的位元組數
+        """
+        if not validate_file_id(file_id):
+            raise ValidationError('file_id', file_id, "無效的檔案 ID 格式")
+
+        dest_path = Path(dest_path)
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with dest_path.open('wb', buffering=1024 * 1024) as fp:
+            total_bytes = self._download_to_fileobj(file_id, fp, preferred_format)
+
+        self.logger.info(f"檔案已下載: {dest_path} ({total_bytes} 位元組)")
+        return total_bytes
+
+    @ensure_authenticated
+    def download_file_content(self, file_id: str, preferred_format: str = None) -> bytes:
+        """下載檔案內容
+
+        小檔案保留在記憶體中，超過 SPOOL_MAX_SIZE 則自動溢出到暫存檔，
+        避免大型檔案造成 O(檔案大小) 的記憶體峰值。
+        已知目的路徑時請改用 download_file_to_path。
+
+        Args:
+            file_id: 檔案 ID
+            preferred_format: 偏好的匯出格式（針對 Google Workspace 檔案）
+
+        Returns:
+            檔案內容（位元組）
+        """
+        if not validate_file_id(file_id):
+            raise ValidationError('file_id', file_id, "無效的檔案 ID 格式")
+
+        with tempfile.SpooledTemporaryFile(max_size=self.SPOOL_MAX_SIZE) as fp:
+            self._download_to_fileobj(file_id, fp, preferred_format)
+            fp.seek(0)
+            content = fp.read()
+
+        self.logger.info(f"檔案下載完成: {len(content)} 位元組")
+        return content
     
     def save_file(self, file_content: bytes, file_path: Path, file_info: Dict[str, Any] = None):
         """儲存檔案到本地
@@ -481,7 +867,52 @@ class FileHandler(LoggerMixin):
         except Exception as e:
             self.logger.error(f"儲存檔案失敗: {e}")
             raise
-    
+
+    def save_file_stream(self, src_fileobj, file_path: Path,
+                         expected_size: int = None) -> int:
+        """以串流方式儲存檔案到本地
+
+        直接從來源檔案物件分塊複製到目的地，不需整份內容留在記憶體。
+        已知大小時先以 posix_fallocate 預先配置空間減少碎片化，
+        並以 POSIX_FADV_SEQUENTIAL 提示核心循序寫入、及早釋放頁快取。
+
+        Args:
+            src_fileobj: 來源檔案物件（需可讀取）
+            file_path: 儲存路徑
+            expected_size: 預期大小（位元組，可選）
+
+        Returns:
+            寫入的位元組數
+        """
+        try:
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+
+            fd = os.open(str(file_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                if expected_size and hasattr(os, 'posix_fallocate'):
+                    os.posix_fallocate(fd, 0, expected_size)
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                # 檔案系統不支援時照常寫入
+                pass
+
+            with os.fdopen(fd, 'wb', buffering=4 * 1024 * 1024) as f:
+                shutil.copyfileobj(src_fileobj, f, length=4 * 1024 * 1024)
+                bytes_written = f.tell()
+
+            self.logger.info(f"檔案已儲存: {file_path} ({bytes_written} 位元組)")
+            return bytes_written
+
+        except Exception as e:
+            self.logger.error(f"儲存檔案失敗: {e}")
+            raise
+
+    def _resolve_workspace_extension(self, mime_type: str, preferred_format: Optional[str]) -> str:
+        """解析 Google Workspace 檔案的匯出副檔名（經由實例層級 lru_cache 呼叫）"""
+        export_format = self.converter.get_export_format(mime_type, preferred_format)
+        return self.converter.get_export_extension(mime_type, export_format)
+
     def generate_safe_filename(self, file_info: Dict[str, Any], preferred_format: str = None) -> str:
         """生成安全的檔案名稱
         
@@ -494,15 +925,14 @@ class FileHandler(LoggerMixin):
         """
         name = file_info.get('name', 'unnamed_file')
         mime_type = file_info.get('mimeType', '')
-        
-        # 清理檔案名稱
-        safe_name = slugify(name, allow_unicode=True)
-        
-        # 處理副檔名
-        if is_google_workspace_file(mime_type):
+
+        # 清理檔案名稱（str.translate，避免每個檔案跑正規表達式）
+        safe_name = fast_slugify(name)
+
+        # 處理副檔名（Workspace 判斷直接用前綴比對，省去函數呼叫）
+        if mime_type.startswith('application/vnd.google-apps.'):
             # Google Workspace 檔案需要添加匯出格式副檔名
-            export_format = self.converter.get_export_format(mime_type, preferred_format)
-            extension = self.converter.get_export_extension(mime_type, export_format)
+            extension = self._workspace_extension(mime_type, preferred_format)
         else:
             # 一般檔案保持原副檔名或從 MIME 類型推斷
             if '.' in safe_name:
@@ -514,55 +944,104 @@ class FileHandler(LoggerMixin):
     
     def get_file_tree(self, folder_id: str, max_depth: int = 5) -> Dict[str, Any]:
         """取得資料夾樹狀結構
-        
+
+        僅對根資料夾呼叫一次 get_file_info；子資料夾的節點資料
+        全部取自上一層的列表結果，整棵樹只需 O(深度) 次 API 往返。
+
         Args:
             folder_id: 根資料夾 ID
             max_depth: 最大深度
-            
+
         Returns:
             樹狀結構字典
         """
         if not validate_file_id(folder_id):
             raise ValidationError('folder_id', folder_id, "無效的資料夾 ID 格式")
-        
-        def build_tree(current_folder_id: str, current_depth: int) -> Dict[str, Any]:
-            if current_depth > max_depth:
-                return {'error': 'Max depth reached'}
-            
-            try:
-                folder_info = self.get_file_info(current_folder_id)
-                files = self.get_folder_contents(current_folder_id, recursive=False)
-                
-                tree = {
-                    'id': current_folder_id,
-                    'name': folder_info.get('name'),
-                    'type': 'folder',
-                    'children': []
-                }
-                
-                for file_info in files:
+
+        try:
+            folder_info = self.get_file_info(folder_id)
+        except Exception as e:
+            self.logger.warning(f"建立樹狀結構失敗: {e}")
+            return {'error': str(e)}
+
+        tree = {
+            'id': folder_id,
+            'name': folder_info.get('name'),
+            'type': 'folder',
+            'children': []
+        }
+
+        # 逐層 BFS：每層以單一批次查詢列出所有資料夾的子項目，
+        # 子資料夾名稱直接取自列表結果，不再逐一呼叫 get_file_info
+        folder_nodes = {folder_id: tree}
+        frontier = [folder_id]
+        depth = 0
+
+        while frontier and depth <= max_depth:
+            children = self._list_children_batch(frontier, self.FIELDS_PROFILES['standard'])
+            next_frontier = []
+
+            for current_folder_id in frontier:
+                parent_node = folder_nodes[current_folder_id]
+
+                for file_info in children.get(current_folder_id, []):
                     if file_info.get('mimeType') == 'application/vnd.google-apps.folder':
-                        # 遞迴處理子資料夾
-                        subtree = build_tree(file_info['id'], current_depth + 1)
-                        tree['children'].append(subtree)
+                        if depth + 1 > max_depth:
+                            parent_node['children'].append({'error': 'Max depth reached'})
+                            continue
+
+                        subtree = {
+                            'id': file_info['id'],
+                            'name': file_info.get('name'),
+                            'type': 'folder',
+                            'children': []
+                        }
+                        parent_node['children'].append(subtree)
+
+                        # 已見過的資料夾（捷徑/多重父項）不再重複展開
+                        if file_info['id'] not in folder_nodes:
+                            folder_nodes[file_info['id']] = subtree
+                            next_frontier.append(file_info['id'])
                     else:
                         # 添加檔案
-                        tree['children'].append({
+                        parent_node['children'].append({
                             'id': file_info['id'],
                             'name': file_info.get('name'),
                             'type': 'file',
                             'mimeType': file_info.get('mimeType'),
                             'size': file_info.get('size')
                         })
-                
-                return tree
-                
-            except Exception as e:
-                self.logger.warning(f"建立樹狀結構失敗: {e}")
-                return {'error': str(e)}
-        
-        return build_tree(folder_id, 0)
+
+            frontier = next_frontier
+            depth += 1
+
+        return tree
     
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _build_search_query(query: str, folder_id: Optional[str], file_type: Optional[str]) -> str:
+        """組合 Drive 搜尋查詢字串
+
+        使用者輸入會先跳脫反斜線與單引號，避免破壞查詢語法；
+        重複的搜尋（如 UI 自動完成）直接命中 lru_cache。
+        """
+        escaped = query.replace('\\', '\\\\').replace("'", "\\'")
+        parts = [f"name contains '{escaped}'", "trashed=false"]
+
+        if folder_id:
+            parts.append(f"'{folder_id}' in parents")
+
+        if file_type:
+            if file_type == 'folder':
+                parts.append("mimeType='application/vnd.google-apps.folder'")
+            elif file_type == 'document':
+                parts.append("mimeType contains 'document'")
+            elif file_type == 'image':
+                parts.append("mimeType contains 'image'")
+            # 可以添加更多檔案類型
+
+        return ' and '.join(parts)
+
     def search_files(self, query: str, folder_id: str = None, file_type: str = None) -> List[Dict[str, Any]]:
         """搜尋檔案
         
@@ -575,30 +1054,21 @@ class FileHandler(LoggerMixin):
             搜尋結果清單
         """
         try:
-            drive_service = self._get_drive_service()
-            
-            # 建立搜尋查詢
-            search_query = f"name contains '{query}' and trashed=false"
-            
-            if folder_id:
-                search_query += f" and '{folder_id}' in parents"
-            
-            if file_type:
-                if file_type == 'folder':
-                    search_query += " and mimeType='application/vnd.google-apps.folder'"
-                elif file_type == 'document':
-                    search_query += " and mimeType contains 'document'"
-                elif file_type == 'image':
-                    search_query += " and mimeType contains 'image'"
-                # 可以添加更多檔案類型
-            
-            results = drive_service.files().list(
+            files_resource = self._get_files_resource()
+
+            search_query = self._build_search_query(query, folder_id, file_type)
+
+            results = files_resource.list(
                 q=search_query,
-                pageSize=100,
-                fields='files(id,name,mimeType,size,createdTime,modifiedTime,parents,webViewLink)'
+                pageSize=1000,
+                fields=f'files({self.FILE_FIELDS})',
+                supportsAllDrives=True,
+                includeItemsFromAllDrives=True
             ).execute()
-            
+
             files = results.get('files', [])
+            for file_info in files:
+                self._cache_file_info(file_info)
             self.logger.info(f"搜尋結果: {len(files)} 個檔案")
             
             return files
@@ -617,28 +1087,51 @@ class FileHandler(LoggerMixin):
             統計資訊
         """
         total_files = len(file_list)
-        total_size = 0
-        file_types = {}
-        google_workspace_files = 0
-        
-        for file_info in file_list:
-            # 計算大小
-            size = file_info.get('size')
-            if size and size.isdigit():
-                total_size += int(size)
-            
-            # 統計檔案類型
-            mime_type = file_info.get('mimeType', 'unknown')
-            file_types[mime_type] = file_types.get(mime_type, 0) + 1
-            
-            # 統計 Google Workspace 檔案
-            if is_google_workspace_file(mime_type):
-                google_workspace_files += 1
-        
+
+        if total_files > self.STATS_VECTORIZE_THRESHOLD:
+            # 大型清單走 pandas 向量化路徑；小清單維持純 Python，
+            # 避免為幾百個項目付 pandas 匯入與 DataFrame 建構成本
+            import pandas as pd
+
+            sizes = pd.Series(
+                (file_info.get('size') for file_info in file_list),
+                dtype='object'
+            )
+            total_size = int(
+                pd.to_numeric(sizes, errors='coerce').fillna(0).astype('int64').sum()
+            )
+            mime_types = pd.Series(
+                (file_info.get('mimeType', 'unknown') for file_info in file_list),
+                dtype='object'
+            ).fillna('unknown')
+            file_types = mime_types.value_counts().to_dict()
+        else:
+            def parse_size(file_info: Dict[str, Any]) -> int:
+                size = file_info.get('size')
+                if not size:
+                    return 0
+                try:
+                    return int(size)
+                except (TypeError, ValueError):
+                    return 0
+
+            total_size = sum(parse_size(file_info) for file_info in file_list)
+
+            # 單趟建立 MIME 類型直方圖
+            file_types = Counter(
+                file_info.get('mimeType', 'unknown') for file_info in file_list
+            )
+
+        # Workspace 檔案數直接從直方圖彙總（相異類型數量很小）
+        google_workspace_files = sum(
+            count for mime_type, count in file_types.items()
+            if mime_type.startswith('application/vnd.google-apps.')
+        )
+
         return {
             'total_files': total_files,
             'total_size': total_size,
-            'file_types': file_types,
+            'file_types': dict(file_types),
             'google_workspace_files': google_workspace_files,
             'regular_files': total_files - google_workspace_files
         }
@@ -656,18 +1149,18 @@ class FileHandler(LoggerMixin):
             raise ValidationError('folder_id', folder_id, "無效的資料夾 ID 格式")
         
         try:
-            drive_service = self._get_drive_service()
-            
+            files_resource = self._get_files_resource()
+
             # 檢查是否為資料夾
             folder_info = self.get_file_info(folder_id)
             if folder_info.get('mimeType') != 'application/vnd.google-apps.folder':
                 raise ValidationError('folder_id', folder_id, "指定的 ID 不是資料夾")
-            
+
             # 輕量級查詢：只取前 100 個項目，不分頁
             query = f"'{folder_id}' in parents and trashed=false"
-            
+
             def api_call():
-                return drive_service.files().list(
+                return files_resource.list(
                     q=query,
                     pageSize=100,  # 限制為 100 個項目
                     orderBy='folder,name',  # 資料夾優先，然後按名稱排序
@@ -686,5 +1179,31 @@ class FileHandler(LoggerMixin):
             return []
 
 
-# 全域檔案處理器實例
-file_handler = FileHandler() 
\ No newline at end of file
+class _LazyFileHandler:
+    """延遲初始化的檔案處理器代理
+
+    模組匯入時不建立 FileHandler，首次屬性存取才建構並快取，
+    讓只匯入本模組（如測試、CLI 說明頁）的程序不付初始化成本。
+    """
+
+    _instance: Optional[FileHandler] = None
+    _lock = threading.Lock()
+
+    def _get_instance(self) -> FileHandler:
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    type(self)._instance = FileHandler()
+        return self._instance
+
+    def __getattr__(self, name):
+        return getattr(self._get_instance(), name)
+
+    @property
+    def __class__(self):
+        # 讓 isinstance(file_handler, FileHandler) 成立且不觸發初始化
+        return FileHandler
+
+
+# 全域檔案處理器實例（首次使用時才真正建立）
+file_handler = _LazyFileHandler() 
\ No newline at end of file
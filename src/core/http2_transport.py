@@ -0,0 +1,161 @@
+"""
+HTTP/2 傳輸層
+以 httpx 連線池直接呼叫 Drive REST API 的熱路徑端點，
+多個請求共用同一條 TCP/TLS 連線，省去重複握手
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+import httpx
+
+from ..utils.logger import LoggerMixin
+from ..utils.helpers import fast_json_loads
+from ..utils.exceptions import (
+    AuthenticationError,
+    FileNotFoundError,
+    FilePermissionError,
+    NetworkError,
+    RetryableError
+)
+from .auth import auth_manager
+
+# Drive REST API 基底位址
+DRIVE_API_BASE = 'https://www.googleapis.com/drive/v3'
+
+
+def _http2_available() -> bool:
+    """檢查 HTTP/2 支援（需要 h2 套件）"""
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class Http2Transport(LoggerMixin):
+    """HTTP/2 連線池傳輸層
+
+    繞過 googleapiclient 的 httplib2 單連線傳輸，
+    以 httpx.Client 對 files.get / files.list 等熱路徑端點
+    直接發出 REST 請求。啟用 HTTP/2 時多個併發請求
+    會在同一條 TLS 連線上多工；無 h2 套件時退回
+    HTTP/1.1 keep-alive，仍保有連線重用的效益。
+    """
+
+    # 連線池設定
+    MAX_CONNECTIONS = 100
+    MAX_KEEPALIVE_CONNECTIONS = 50
+    TIMEOUT = 30.0
+
+    # 可重試的 HTTP 狀態碼
+    RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+    def __init__(self, access_token: str = None):
+        """
+        初始化傳輸層
+
+        Args:
+            access_token: 存取令牌（預設從認證管理器取得）
+        """
+        self._access_token = access_token
+        self._client: Optional[httpx.Client] = None
+        self._lock = threading.Lock()
+
+        self.logger.info("HTTP/2 傳輸層已初始化")
+
+    def _get_access_token(self) -> str:
+        """取得 Bearer 令牌"""
+        if self._access_token:
+            return self._access_token
+
+        if not auth_manager.is_authenticated():
+            if not auth_manager.authenticate():
+                raise AuthenticationError("認證失敗，無法執行操作")
+
+        credentials = auth_manager.get_credentials()
+        if not credentials or not credentials.token:
+            raise AuthenticationError("無法取得存取令牌，請先進行認證")
+
+        return credentials.token
+
+    def _get_client(self) -> httpx.Client:
+        """取得 HTTP 客戶端（共用連線池，執行緒安全）"""
+        with self._lock:
+            if self._client is None or self._client.is_closed:
+                self._client = httpx.Client(
+                    http2=_http2_available(),
+                    limits=httpx.Limits(
+                        max_connections=self.MAX_CONNECTIONS,
+                        max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS
+                    ),
+                    timeout=self.TIMEOUT
+                )
+            return self._client
+
+    def close(self):
+        """關閉 HTTP 客戶端"""
+        with self._lock:
+            if self._client and not self._client.is_closed:
+                self._client.close()
+                self.logger.debug("HTTP 客戶端已關閉")
+
+    def get_json(self, path: str, params: Dict[str, Any] = None,
+                 file_id: str = None) -> Dict[str, Any]:
+        """對 Drive API 發出 GET 請求並解析 JSON
+
+        Args:
+            path: API 路徑（相對於 DRIVE_API_BASE）
+            params: 查詢參數
+            file_id: 關聯的檔案 ID（用於錯誤訊息）
+
+        Returns:
+            回應 JSON
+        """
+        client = self._get_client()
+        headers = {'Authorization': f'Bearer {self._get_access_token()}'}
+
+        try:
+            response = client.get(
+                f'{DRIVE_API_BASE}{path}',
+                params=params,
+                headers=headers
+            )
+        except httpx.HTTPError as e:
+            raise NetworkError(f"HTTP 請求失敗: {e}", file_id=file_id)
+
+        if response.status_code in self.RETRYABLE_STATUS:
+            retry_after = response.headers.get('Retry-After')
+            raise RetryableError(
+                f"HTTP 錯誤: {response.status_code}",
+                retry_after=float(retry_after) if retry_after else None,
+                file_id=file_id
+            )
+        if response.status_code == 404:
+            raise FileNotFoundError(file_id or path, "檔案不存在")
+        if response.status_code == 403:
+            raise FilePermissionError(file_id or path, "沒有檔案存取權限")
+        if response.status_code >= 400:
+            raise NetworkError(
+                f"HTTP 錯誤: {response.status_code}",
+                status_code=response.status_code,
+                file_id=file_id
+            )
+
+        # 直接解析原始位元組，省去先解碼為 str 的一次複製
+        return fast_json_loads(response.content)
+
+    def create_async_client(self) -> httpx.AsyncClient:
+        """建立非同步 HTTP 客戶端（供 asyncio 呼叫端使用）"""
+        return httpx.AsyncClient(
+            http2=_http2_available(),
+            limits=httpx.Limits(
+                max_connections=self.MAX_CONNECTIONS,
+                max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS
+            ),
+            timeout=self.TIMEOUT
+        )
+
+
+# 全域傳輸層實例（熱路徑呼叫端共用連線池）
+http2_transport = Http2Transport()
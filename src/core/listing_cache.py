@@ -0,0 +1,143 @@
+"""
+資料夾列表持久化快取
+以 SQLite 儲存資料夾列舉結果，並以 modifiedTime 驗證是否過期
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..utils.logger import LoggerMixin
+
+
+class ListingCache(LoggerMixin):
+    """資料夾列表的 SQLite 持久化快取
+
+    以 folder_id 為鍵儲存完整的列舉結果，
+    讀取時比對資料夾的 modifiedTime：相符則直接返回快取，
+    不符則視為過期，由呼叫端重新列舉後寫回。
+    JSON 內容以 zlib 壓縮以減少磁碟佔用。
+    """
+
+    def __init__(self, db_path: str = "data/listing_cache.db"):
+        """
+        初始化列表快取
+
+        Args:
+            db_path: SQLite 資料庫檔案路徑
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._init_schema()
+
+        self.logger.debug(f"列表快取已初始化: {self.db_path}")
+
+    def _init_schema(self):
+        """建立資料表"""
+        with self._lock:
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS listings (
+                    cache_key TEXT PRIMARY KEY,
+                    modified_time TEXT,
+                    etag TEXT,
+                    json_blob BLOB,
+                    ts REAL
+                )
+            ''')
+            self._conn.commit()
+
+    def get(self, folder_id: str, modified_time: str,
+            variant: str = '') -> Optional[List[Dict[str, Any]]]:
+        """取得快取的列舉結果
+
+        Args:
+            folder_id: 資料夾 ID
+            modified_time: 資料夾目前的 modifiedTime（用於驗證）
+            variant: 列舉方式識別（如 'recursive:10'），區分不同參數的結果
+
+        Returns:
+            快取的檔案清單，無效或過期時返回 None
+        """
+        if not modified_time:
+            return None
+
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    'SELECT modified_time, json_blob FROM listings WHERE cache_key = ?',
+                    (self._make_key(folder_id, variant),)
+                ).fetchone()
+
+            if row is None or row[0] != modified_time:
+                return None
+
+            return json.loads(zlib.decompress(row[1]))
+
+        except Exception as e:
+            self.logger.warning(f"讀取列表快取失敗: {e}")
+            return None
+
+    def set(self, folder_id: str, modified_time: str,
+            files: List[Dict[str, Any]], variant: str = ''):
+        """寫入列舉結果
+
+        Args:
+            folder_id: 資料夾 ID
+            modified_time: 資料夾的 modifiedTime
+            files: 列舉結果
+            variant: 列舉方式識別
+        """
+        if not modified_time:
+            return
+
+        try:
+            blob = zlib.compress(json.dumps(files).encode('utf-8'), level=6)
+
+            with self._lock:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO listings '
+                    '(cache_key, modified_time, etag, json_blob, ts) '
+                    'VALUES (?, ?, ?, ?, ?)',
+                    (self._make_key(folder_id, variant), modified_time,
+                     None, blob, time.time())
+                )
+                self._conn.commit()
+
+        except Exception as e:
+            self.logger.warning(f"寫入列表快取失敗: {e}")
+
+    def invalidate(self, folder_id: str):
+        """移除指定資料夾的所有快取項目"""
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "DELETE FROM listings WHERE cache_key = ? OR cache_key LIKE ?",
+                    (folder_id, f'{folder_id}|%')
+                )
+                self._conn.commit()
+
+        except Exception as e:
+            self.logger.warning(f"清除列表快取失敗: {e}")
+
+    def clear(self):
+        """清除所有快取"""
+        with self._lock:
+            self._conn.execute('DELETE FROM listings')
+            self._conn.commit()
+
+    def close(self):
+        """關閉資料庫連線"""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _make_key(folder_id: str, variant: str) -> str:
+        """組合快取鍵：不同列舉參數的結果分開儲存"""
+        return f'{folder_id}|{variant}' if variant else folder_id
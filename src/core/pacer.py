@@ -0,0 +1,101 @@
+"""
+API 速率調節器
+提供跨執行緒共用的令牌桶：配額充裕時全速放行，
+伺服器回報限流時減速並於其後線性回復
+"""
+
+import threading
+import time
+
+from ..utils.logger import LoggerMixin
+
+
+class TokenBucket(LoggerMixin):
+    """執行緒安全的令牌桶速率調節器
+
+    每秒補充 rate 個令牌、最多累積 burst 個。
+    呼叫端在發出請求前 acquire() 一個令牌；
+    收到 429/403 限流回應時呼叫 throttle()，
+    速率即減半並維持一段時間，之後線性回復到基準速率。
+    """
+
+    # 限流後維持降速的秒數
+    THROTTLE_HOLD = 30.0
+
+    # 降速解除後回復到基準速率所需的秒數
+    RECOVERY_SECONDS = 30.0
+
+    # 速率下限（避免退避到趨近于零）
+    MIN_RATE = 0.5
+
+    def __init__(self, rate: float = 10.0, burst: int = 20):
+        """
+        初始化令牌桶
+
+        Args:
+            rate: 基準速率（每秒請求數）
+            burst: 令牌累積上限（允許的突發量）
+        """
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._throttled_until = 0.0
+        self._cond = threading.Condition()
+
+    def _advance(self, now: float):
+        """補充令牌並在限流期滿後線性回復速率（呼叫端需持有鎖）"""
+        elapsed = now - self._last_refill
+        self._last_refill = now
+
+        if self.rate < self.base_rate and now >= self._throttled_until:
+            self.rate = min(
+                self.base_rate,
+                self.rate + self.base_rate * elapsed / self.RECOVERY_SECONDS
+            )
+
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+
+    def acquire(self):
+        """取得一個令牌，必要時阻塞等待（不佔用 CPU）"""
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._advance(now)
+
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+
+                wait = (1.0 - self._tokens) / self.rate
+                self._cond.wait(timeout=wait)
+
+    def throttle(self, retry_after: float = None):
+        """回應伺服器限流：速率減半並維持 THROTTLE_HOLD 秒
+
+        Args:
+            retry_after: 伺服器指定的等待秒數（Retry-After 標頭），
+                超過 THROTTLE_HOLD 時以其為準
+        """
+        with self._cond:
+            self._advance(time.monotonic())
+
+            hold = max(self.THROTTLE_HOLD, retry_after or 0.0)
+            self.rate = max(self.MIN_RATE, self.rate / 2)
+            self._throttled_until = time.monotonic() + hold
+
+            self.logger.warning(
+                f"收到限流回應，速率降為 {self.rate:.2f} 請求/秒"
+            )
+
+    def get_rate(self) -> float:
+        """取得目前速率（每秒請求數）"""
+        with self._cond:
+            self._advance(time.monotonic())
+            return self.rate
+
+
+# 全域速率調節器實例（所有 Drive API 呼叫共用）
+pacer = TokenBucket()
@@ -3,8 +3,11 @@
 提供大型資料夾的增量載入功能，防止 UI 凍結
 """
 
+import threading
 import time
-from typing import List, Dict, Any, Optional, Generator, Callable
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Generator, Callable, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 
@@ -18,10 +21,29 @@ from ..utils.exceptions import (
     ValidationError
 )
 from ..utils.helpers import validate_file_id
-from .auth import get_authenticated_service, ensure_authenticated
+from .auth import create_authenticated_service, ensure_authenticated
+from .pacer import pacer
 from .retry_manager import RetryManager, RetryStrategy
 
 
+# googleapiclient 底層的 httplib2 傳輸不是執行緒安全的，不能讓
+# 多條執行緒共用同一服務（與 file_handler._get_worker_service 的
+# 理由相同）。未注入服務的載入器改為每條執行緒一個專屬服務，
+# 從共用憑證建立；同一執行緒內的所有載入器仍共用該服務，
+# 保留探索文件與 TCP/TLS 連線的重用。
+_thread_services = threading.local()
+
+
+def _get_thread_drive_service():
+    """取得目前執行緒專用的 Drive 服務（每執行緒延遲建立一次）"""
+    service = getattr(_thread_services, 'service', None)
+    if service is None:
+        service = create_authenticated_service()
+        PaginatedFolderLoader._enable_gzip(service)
+        _thread_services.service = service
+    return service
+
+
 class LoadingStatus(Enum):
     """載入狀態"""
     IDLE = "idle"           # 閒置
@@ -84,12 +106,24 @@ class PaginatedFolderLoader(LoggerMixin):
             # 處理 result.items
     """
 
+    # 最精簡欄位（純列表 UI；相較 DEFAULT_FIELDS 約省 30-50% 傳輸量）
+    MINIMAL_FIELDS = 'id,name,mimeType'
+
     # 預設欄位（用於列表顯示）
     DEFAULT_FIELDS = 'id,name,mimeType,size,modifiedTime,createdTime'
 
     # 完整欄位（用於詳細資訊）
     FULL_FIELDS = 'id,name,mimeType,size,modifiedTime,createdTime,parents,webViewLink,thumbnailLink'
 
+    # 共用重試管理器：組態對所有載入器相同，無每載入器狀態，
+    # 免去快取層大量建立載入器時的重複配置成本
+    _RETRY_MANAGER = RetryManager(
+        max_retries=3,
+        base_delay=1.0,
+        max_delay=30.0,
+        strategy=RetryStrategy.EXPONENTIAL
+    )
+
     def __init__(
         self,
         folder_id: str,
@@ -97,7 +131,9 @@ class PaginatedFolderLoader(LoggerMixin):
         fields: str = None,
         order_by: str = 'folder,name',
         include_trashed: bool = False,
-        drive_service = None
+        drive_service = None,
+        minimal_fields: bool = False,
+        mime_filter: Optional[str] = None
     ):
         """初始化分頁載入器
 
@@ -108,39 +144,75 @@ class PaginatedFolderLoader(LoggerMixin):
             order_by: 排序方式
             include_trashed: 是否包含已刪除的檔案
             drive_service: Drive 服務實例（可選）
+            minimal_fields: 只取 id/name/mimeType（僅顯示名稱的 UI 路徑）
+            mime_filter: 伺服器端型別過濾——'folders' 只取資料夾、
+                'files' 只取檔案，或直接給 "mimeType='...'" 查詢片段；
+                由 Drive 端過濾可省下傳輸與客戶端分類成本。
+                預過濾後 order_by='folder,name' 的資料夾優先排序已無作用。
         """
         if not validate_file_id(folder_id):
             raise ValidationError('folder_id', folder_id, "無效的資料夾 ID 格式")
 
         self.folder_id = folder_id
         self.page_size = min(max(page_size, 10), 100)  # 限制在 10-100 之間
-        self.fields = fields or self.DEFAULT_FIELDS
+        if fields:
+            self.fields = fields
+        elif minimal_fields:
+            self.fields = self.MINIMAL_FIELDS
+        else:
+            self.fields = self.DEFAULT_FIELDS
         self.order_by = order_by
         self.include_trashed = include_trashed
+        self.mime_filter = mime_filter
         self._drive_service = drive_service
 
         # 狀態管理
         self._state = LoaderState()
         self._page_token: Optional[str] = None
         self._all_items: List[Dict[str, Any]] = []
+        self._items_view: Tuple[Dict[str, Any], ...] = ()  # items 屬性的唯讀快照
         self._folder_info: Optional[Dict[str, Any]] = None
 
-        # 重試管理器
-        self._retry_manager = RetryManager(
-            max_retries=3,
-            base_delay=1.0,
-            max_delay=30.0,
-            strategy=RetryStrategy.EXPONENTIAL
-        )
+        # 累積統計：載入時順手維護，讓 get_statistics 為 O(1)
+        self._folder_count = 0
+        self._total_size = 0
+
+        # 預取機制：消費者處理第 N 頁時，第 N+1 頁已在背景傳輸
+        self._prefetch_future: Optional[Future] = None
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+
+        # 重試管理器（所有載入器共用同一實例，組態相同且不含每載入器狀態）
+        self._retry_manager = self._RETRY_MANAGER
 
         self.logger.debug(f"分頁載入器已初始化 - 資料夾: {folder_id}, 每頁: {page_size}")
 
     @property
     def drive_service(self):
-        """取得 Drive 服務實例"""
-        if self._drive_service is None:
-            self._drive_service = get_authenticated_service('drive')
-        return self._drive_service
+        """取得 Drive 服務實例
+
+        未注入服務時回傳目前執行緒專屬的服務，且不快取到實例上——
+        同一載入器可能同時被主執行緒與預取執行緒存取，
+        各自必須用自己的服務。
+        """
+        if self._drive_service is not None:
+            return self._drive_service
+        return _get_thread_drive_service()
+
+    @staticmethod
+    def _enable_gzip(service):
+        """在 User-Agent 加上 (gzip) 提示，確保回應以 gzip 壓縮傳輸
+
+        列表回應是高度可壓縮的 JSON，慢速連線上可省下大半傳輸時間。
+        """
+        try:
+            http = getattr(service, '_http', None)
+            if http is not None:
+                user_agent = getattr(http, 'user_agent', '') or ''
+                if '(gzip)' not in user_agent:
+                    http.user_agent = f'{user_agent} (gzip)'.strip()
+        except Exception:
+            # 傳輸層不支援時維持原行為
+            pass
 
     @property
     def state(self) -> LoaderState:
@@ -153,9 +225,13 @@ class PaginatedFolderLoader(LoggerMixin):
         return self._folder_info
 
     @property
-    def items(self) -> List[Dict[str, Any]]:
-        """取得所有已載入的項目"""
-        return self._all_items.copy()
+    def items(self) -> Tuple[Dict[str, Any], ...]:
+        """取得所有已載入的項目（唯讀視圖）
+
+        回傳載入新頁時才重建的 tuple，輪詢端重複讀取零拷貝；
+        過去每次存取都複製整份清單，UI 高頻輪詢時為 O(N) 白工。
+        """
+        return self._items_view
 
     def has_more(self) -> bool:
         """是否有更多頁面"""
@@ -207,84 +283,235 @@ class PaginatedFolderLoader(LoggerMixin):
                 raise FilePermissionError(self.folder_id, "沒有資料夾存取權限")
             raise NetworkError(f"HTTP 錯誤: {e}", status_code=e.resp.status)
 
-    def load_next_page(self) -> PageResult:
-        """載入下一頁
+    def _build_query(self) -> str:
+        """組合 files().list 的 q 查詢字串
 
-        Returns:
-            PageResult 物件，包含載入的項目和狀態
+        mime_filter 轉成伺服器端條件，讓 Drive 端先過濾，
+        省下傳不需要的項目與客戶端逐筆分類的成本。
         """
-        # 檢查是否還有更多頁面
-        if not self._state.has_more:
-            return PageResult(
-                items=[],
-                page_number=self._state.current_page,
-                has_more=False,
-                total_loaded=self._state.total_items
-            )
-
-        # 更新狀態為載入中
-        self._state.status = LoadingStatus.LOADING
-        start_time = time.time()
-
-        try:
-            # 首次載入時驗證資料夾
-            if self._state.current_page == 0:
-                self._validate_folder()
-
-            # 建立查詢
-            query = f"'{self.folder_id}' in parents"
-            if not self.include_trashed:
-                query += " and trashed=false"
+        query = f"'{self.folder_id}' in parents"
+        if not self.include_trashed:
+            query += " and trashed=false"
+        if self.mime_filter == 'folders':
+            query += " and mimeType='application/vnd.google-apps.folder'"
+        elif self.mime_filter == 'files':
+            query += " and mimeType != 'application/vnd.google-apps.folder'"
+        elif self.mime_filter:
+            # 原樣附加呼叫端提供的 mimeType 查詢片段
+            query += f" and {self.mime_filter}"
+        return query
+
+    def _fetch(self, page_token: Optional[str]) -> Dict[str, Any]:
+        """取得單一分頁的原始結果（不更動載入器狀態）
+
+        拆出純粹的抓取步驟，讓預取可以在背景執行緒安全呼叫。
+        """
+        query = self._build_query()
 
-            # API 呼叫
-            def api_call():
+        def api_call():
+            # 共用令牌桶調節請求節奏：配額充裕時立即放行，
+            # 取代過去每頁之間的固定 200ms 延遲
+            pacer.acquire()
+            try:
                 return self.drive_service.files().list(
                     q=query,
                     pageSize=self.page_size,
-                    pageToken=self._page_token,
+                    pageToken=page_token,
                     orderBy=self.order_by,
                     fields=f'nextPageToken,files({self.fields})'
                 ).execute()
+            except HttpError as e:
+                if e.resp.status == 429 or (
+                    e.resp.status == 403 and 'ratelimitexceeded' in str(e).lower()
+                ):
+                    retry_after = e.resp.get('retry-after')
+                    pacer.throttle(float(retry_after) if retry_after else None)
+                raise
+
+        # 使用重試機制執行 API 呼叫
+        retry_result = self._retry_manager.retry_sync(api_call)
+
+        if not retry_result.success:
+            raise retry_result.error
+
+        return retry_result.result
+
+    def _commit(self, results: Dict[str, Any], start_time: float) -> PageResult:
+        """把抓取結果寫入載入器狀態並產生 PageResult"""
+        items = results.get('files', [])
+        self._page_token = results.get('nextPageToken')
+
+        # 更新狀態
+        self._state.current_page += 1
+        self._state.total_items += len(items)
+        self._state.total_pages = self._state.current_page
+        self._state.has_more = self._page_token is not None
+        self._state.last_load_time = time.time() - start_time
+
+        # 如果沒有更多頁面，標記為完成
+        if not self._state.has_more:
+            self._state.status = LoadingStatus.COMPLETED
+        else:
+            self._state.status = LoadingStatus.IDLE
+
+        # 儲存項目並同步維護累積統計（單趟掃描，之後查詢免重算）
+        self._all_items.extend(items)
+        self._items_view = tuple(self._all_items)
+        for item in items:
+            if item.get('mimeType') == 'application/vnd.google-apps.folder':
+                self._folder_count += 1
+            size = item.get('size')
+            if size:
+                try:
+                    self._total_size += int(size)
+                except (ValueError, TypeError):
+                    pass
 
-            # 使用重試機制執行 API 呼叫
-            retry_result = self._retry_manager.retry_sync(api_call)
+        self.logger.info(
+            f"載入第 {self._state.current_page} 頁: {len(items)} 個項目, "
+            f"總計 {self._state.total_items} 個, "
+            f"耗時 {self._state.last_load_time:.2f}s"
+        )
+
+        return PageResult(
+            items=items,
+            page_number=self._state.current_page,
+            has_more=self._state.has_more,
+            total_loaded=self._state.total_items
+        )
 
-            if not retry_result.success:
-                raise retry_result.error
+    def _fetch_first_page(self) -> Dict[str, Any]:
+        """以單一批次往返同時驗證資料夾並取得第一頁
 
-            results = retry_result.result
-            items = results.get('files', [])
-            self._page_token = results.get('nextPageToken')
+        過去首頁要先 files().get 驗證再 files().list，付兩次往返；
+        透過 Drive batch 端點合併為一個 multipart 請求。
+        """
+        captured: Dict[str, Any] = {}
 
-            # 更新狀態
-            self._state.current_page += 1
-            self._state.total_items += len(items)
-            self._state.total_pages = self._state.current_page
-            self._state.has_more = self._page_token is not None
-            self._state.last_load_time = time.time() - start_time
+        def on_folder(request_id, response, exception):
+            if exception is not None:
+                captured['folder_error'] = exception
+            else:
+                captured['folder'] = response
 
-            # 如果沒有更多頁面，標記為完成
-            if not self._state.has_more:
-                self._state.status = LoadingStatus.COMPLETED
+        def on_page(request_id, response, exception):
+            if exception is not None:
+                captured['page_error'] = exception
             else:
-                self._state.status = LoadingStatus.IDLE
+                captured['page'] = response
+
+        query = self._build_query()
 
-            # 儲存項目
-            self._all_items.extend(items)
+        def api_call():
+            pacer.acquire()
+            captured.clear()
 
-            self.logger.info(
-                f"載入第 {self._state.current_page} 頁: {len(items)} 個項目, "
-                f"總計 {self._state.total_items} 個, "
-                f"耗時 {self._state.last_load_time:.2f}s"
+            batch = self.drive_service.new_batch_http_request()
+            batch.add(
+                self.drive_service.files().get(
+                    fileId=self.folder_id,
+                    fields='id,name,mimeType'
+                ),
+                callback=on_folder
             )
+            batch.add(
+                self.drive_service.files().list(
+                    q=query,
+                    pageSize=self.page_size,
+                    orderBy=self.order_by,
+                    fields=f'nextPageToken,files({self.fields})'
+                ),
+                callback=on_page
+            )
+            batch.execute()
+
+            # 子請求失敗只會交給 callback，不會從 batch.execute() 拋出；
+            # 可重試的錯誤（限流、伺服器錯誤）要在這裡重新拋出，
+            # retry_sync 才看得見並重試，節流處理與 _fetch 一致。
+            # 404/403（權限）留在 captured，由迴圈外對應成專屬例外。
+            error = captured.get('folder_error') or captured.get('page_error')
+            if isinstance(error, HttpError):
+                status = error.resp.status
+                if status == 429 or (
+                    status == 403 and 'ratelimitexceeded' in str(error).lower()
+                ):
+                    retry_after = error.resp.get('retry-after')
+                    pacer.throttle(float(retry_after) if retry_after else None)
+                    raise error
+                if status >= 500:
+                    raise error
+
+        retry_result = self._retry_manager.retry_sync(api_call)
+        if not retry_result.success:
+            raise retry_result.error
+
+        # 錯誤對應方式與 _validate_folder 相同
+        error = captured.get('folder_error') or captured.get('page_error')
+        if error is not None:
+            if isinstance(error, HttpError):
+                if error.resp.status == 404:
+                    raise FileNotFoundError(self.folder_id, "資料夾不存在")
+                elif error.resp.status == 403:
+                    raise FilePermissionError(self.folder_id, "沒有資料夾存取權限")
+                raise NetworkError(f"HTTP 錯誤: {error}", status_code=error.resp.status)
+            raise error
+
+        folder_info = captured['folder']
+        if folder_info.get('mimeType') != 'application/vnd.google-apps.folder':
+            raise ValidationError('folder_id', self.folder_id, "指定的 ID 不是資料夾")
+
+        self._folder_info = folder_info
+        return captured['page']
+
+    def _prefetch_next(self):
+        """在背景執行緒預取下一頁（隱藏網路往返延遲）
+
+        _fetch 在工作執行緒上才解析 drive_service，因此預取用的是
+        預取執行緒自己的服務實例（每載入器一條執行緒，服務建立一次
+        後重用），不會與主執行緒共用 HTTP 傳輸。
+        """
+        if not self._state.has_more or self._prefetch_future is not None:
+            return
+
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(max_workers=1)
 
+        self._prefetch_future = self._prefetch_executor.submit(
+            self._fetch, self._page_token
+        )
+
+    def load_next_page(self) -> PageResult:
+        """載入下一頁
+
+        Returns:
+            PageResult 物件，包含載入的項目和狀態
+        """
+        # 檢查是否還有更多頁面
+        if not self._state.has_more:
             return PageResult(
-                items=items,
+                items=[],
                 page_number=self._state.current_page,
-                has_more=self._state.has_more,
+                has_more=False,
                 total_loaded=self._state.total_items
             )
 
+        # 更新狀態為載入中
+        self._state.status = LoadingStatus.LOADING
+        start_time = time.time()
+
+        try:
+            if self._state.current_page == 0:
+                # 首頁：驗證與列表合併為單一批次往返
+                results = self._fetch_first_page()
+            elif self._prefetch_future is not None:
+                # 優先使用已預取的結果
+                future, self._prefetch_future = self._prefetch_future, None
+                results = future.result()
+            else:
+                results = self._fetch(self._page_token)
+
+            return self._commit(results, start_time)
+
         except Exception as e:
             self._state.status = LoadingStatus.ERROR
             self._state.error_message = str(e)
@@ -321,13 +548,13 @@ class PaginatedFolderLoader(LoggerMixin):
                 self.logger.error(f"載入失敗: {result.error}")
                 break
 
+            # 處理回調期間讓下一頁先行傳輸
+            if self.has_more() and self._state.current_page < max_pages:
+                self._prefetch_next()
+
             if progress_callback:
                 progress_callback(self._state.current_page, self._state.total_items)
 
-            # 短暫延遲，避免過快請求
-            if self.has_more():
-                time.sleep(0.2)
-
         return self._all_items
 
     def load_pages_generator(
@@ -346,35 +573,48 @@ class PaginatedFolderLoader(LoggerMixin):
 
         while self.has_more() and self._state.current_page < max_pages:
             result = self.load_next_page()
+
+            # 消費者處理本頁的同時，下一頁已在背景傳輸
+            if result and result.has_more and self._state.current_page < max_pages:
+                self._prefetch_next()
+
             yield result
 
-            if not result or not result.has_more:
+            # has_more 已由 while 條件把關，這裡只需在錯誤時停止
+            if not result:
                 break
 
-            # 短暫延遲
-            time.sleep(0.2)
+    def close(self):
+        """釋放預取資源
+
+        取消未完成的預取並關閉背景執行緒。載入器被丟棄（如快取
+        逐出、失效）時必須呼叫，否則每個載入器洩漏一條工作執行緒。
+        """
+        if self._prefetch_future is not None:
+            self._prefetch_future.cancel()
+            self._prefetch_future = None
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(wait=False)
+            self._prefetch_executor = None
 
     def reset(self):
         """重置載入器狀態"""
+        if self._prefetch_future is not None:
+            self._prefetch_future.cancel()
+            self._prefetch_future = None
         self._state = LoaderState()
         self._page_token = None
         self._all_items = []
+        self._items_view = ()
+        self._folder_count = 0
+        self._total_size = 0
         self.logger.debug("載入器已重置")
 
     def get_statistics(self) -> Dict[str, Any]:
-        """取得載入統計資訊"""
-        folders = sum(1 for item in self._all_items
-                     if item.get('mimeType') == 'application/vnd.google-apps.folder')
+        """取得載入統計資訊（讀取累積計數，不重新掃描項目清單）"""
+        folders = self._folder_count
         files = len(self._all_items) - folders
-
-        total_size = 0
-        for item in self._all_items:
-            size = item.get('size')
-            if size:
-                try:
-                    total_size += int(size)
-                except (ValueError, TypeError):
-                    pass
+        total_size = self._total_size
 
         return {
             'folder_id': self.folder_id,
@@ -402,7 +642,12 @@ class CachedFolderLoader(LoggerMixin):
             cache_ttl: 快取有效時間（秒），預設 5 分鐘
         """
         self.cache_ttl = cache_ttl
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        # 主鍵為 (folder_id, page_size) tuple，避免字串前綴比對的歧義
+        self._cache: Dict[tuple, Dict[str, Any]] = {}
+        # 次索引：folder_id -> 該資料夾所有快取鍵，查詢與失效皆 O(1)
+        self._by_folder: Dict[str, set] = defaultdict(set)
+        # 寫入端互斥；讀取端先在鎖內取快照再迭代，避免邊迭代邊變更
+        self._lock = threading.RLock()
         self.logger.debug(f"快取載入器已初始化，TTL: {cache_ttl}s")
 
     def get_loader(
@@ -421,42 +666,54 @@ class CachedFolderLoader(LoggerMixin):
         Returns:
             PaginatedFolderLoader 實例
         """
-        cache_key = f"{folder_id}:{page_size}"
+        cache_key = (folder_id, page_size)
         current_time = time.time()
 
-        # 檢查快取
-        if not force_refresh and cache_key in self._cache:
-            cached = self._cache[cache_key]
-            if current_time - cached['created_at'] < self.cache_ttl:
-                self.logger.debug(f"使用快取的載入器: {folder_id}")
-                return cached['loader']
-
-        # 建立新的載入器
-        loader = PaginatedFolderLoader(folder_id, page_size)
-        self._cache[cache_key] = {
-            'loader': loader,
-            'created_at': current_time
-        }
+        with self._lock:
+            # 檢查快取
+            if not force_refresh and cache_key in self._cache:
+                cached = self._cache[cache_key]
+                if current_time - cached['created_at'] < self.cache_ttl:
+                    self.logger.debug(f"使用快取的載入器: {folder_id}")
+                    return cached['loader']
+
+            # 建立新的載入器（被汰換的舊載入器先釋放其預取執行緒）
+            stale = self._cache.get(cache_key)
+            if stale is not None:
+                stale['loader'].close()
+            loader = PaginatedFolderLoader(folder_id, page_size)
+            self._cache[cache_key] = {
+                'loader': loader,
+                'created_at': current_time
+            }
+            self._by_folder[folder_id].add(cache_key)
 
         self.logger.debug(f"建立新的載入器: {folder_id}")
         return loader
 
-    def get_cached_items(self, folder_id: str) -> Optional[List[Dict[str, Any]]]:
+    def get_cached_items(self, folder_id: str) -> Optional[Tuple[Dict[str, Any], ...]]:
         """取得快取的項目（如果有）
 
         Args:
             folder_id: 資料夾 ID
 
         Returns:
-            快取的項目清單，如果沒有則返回 None
+            快取項目的唯讀 tuple（同 loader.items），如果沒有則返回 None
         """
-        for cache_key, cached in self._cache.items():
-            if cache_key.startswith(folder_id):
-                current_time = time.time()
-                if current_time - cached['created_at'] < self.cache_ttl:
-                    loader = cached['loader']
-                    if loader.items:
-                        return loader.items
+        current_time = time.time()
+
+        # 鎖內取快照，迭代在鎖外進行，縮短鎖持有時間
+        with self._lock:
+            entries = [
+                (key, self._cache.get(key))
+                for key in self._by_folder.get(folder_id, ())
+            ]
+
+        for cache_key, cached in entries:
+            if cached and current_time - cached['created_at'] < self.cache_ttl:
+                loader = cached['loader']
+                if loader.items:
+                    return loader.items
         return None
 
     def invalidate(self, folder_id: str = None):
@@ -465,24 +722,37 @@ class CachedFolderLoader(LoggerMixin):
         Args:
             folder_id: 要失效的資料夾 ID，如果為 None 則清除所有快取
         """
-        if folder_id is None:
-            self._cache.clear()
-            self.logger.debug("已清除所有快取")
-        else:
-            keys_to_remove = [k for k in self._cache.keys() if k.startswith(folder_id)]
-            for key in keys_to_remove:
-                del self._cache[key]
-            self.logger.debug(f"已清除資料夾快取: {folder_id}")
+        with self._lock:
+            if folder_id is None:
+                for cached in self._cache.values():
+                    cached['loader'].close()
+                self._cache.clear()
+                self._by_folder.clear()
+                self.logger.debug("已清除所有快取")
+            else:
+                for key in self._by_folder.pop(folder_id, ()):
+                    cached = self._cache.pop(key, None)
+                    if cached is not None:
+                        cached['loader'].close()
+                self.logger.debug(f"已清除資料夾快取: {folder_id}")
 
     def cleanup_expired(self):
         """清理過期的快取"""
         current_time = time.time()
-        expired_keys = [
-            k for k, v in self._cache.items()
-            if current_time - v['created_at'] >= self.cache_ttl
-        ]
-        for key in expired_keys:
-            del self._cache[key]
+
+        with self._lock:
+            expired_keys = [
+                k for k, v in self._cache.items()
+                if current_time - v['created_at'] >= self.cache_ttl
+            ]
+            for key in expired_keys:
+                self._cache[key]['loader'].close()
+                del self._cache[key]
+                folder_keys = self._by_folder.get(key[0])
+                if folder_keys is not None:
+                    folder_keys.discard(key)
+                    if not folder_keys:
+                        del self._by_folder[key[0]]
 
         if expired_keys:
             self.logger.debug(f"已清理 {len(expired_keys)} 個過期快取")
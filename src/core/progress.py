@@ -5,6 +5,10 @@
 
 import time
 import asyncio
+from array import array
+from bisect import bisect_left
+from collections import deque
+from itertools import islice
 from typing import Dict, Any, Optional, Callable, List
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -15,13 +19,19 @@ from pathlib import Path
 from ..utils.logger import LoggerMixin
 from ..utils.helpers import format_size, format_time, format_speed, calculate_percentage
 
+# 匯出加速：有 orjson 時以 C 實作編碼，否則退回標準庫 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 @dataclass
 class ProgressSnapshot:
     """進度快照資料類別"""
     
     task_id: str
-    timestamp: datetime
+    timestamp: float  # epoch 秒；需要 datetime 時用 timestamp_dt
     downloaded_files: int
     total_files: int
     downloaded_bytes: int
@@ -32,6 +42,11 @@ class ProgressSnapshot:
     current_file: Optional[str] = None
     error_count: int = 0
     
+    @property
+    def timestamp_dt(self) -> datetime:
+        """快照時間的 datetime 表示（僅在需要時轉換）"""
+        return datetime.fromtimestamp(self.timestamp)
+
     @property
     def progress_percentage(self) -> float:
         """計算進度百分比"""
@@ -66,11 +81,31 @@ class ProgressSnapshot:
         """格式化總大小"""
         return format_size(self.total_bytes)
     
+    def to_raw_dict(self) -> Dict[str, Any]:
+        """轉換為精簡字典（只含原始數值與狀態）
+
+        不計算 formatted_* 與百分比欄位——那些可以在讀取端重建，
+        大量快照序列化時省下逐筆字串格式化的成本。
+        """
+        return {
+            'task_id': self.task_id,
+            'timestamp': self.timestamp_dt.isoformat(),
+            'downloaded_files': self.downloaded_files,
+            'total_files': self.total_files,
+            'downloaded_bytes': self.downloaded_bytes,
+            'total_bytes': self.total_bytes,
+            'current_speed': self.current_speed,
+            'eta_seconds': self.eta_seconds,
+            'status': self.status,
+            'current_file': self.current_file,
+            'error_count': self.error_count
+        }
+
     def to_dict(self) -> Dict[str, Any]:
         """轉換為字典"""
         return {
             'task_id': self.task_id,
-            'timestamp': self.timestamp.isoformat(),
+            'timestamp': self.timestamp_dt.isoformat(),
             'downloaded_files': self.downloaded_files,
             'total_files': self.total_files,
             'downloaded_bytes': self.downloaded_bytes,
@@ -108,9 +143,12 @@ class ProgressTracker(LoggerMixin):
         self._status = 'pending'
         self._error_count = 0
         
-        # 速度計算
-        self._speed_samples: List[tuple] = []  # (timestamp, bytes)
+        # 速度計算：時間戳與位元組數分存兩條 double 陣列（SoA 佈局），
+        # 每筆更新零物件配置；時間戳用 monotonic，不受系統時鐘跳動影響。
+        # 兩條陣列包成單一 tuple，裁剪時整組原子替換，讀取端不需持鎖
+        self._samples = (array('d'), array('d'))  # (timestamps, bytes)
         self._speed_window = 10.0  # 速度計算視窗（秒）
+        self._sample_compact_threshold = 4096  # 超過此長度時裁掉視窗外的舊樣本
         
         # 回調函數
         self._callbacks: List[Callable] = []
@@ -118,10 +156,11 @@ class ProgressTracker(LoggerMixin):
         # 控制
         self._running = False
         self._lock = threading.Lock()
+        self._last_emit = 0.0  # 上次發出快照的時間（monotonic）
         
-        # 歷史記錄
-        self._snapshots: List[ProgressSnapshot] = []
+        # 歷史記錄：環形緩衝，寫滿後自動淘汰最舊的快照
         self._max_snapshots = 1000
+        self._snapshots: deque = deque(maxlen=self._max_snapshots)
         
         self.logger.debug(f"進度追蹤器已初始化: {task_id}")
     
@@ -139,32 +178,54 @@ class ProgressTracker(LoggerMixin):
             if current_file:
                 self._current_file = current_file
             
-            # 記錄速度樣本
-            now = time.time()
-            self._speed_samples.append((now, self._downloaded_bytes))
-            
-            # 清理舊樣本
-            cutoff_time = now - self._speed_window
-            self._speed_samples = [
-                sample for sample in self._speed_samples 
-                if sample[0] > cutoff_time
-            ]
-    
+            self._append_sample(self._downloaded_bytes)
+
+        self._maybe_emit()
+
     def update_bytes_progress(self, downloaded_bytes: int):
         """更新位元組進度"""
         with self._lock:
             self._downloaded_bytes = downloaded_bytes
-            
-            # 記錄速度樣本
-            now = time.time()
-            self._speed_samples.append((now, downloaded_bytes))
-            
-            # 清理舊樣本
-            cutoff_time = now - self._speed_window
-            self._speed_samples = [
-                sample for sample in self._speed_samples 
-                if sample[0] > cutoff_time
-            ]
+            self._append_sample(downloaded_bytes)
+
+        self._maybe_emit()
+
+    def _maybe_emit(self, force: bool = False):
+        """由真實更新驅動快照與回調，以 update_interval 限流
+
+        取代過去的背景輪詢執行緒：閒置的追蹤器不再每秒醒來做白工，
+        也省下每個並行任務一條 OS 執行緒。
+        """
+        if not self._running and not force:
+            return
+
+        now = time.monotonic()
+        if not force and now - self._last_emit < self.update_interval:
+            return
+        self._last_emit = now
+
+        snapshot = self.get_snapshot()
+        self._save_snapshot(snapshot)
+
+        for callback in self._callbacks:
+            try:
+                callback(snapshot)
+            except Exception as e:
+                self.logger.error(f"進度回調函數執行失敗: {e}")
+
+    def _append_sample(self, downloaded_bytes: float):
+        """記錄速度樣本（呼叫端需持有鎖）"""
+        sample_ts, sample_bytes = self._samples
+        sample_ts.append(time.monotonic())
+        sample_bytes.append(downloaded_bytes)
+
+        # 陣列過長時才一次裁掉視窗外的舊樣本，攤提後仍為 O(1)；
+        # 以新 tuple 原子替換，不影響持有舊參照的讀取端
+        if len(sample_ts) > self._sample_compact_threshold:
+            cutoff = sample_ts[-1] - self._speed_window
+            start = bisect_left(sample_ts, cutoff)
+            if start > 0:
+                self._samples = (sample_ts[start:], sample_bytes[start:])
     
     def increment_error(self):
         """增加錯誤計數"""
@@ -181,68 +242,87 @@ class ProgressTracker(LoggerMixin):
     
     def get_current_speed(self) -> float:
         """計算當前速度（bytes/sec）"""
-        with self._lock:
-            if len(self._speed_samples) < 2:
-                return 0.0
-            
-            # 使用最近的樣本計算速度
-            recent_samples = self._speed_samples[-10:]  # 最近10個樣本
-            
-            if len(recent_samples) < 2:
-                return 0.0
-            
-            time_diff = recent_samples[-1][0] - recent_samples[0][0]
-            bytes_diff = recent_samples[-1][1] - recent_samples[0][1]
-            
-            if time_diff <= 0:
-                return 0.0
-            
-            return bytes_diff / time_diff
+        return self._compute_speed()
+
+    def _compute_speed(self) -> float:
+        """速度計算的實作
+
+        速度只是估計值，讀取端不持鎖：先取 tuple 參照再讀取，
+        寫入端的裁剪以整組替換進行，不會讓讀取端看到不成對的陣列。
+        """
+        sample_ts, sample_bytes = self._samples
+        # 寫入端可能剛 append 了時間戳但還沒 append 位元組數
+        n = min(len(sample_ts), len(sample_bytes))
+        if n < 2:
+            return 0.0
+
+        # 時間戳單調遞增，二分搜尋視窗起點即可，免除線性掃描
+        cutoff = sample_ts[n - 1] - self._speed_window
+        start = bisect_left(sample_ts, cutoff, 0, n)
+        if start >= n - 1:
+            return 0.0
+
+        time_diff = sample_ts[n - 1] - sample_ts[start]
+        bytes_diff = sample_bytes[n - 1] - sample_bytes[start]
+
+        if time_diff <= 0:
+            return 0.0
+
+        return bytes_diff / time_diff
     
     def get_eta(self) -> Optional[float]:
         """計算預估剩餘時間（秒）"""
-        with self._lock:
-            if self._status not in ('downloading', 'processing'):
-                return None
-            
-            current_speed = self.get_current_speed()
-            
-            if current_speed <= 0:
-                return None
-            
-            # 優先使用位元組進度
-            if self._total_bytes > 0:
-                remaining_bytes = self._total_bytes - self._downloaded_bytes
-                return remaining_bytes / current_speed
-            
-            # 退回到檔案進度估算
-            if self._total_files > 0 and self._downloaded_files > 0:
-                progress_ratio = self._downloaded_files / self._total_files
-                if progress_ratio > 0:
-                    elapsed_time = time.time() - (
-                        self._speed_samples[0][0] if self._speed_samples else time.time()
-                    )
-                    total_estimated_time = elapsed_time / progress_ratio
-                    return total_estimated_time - elapsed_time
-            
+        return self._compute_eta(self._compute_speed())
+
+    def _compute_eta(self, current_speed: float) -> Optional[float]:
+        """以呼叫端算好的速度推估剩餘時間，避免重複掃描速度視窗
+
+        讀取端不持鎖：ETA 本來就是估計值，各欄位的單次讀取在
+        CPython 中是原子的，偶發的半新半舊組合無礙。
+        """
+        if self._status not in ('downloading', 'processing'):
             return None
-    
+
+        if current_speed <= 0:
+            return None
+
+        # 優先使用位元組進度
+        if self._total_bytes > 0:
+            remaining_bytes = self._total_bytes - self._downloaded_bytes
+            return remaining_bytes / current_speed
+
+        # 退回到檔案進度估算
+        if self._total_files > 0 and self._downloaded_files > 0:
+            progress_ratio = self._downloaded_files / self._total_files
+            if progress_ratio > 0:
+                sample_ts = self._samples[0]
+                now = time.monotonic()
+                elapsed_time = now - (sample_ts[0] if sample_ts else now)
+                total_estimated_time = elapsed_time / progress_ratio
+                return total_estimated_time - elapsed_time
+
+        return None
+
     def get_snapshot(self) -> ProgressSnapshot:
-        """取得當前進度快照"""
-        with self._lock:
-            return ProgressSnapshot(
-                task_id=self.task_id,
-                timestamp=datetime.now(),
-                downloaded_files=self._downloaded_files,
-                total_files=self._total_files,
-                downloaded_bytes=self._downloaded_bytes,
-                total_bytes=self._total_bytes,
-                current_speed=self.get_current_speed(),
-                eta_seconds=self.get_eta(),
-                status=self._status,
-                current_file=self._current_file,
-                error_count=self._error_count
-            )
+        """取得當前進度快照（不持鎖，不阻塞更新端）
+
+        速度視窗只掃描一次，ETA 直接沿用算好的速度。
+        """
+        current_speed = self._compute_speed()
+        return ProgressSnapshot(
+            task_id=self.task_id,
+            # datetime.now() 在高頻快照下成本可觀，存 epoch 浮點數即可
+            timestamp=time.time(),
+            downloaded_files=self._downloaded_files,
+            total_files=self._total_files,
+            downloaded_bytes=self._downloaded_bytes,
+            total_bytes=self._total_bytes,
+            current_speed=current_speed,
+            eta_seconds=self._compute_eta(current_speed),
+            status=self._status,
+            current_file=self._current_file,
+            error_count=self._error_count
+        )
     
     def add_callback(self, callback: Callable[[ProgressSnapshot], None]):
         """添加進度更新回調函數"""
@@ -256,59 +336,33 @@ class ProgressTracker(LoggerMixin):
             self.logger.debug(f"已移除進度回調函數: {callback.__name__}")
     
     def start_tracking(self):
-        """開始進度追蹤"""
+        """開始進度追蹤（事件驅動，不啟動背景執行緒）"""
         if self._running:
             return
-        
+
         self._running = True
         self.set_status('downloading')
-        
-        # 啟動追蹤執行緒
-        tracking_thread = threading.Thread(target=self._tracking_loop, daemon=True)
-        tracking_thread.start()
-        
+        self._maybe_emit(force=True)
+
         self.logger.info(f"進度追蹤已開始: {self.task_id}")
-    
+
     def stop_tracking(self):
-        """停止進度追蹤"""
-        self._running = False
+        """停止進度追蹤並發出最終快照"""
+        if self._running:
+            self._running = False
+            self._maybe_emit(force=True)
         self.logger.info(f"進度追蹤已停止: {self.task_id}")
     
-    def _tracking_loop(self):
-        """追蹤迴圈"""
-        while self._running:
-            try:
-                snapshot = self.get_snapshot()
-                
-                # 儲存快照
-                self._save_snapshot(snapshot)
-                
-                # 呼叫回調函數
-                for callback in self._callbacks:
-                    try:
-                        callback(snapshot)
-                    except Exception as e:
-                        self.logger.error(f"進度回調函數執行失敗: {e}")
-                
-                time.sleep(self.update_interval)
-                
-            except Exception as e:
-                self.logger.error(f"進度追蹤迴圈錯誤: {e}")
-                time.sleep(1.0)
-    
     def _save_snapshot(self, snapshot: ProgressSnapshot):
-        """儲存進度快照"""
+        """儲存進度快照（數量上限由 deque 的 maxlen 維持）"""
         self._snapshots.append(snapshot)
-        
-        # 保持快照數量在限制內
-        if len(self._snapshots) > self._max_snapshots:
-            self._snapshots = self._snapshots[-self._max_snapshots:]
-    
+
     def get_snapshots(self, limit: int = None) -> List[ProgressSnapshot]:
         """取得歷史快照"""
         if limit:
-            return self._snapshots[-limit:]
-        return self._snapshots.copy()
+            start = max(0, len(self._snapshots) - limit)
+            return list(islice(self._snapshots, start, len(self._snapshots)))
+        return list(self._snapshots)
     
     def export_progress_data(self, filepath: str):
         """匯出進度資料"""
@@ -316,12 +370,17 @@ class ProgressTracker(LoggerMixin):
             data = {
                 'task_id': self.task_id,
                 'export_time': datetime.now().isoformat(),
-                'snapshots': [snapshot.to_dict() for snapshot in self._snapshots]
+                'snapshots': [snapshot.to_raw_dict() for snapshot in self._snapshots]
             }
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            
+
+            if orjson is not None:
+                Path(filepath).write_bytes(
+                    orjson.dumps(data, option=orjson.OPT_INDENT_2)
+                )
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+
             self.logger.info(f"進度資料已匯出: {filepath}")
             
         except Exception as e:
@@ -403,21 +462,30 @@ class ProgressManager(LoggerMixin):
                 'overall_progress': 0
             }
         
-        total_tasks = len(snapshots)
-        active_tasks = len([s for s in snapshots.values() if s.status == 'downloading'])
-        completed_tasks = len([s for s in snapshots.values() if s.status == 'completed'])
-        failed_tasks = len([s for s in snapshots.values() if s.status == 'failed'])
-        
-        total_speed = sum(s.current_speed for s in snapshots.values())
-        total_downloaded = sum(s.downloaded_bytes for s in snapshots.values())
-        
+        # 單次走訪彙總所有統計，避免多趟迭代與暫存清單
+        active_tasks = completed_tasks = failed_tasks = 0
+        total_speed = 0.0
+        total_downloaded = 0
+        total_files = 0
+        downloaded_files = 0
+
+        for s in snapshots.values():
+            if s.status == 'downloading':
+                active_tasks += 1
+            elif s.status == 'completed':
+                completed_tasks += 1
+            elif s.status == 'failed':
+                failed_tasks += 1
+            total_speed += s.current_speed
+            total_downloaded += s.downloaded_bytes
+            total_files += s.total_files
+            downloaded_files += s.downloaded_files
+
         # 計算整體進度
-        total_files = sum(s.total_files for s in snapshots.values())
-        downloaded_files = sum(s.downloaded_files for s in snapshots.values())
         overall_progress = (downloaded_files / total_files * 100) if total_files > 0 else 0
-        
+
         return {
-            'total_tasks': total_tasks,
+            'total_tasks': len(snapshots),
             'active_tasks': active_tasks,
             'completed_tasks': completed_tasks,
             'failed_tasks': failed_tasks,
@@ -4,11 +4,15 @@
 """
 
 import asyncio
+import inspect
+import threading
 import time
 import random
+import itertools
 from typing import Callable, Any, Dict, List, Optional, Tuple, Union
+from collections import Counter
 from enum import Enum
-from functools import wraps
+from functools import lru_cache, partial, wraps
 from datetime import datetime, timedelta
 
 from googleapiclient.errors import HttpError
@@ -37,6 +41,38 @@ class ErrorCategory(Enum):
     UNKNOWN = "unknown"          # 未知錯誤
 
 
+class _Stats:
+    """重試統計計數器
+
+    單調計數器用 itertools.count：next() 是單一 C 呼叫，在 GIL 下
+    不可分割，多執行緒同時重試（ThreadPoolExecutor 是下載的常態）
+    也不會丟計數；Python 層的 += 則會在讀寫之間被搶佔。
+    錯誤計數只在失敗路徑發生，用鎖保護 Counter 即可。
+    """
+
+    __slots__ = ('total_calls', 'successful_calls', 'failed_calls',
+                 'total_retries', 'terminal_errors', 'error_counts', 'error_lock')
+
+    def __init__(self):
+        self.total_calls = itertools.count()
+        self.successful_calls = itertools.count()
+        self.failed_calls = itertools.count()
+        self.total_retries = itertools.count()
+        self.terminal_errors = itertools.count()
+        self.error_counts = Counter()
+        self.error_lock = threading.Lock()
+
+    def add_retries(self, n: int):
+        """累加重試次數（n 很小，逐次 next 仍是常數成本）"""
+        for _ in range(n):
+            next(self.total_retries)
+
+    @staticmethod
+    def peek(counter) -> int:
+        """讀取 count 目前的值（不推進）"""
+        return counter.__reduce__()[1][0]
+
+
 class RetryResult:
     """重試結果"""
     
@@ -59,13 +95,13 @@ class RetryManager(LoggerMixin):
     """
     
     # 可重試的錯誤類型
-    RETRYABLE_HTTP_CODES = {
+    RETRYABLE_HTTP_CODES = frozenset({
         429,  # Too Many Requests
         500,  # Internal Server Error
         502,  # Bad Gateway
         503,  # Service Unavailable
         504,  # Gateway Timeout
-    }
+    })
     
     RETRYABLE_EXCEPTIONS = (
         ConnectionError,
@@ -75,17 +111,27 @@ class RetryManager(LoggerMixin):
         requests.exceptions.Timeout,
         TransportError,
     )
-    
-    def __init__(self, 
+
+    # 同一組型別的雜湊集合：精確型別命中時為 O(1) 查找，
+    # 免去 isinstance 對整個 tuple 的線性 MRO 走訪（常見情況）
+    RETRYABLE_TYPES = frozenset(RETRYABLE_EXCEPTIONS)
+
+
+    # 支援的抖動模式
+    JITTER_MODES = frozenset({'full', 'equal', 'decorrelated', 'none'})
+
+    def __init__(self,
                  max_retries: int = 3,
                  base_delay: float = 1.0,
                  max_delay: float = 60.0,
                  strategy: RetryStrategy = RetryStrategy.EXPONENTIAL,
                  jitter: bool = True,
-                 backoff_factor: float = 2.0):
+                 backoff_factor: float = 2.0,
+                 jitter_mode: str = 'full',
+                 session_factory: Callable = None):
         """
         初始化重試管理器
-        
+
         Args:
             max_retries: 最大重試次數
             base_delay: 基礎延遲時間（秒）
@@ -93,25 +139,134 @@ class RetryManager(LoggerMixin):
             strategy: 重試策略
             jitter: 是否添加隨機抖動
             backoff_factor: 退避因子
+            jitter_mode: 抖動模式——'full' 在 [0, 延遲上限] 全區間取樣
+                （最能打散大量 429 後的同步重試）、'equal' 保留一半延遲
+                再抖動另一半、'decorrelated' 依前次延遲遞增取樣、
+                'none' 不抖動；jitter=False 時一律視為 'none'
+            session_factory: 建立共用 HTTP 會話的工廠（如
+                requests.Session 或 aiohttp.ClientSession）。提供時，
+                接受 session 關鍵字參數的被重試函數會自動拿到同一個
+                會話，免去每次嘗試重建連線與 TCP/TLS 握手
         """
+        if jitter_mode not in self.JITTER_MODES:
+            raise ConfigurationError(
+                'jitter_mode',
+                f"不支援的抖動模式: {jitter_mode}（可用: {sorted(self.JITTER_MODES)}）"
+            )
         self.max_retries = max_retries
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.strategy = strategy
         self.jitter = jitter
         self.backoff_factor = backoff_factor
-        
+        self.jitter_mode = jitter_mode if jitter else 'none'
+
+        # decorrelated 模式的前次延遲（AWS builders' library 公式）
+        self._prev_delay = base_delay
+
+        # 預先算好各次嘗試的基礎延遲（RANDOM 策略除外），
+        # 重試迴圈內只需查表，不必每次重算冪次
+        self._delay_schedule = self._build_schedule()
+
+        # 取消事件：等待退避期間可被 cancel() 立即喚醒
+        self._cancel_event = threading.Event()
+
+        # 共用 HTTP 會話：首次需要時才由工廠建立
+        self._session_factory = session_factory
+        self._session = None
+
         # 統計資訊
-        self._stats = {
-            'total_calls': 0,
-            'successful_calls': 0,
-            'failed_calls': 0,
-            'total_retries': 0,
-            'error_counts': {}
-        }
+        self._stats = _Stats()
         
         self.logger.info(f"重試管理器已初始化 - 策略: {strategy.value}, 最大重試: {max_retries}")
-    
+
+    def _build_schedule(self) -> Tuple[float, ...]:
+        """依策略預先計算各次嘗試的基礎延遲（已套用 max_delay 上限）
+
+        RANDOM 策略每次都要擲骰，回傳空表、由 calculate_delay 即時計算。
+        """
+        if self.strategy == RetryStrategy.RANDOM:
+            return ()
+
+        delays = []
+        for attempt in range(self.max_retries + 1):
+            if self.strategy == RetryStrategy.EXPONENTIAL:
+                delay = self.base_delay * (self.backoff_factor ** attempt)
+            elif self.strategy == RetryStrategy.LINEAR:
+                delay = self.base_delay + (attempt * self.base_delay)
+            else:  # FIXED 與未知策略
+                delay = self.base_delay
+            delays.append(min(delay, self.max_delay))
+        return tuple(delays)
+
+    def cancel(self):
+        """取消進行中的重試等待
+
+        正在退避等待的 retry_sync 會立即返回失敗結果，
+        不再等完剩餘延遲。共用此管理器的所有呼叫端都會被取消。
+        """
+        self._cancel_event.set()
+
+    def reset_cancel(self):
+        """清除取消狀態，讓後續呼叫恢復正常重試"""
+        self._cancel_event.clear()
+
+    def _inject_session(self, func: Callable, kwargs: Dict[str, Any]):
+        """將共用會話注入被重試函數的 kwargs（若函數接受）
+
+        工廠只在首次需要時呼叫一次，之後所有嘗試與呼叫端共用
+        同一會話；呼叫端已自行傳入 session 時不覆寫。
+        """
+        if self._session_factory is None or 'session' in kwargs:
+            return
+        if not _accepts_session(func):
+            return
+        if self._session is None:
+            self._session = self._session_factory()
+        kwargs['session'] = self._session
+
+    def close_session(self):
+        """關閉共用會話（同步版；aiohttp 會話請改用 async with）"""
+        session, self._session = self._session, None
+        if session is not None:
+            result = session.close()
+            if asyncio.iscoroutine(result):
+                # 同步路徑拿到協程（aiohttp），仍需排進事件迴圈關閉
+                asyncio.get_event_loop().run_until_complete(result)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close_session()
+        return False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        session, self._session = self._session, None
+        if session is not None:
+            result = session.close()
+            if asyncio.iscoroutine(result):
+                await result
+        return False
+
+    @staticmethod
+    def _is_rate_limit(error: Exception) -> bool:
+        """判斷是否為速率限制錯誤
+
+        Drive API 除了 429 之外，也會以 403 搭配
+        userRateLimitExceeded / rateLimitExceeded 原因回報限流，
+        這類錯誤應視為可重試而非認證失敗。
+        """
+        if not isinstance(error, HttpError):
+            return False
+        status_code = error.resp.status
+        if status_code == 429:
+            return True
+        return status_code == 403 and 'ratelimitexceeded' in str(error).lower()
+
     def classify_error(self, error: Exception) -> ErrorCategory:
         """分類錯誤類型
         
@@ -122,25 +277,21 @@ class RetryManager(LoggerMixin):
             錯誤分類
         """
         if isinstance(error, HttpError):
+            # 403 是否為限流取決於錯誤訊息內容，無法只憑型別快取
             status_code = error.resp.status
-            
-            if status_code == 429:
+
+            if self._is_rate_limit(error):
                 return ErrorCategory.RATE_LIMIT
             elif 400 <= status_code < 500:
-                if status_code in [401, 403]:
+                if status_code in (401, 403):
                     return ErrorCategory.AUTH
                 else:
                     return ErrorCategory.CLIENT
             elif 500 <= status_code < 600:
                 return ErrorCategory.SERVER
-        
-        elif isinstance(error, (RefreshError, AuthenticationError)):
-            return ErrorCategory.AUTH
-        
-        elif isinstance(error, self.RETRYABLE_EXCEPTIONS):
-            return ErrorCategory.NETWORK
-        
-        return ErrorCategory.UNKNOWN
+            return ErrorCategory.UNKNOWN
+
+        return _classify_exception_type(type(error))
     
     def is_retryable(self, error: Exception) -> bool:
         """判斷錯誤是否可重試
@@ -161,10 +312,10 @@ class RetryManager(LoggerMixin):
         if isinstance(error, HttpError):
             return error.resp.status in self.RETRYABLE_HTTP_CODES
         
-        # 其他可重試的異常
-        if isinstance(error, self.RETRYABLE_EXCEPTIONS):
+        # 其他可重試的異常：先試 O(1) 精確型別查找，再退回 isinstance
+        if type(error) in self.RETRYABLE_TYPES or isinstance(error, self.RETRYABLE_EXCEPTIONS):
             return True
-        
+
         return False
     
     def calculate_delay(self, attempt: int, error: Exception = None) -> float:
@@ -177,41 +328,43 @@ class RetryManager(LoggerMixin):
         Returns:
             延遲時間（秒）
         """
-        if self.strategy == RetryStrategy.FIXED:
-            delay = self.base_delay
-        
-        elif self.strategy == RetryStrategy.EXPONENTIAL:
-            delay = self.base_delay * (self.backoff_factor ** attempt)
-        
-        elif self.strategy == RetryStrategy.LINEAR:
-            delay = self.base_delay + (attempt * self.base_delay)
-        
-        elif self.strategy == RetryStrategy.RANDOM:
+        if self.strategy == RetryStrategy.RANDOM:
             delay = random.uniform(self.base_delay, self.base_delay * 3)
-        
+        elif attempt < len(self._delay_schedule):
+            delay = self._delay_schedule[attempt]
         else:
-            delay = self.base_delay
-        
-        # 特殊錯誤的延遲調整
-        if error and isinstance(error, HttpError):
-            if error.resp.status == 429:  # Rate limit
-                # 檢查 Retry-After 標頭
-                retry_after = error.resp.get('retry-after')
-                if retry_after:
-                    try:
-                        suggested_delay = float(retry_after)
-                        delay = max(delay, suggested_delay)
-                    except (ValueError, TypeError):
-                        pass
-        
+            # 呼叫端以 max_retries 參數覆寫時可能超出預算表
+            if self.strategy == RetryStrategy.EXPONENTIAL:
+                delay = self.base_delay * (self.backoff_factor ** attempt)
+            elif self.strategy == RetryStrategy.LINEAR:
+                delay = self.base_delay + (attempt * self.base_delay)
+            else:
+                delay = self.base_delay
+
         # 限制最大延遲
-        delay = min(delay, self.max_delay)
-        
-        # 添加隨機抖動
-        if self.jitter:
-            jitter_range = delay * 0.1  # 10% 抖動
-            delay += random.uniform(-jitter_range, jitter_range)
-        
+        cap = min(delay, self.max_delay)
+
+        # 抖動：大量請求同時吃到 429 時，對稱小幅抖動幾乎無法錯開
+        # 重試時點；full jitter 在整個區間取樣，能把重試攤平
+        if self.jitter_mode == 'full':
+            delay = random.uniform(0, cap)
+        elif self.jitter_mode == 'equal':
+            delay = cap / 2 + random.uniform(0, cap / 2)
+        elif self.jitter_mode == 'decorrelated':
+            delay = min(cap, random.uniform(self.base_delay, self._prev_delay * 3))
+            self._prev_delay = delay
+        else:
+            delay = cap
+
+        # Retry-After 作為下限：伺服器明示的等待時間不被抖動縮短
+        if error is not None and self._is_rate_limit(error):
+            retry_after = error.resp.get('retry-after')
+            if retry_after:
+                try:
+                    delay = max(delay, float(retry_after))
+                except (ValueError, TypeError):
+                    pass
+
         return max(0, delay)
     
     def retry_sync(self, 
@@ -236,22 +389,24 @@ class RetryManager(LoggerMixin):
         start_time = time.time()
         attempt = 0
         last_error = None
-        
-        self._stats['total_calls'] += 1
-        
+        func_name = func.__name__  # 迴圈內多處記錄，先取一次
+
+        next(self._stats.total_calls)
+        self._inject_session(func, kwargs)
+
         while attempt <= max_retries:
             try:
-                self.logger.debug(f"執行嘗試 {attempt + 1}/{max_retries + 1}: {func.__name__}")
+                self.logger.debug("執行嘗試 %d/%d: %s", attempt + 1, max_retries + 1, func_name)
                 
                 result = func(*args, **kwargs)
                 
                 total_time = time.time() - start_time
                 
                 if attempt > 0:
-                    self.logger.info(f"重試成功 - 函數: {func.__name__}, 嘗試次數: {attempt + 1}, 總時間: {total_time:.2f}s")
-                    self._stats['total_retries'] += attempt
+                    self.logger.info("重試成功 - 函數: %s, 嘗試次數: %d, 總時間: %.2fs", func_name, attempt + 1, total_time)
+                    self._stats.add_retries(attempt)
                 
-                self._stats['successful_calls'] += 1
+                next(self._stats.successful_calls)
                 
                 return RetryResult(
                     success=True,
@@ -264,40 +419,46 @@ class RetryManager(LoggerMixin):
                 last_error = e
                 attempt += 1
                 
-                # 記錄錯誤統計
-                error_type = type(e).__name__
-                self._stats['error_counts'][error_type] = self._stats['error_counts'].get(error_type, 0) + 1
-                
                 # 判斷是否應該重試
                 should_retry = False
-                
+
                 if custom_exceptions and isinstance(e, custom_exceptions):
                     should_retry = True
                 elif self.is_retryable(e):
                     should_retry = True
-                
+
                 if not should_retry or attempt > max_retries:
-                    self.logger.error(f"函數執行失敗 - {func.__name__}: {e}")
+                    # 快速失敗路徑（絕大多數呼叫）不動分類計數字典，
+                    # 只推進一次終結錯誤計數器
+                    next(self._stats.terminal_errors)
+                    self.logger.error("函數執行失敗 - %s: %s", func_name, e)
                     break
+
+                # 確定會重試才記錄錯誤分類統計
+                error_type = type(e).__name__
+                with self._stats.error_lock:
+                    self._stats.error_counts[error_type] += 1
                 
                 # 計算延遲時間並等待
                 delay = self.calculate_delay(attempt - 1, e)
                 error_category = self.classify_error(e)
                 
                 self.logger.warning(
-                    f"重試 {attempt}/{max_retries} - 函數: {func.__name__}, "
-                    f"錯誤: {error_category.value}, 延遲: {delay:.2f}s"
+                    "重試 %d/%d - 函數: %s, 錯誤: %s, 延遲: %.2fs",
+                    attempt, max_retries, func_name, error_category.value, delay
                 )
                 
-                if delay > 0:
-                    time.sleep(delay)
-        
+                # 可中斷的等待：cancel() 會立即喚醒並中止重試
+                if delay > 0 and self._cancel_event.wait(delay):
+                    self.logger.info("重試已取消 - 函數: %s", func_name)
+                    break
+
         # 所有重試都失敗
         total_time = time.time() - start_time
-        self._stats['failed_calls'] += 1
-        self._stats['total_retries'] += max_retries
+        next(self._stats.failed_calls)
+        self._stats.add_retries(max_retries)
         
-        self.logger.error(f"重試失敗 - 函數: {func.__name__}, 總嘗試: {attempt}, 總時間: {total_time:.2f}s")
+        self.logger.error("重試失敗 - 函數: %s, 總嘗試: %d, 總時間: %.2fs", func_name, attempt, total_time)
         
         return RetryResult(
             success=False,
@@ -328,25 +489,35 @@ class RetryManager(LoggerMixin):
         start_time = time.time()
         attempt = 0
         last_error = None
+        func_name = func.__name__  # 迴圈內多處記錄，先取一次
         
-        self._stats['total_calls'] += 1
-        
+        next(self._stats.total_calls)
+        self._inject_session(func, kwargs)
+
+        # 函數型別不隨呼叫改變：結果依函數物件快取，
+        # 重複以同一函數呼叫時連一次 iscoroutinefunction 都省下
+        is_coroutine = _is_coroutine_function(func)
+
         while attempt <= max_retries:
             try:
-                self.logger.debug(f"異步執行嘗試 {attempt + 1}/{max_retries + 1}: {func.__name__}")
-                
-                if asyncio.iscoroutinefunction(func):
+                self.logger.debug("異步執行嘗試 %d/%d: %s", attempt + 1, max_retries + 1, func_name)
+
+                if is_coroutine:
                     result = await func(*args, **kwargs)
                 else:
-                    result = func(*args, **kwargs)
+                    # 同步函數丟進執行緒池，避免阻塞事件迴圈
+                    loop = asyncio.get_running_loop()
+                    result = await loop.run_in_executor(
+                        None, partial(func, *args, **kwargs)
+                    )
                 
                 total_time = time.time() - start_time
                 
                 if attempt > 0:
-                    self.logger.info(f"異步重試成功 - 函數: {func.__name__}, 嘗試次數: {attempt + 1}, 總時間: {total_time:.2f}s")
-                    self._stats['total_retries'] += attempt
+                    self.logger.info("異步重試成功 - 函數: %s, 嘗試次數: %d, 總時間: %.2fs", func_name, attempt + 1, total_time)
+                    self._stats.add_retries(attempt)
                 
-                self._stats['successful_calls'] += 1
+                next(self._stats.successful_calls)
                 
                 return RetryResult(
                     success=True,
@@ -359,29 +530,32 @@ class RetryManager(LoggerMixin):
                 last_error = e
                 attempt += 1
                 
-                # 記錄錯誤統計
-                error_type = type(e).__name__
-                self._stats['error_counts'][error_type] = self._stats['error_counts'].get(error_type, 0) + 1
-                
                 # 判斷是否應該重試
                 should_retry = False
-                
+
                 if custom_exceptions and isinstance(e, custom_exceptions):
                     should_retry = True
                 elif self.is_retryable(e):
                     should_retry = True
-                
+
                 if not should_retry or attempt > max_retries:
-                    self.logger.error(f"異步函數執行失敗 - {func.__name__}: {e}")
+                    # 快速失敗路徑不動分類計數字典，只推進終結錯誤計數器
+                    next(self._stats.terminal_errors)
+                    self.logger.error("異步函數執行失敗 - %s: %s", func_name, e)
                     break
+
+                # 確定會重試才記錄錯誤分類統計
+                error_type = type(e).__name__
+                with self._stats.error_lock:
+                    self._stats.error_counts[error_type] += 1
                 
                 # 計算延遲時間並等待
                 delay = self.calculate_delay(attempt - 1, e)
                 error_category = self.classify_error(e)
                 
                 self.logger.warning(
-                    f"異步重試 {attempt}/{max_retries} - 函數: {func.__name__}, "
-                    f"錯誤: {error_category.value}, 延遲: {delay:.2f}s"
+                    "異步重試 %d/%d - 函數: %s, 錯誤: %s, 延遲: %.2fs",
+                    attempt, max_retries, func_name, error_category.value, delay
                 )
                 
                 if delay > 0:
@@ -389,10 +563,10 @@ class RetryManager(LoggerMixin):
         
         # 所有重試都失敗
         total_time = time.time() - start_time
-        self._stats['failed_calls'] += 1
-        self._stats['total_retries'] += max_retries
+        next(self._stats.failed_calls)
+        self._stats.add_retries(max_retries)
         
-        self.logger.error(f"異步重試失敗 - 函數: {func.__name__}, 總嘗試: {attempt}, 總時間: {total_time:.2f}s")
+        self.logger.error("異步重試失敗 - 函數: %s, 總嘗試: %d, 總時間: %.2fs", func_name, attempt, total_time)
         
         return RetryResult(
             success=False,
@@ -407,17 +581,24 @@ class RetryManager(LoggerMixin):
         Returns:
             統計資訊字典
         """
-        total_calls = self._stats['total_calls']
-        success_rate = (self._stats['successful_calls'] / total_calls * 100) if total_calls > 0 else 0
-        
+        stats = self._stats
+        total_calls = stats.peek(stats.total_calls)
+        successful_calls = stats.peek(stats.successful_calls)
+        total_retries = stats.peek(stats.total_retries)
+        success_rate = (successful_calls / total_calls * 100) if total_calls > 0 else 0
+
+        with stats.error_lock:
+            error_counts = dict(stats.error_counts)
+
         return {
             'total_calls': total_calls,
-            'successful_calls': self._stats['successful_calls'],
-            'failed_calls': self._stats['failed_calls'],
+            'successful_calls': successful_calls,
+            'failed_calls': stats.peek(stats.failed_calls),
             'success_rate': f"{success_rate:.2f}%",
-            'total_retries': self._stats['total_retries'],
-            'average_retries': self._stats['total_retries'] / total_calls if total_calls > 0 else 0,
-            'error_counts': self._stats['error_counts'].copy(),
+            'total_retries': total_retries,
+            'average_retries': total_retries / total_calls if total_calls > 0 else 0,
+            'error_counts': error_counts,
+            'terminal_errors': stats.peek(stats.terminal_errors),
             'config': {
                 'max_retries': self.max_retries,
                 'base_delay': self.base_delay,
@@ -429,16 +610,62 @@ class RetryManager(LoggerMixin):
     
     def reset_stats(self):
         """重置統計資訊"""
-        self._stats = {
-            'total_calls': 0,
-            'successful_calls': 0,
-            'failed_calls': 0,
-            'total_retries': 0,
-            'error_counts': {}
-        }
+        self._stats = _Stats()
         self.logger.info("重試統計已重置")
 
 
+# 函數是否為協程不隨時間改變，依函數物件快取判斷結果；
+# iscoroutinefunction 需走訪 partial 包裝與旗標位元，非零成本
+_is_coroutine_function = lru_cache(maxsize=256)(asyncio.iscoroutinefunction)
+
+
+@lru_cache(maxsize=256)
+def _accepts_session(func: Callable) -> bool:
+    """判斷函數是否接受 session 關鍵字參數（依函數物件快取）
+
+    inspect.signature 成本不低，每個函數只檢查一次；
+    無法取得簽名的物件（如部分 C 函數）視為不接受。
+    """
+    try:
+        params = inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+    return 'session' in params
+
+
+@lru_cache(maxsize=256)
+def _classify_exception_type(exc_type: type) -> ErrorCategory:
+    """依異常型別分類（純函數，依型別快取）
+
+    非 HttpError 的分類只看型別，重試迴圈中反覆出現同型別錯誤時
+    免去每次的多重 isinstance 走訪。
+    """
+    if exc_type in RetryManager.RETRYABLE_TYPES:
+        return ErrorCategory.NETWORK
+    if issubclass(exc_type, (RefreshError, AuthenticationError)):
+        return ErrorCategory.AUTH
+    if issubclass(exc_type, RetryManager.RETRYABLE_EXCEPTIONS):
+        return ErrorCategory.NETWORK
+    return ErrorCategory.UNKNOWN
+
+
+@lru_cache(maxsize=64)
+def _get_shared_manager(max_retries: int,
+                        base_delay: float,
+                        max_delay: float,
+                        strategy: RetryStrategy) -> RetryManager:
+    """取得指定組態的共用 RetryManager
+
+    參數相同的多個裝飾器共用同一實例，統計也因此彙總。
+    """
+    return RetryManager(
+        max_retries=max_retries,
+        base_delay=base_delay,
+        max_delay=max_delay,
+        strategy=strategy
+    )
+
+
 def retry(max_retries: int = 3,
           base_delay: float = 1.0,
           max_delay: float = 60.0,
@@ -454,48 +681,38 @@ def retry(max_retries: int = 3,
         custom_exceptions: 自訂可重試的異常類型
     """
     def decorator(func):
+        # 裝飾時建立一次，高頻呼叫不再每次重建管理器
+        retry_manager = _get_shared_manager(max_retries, base_delay, max_delay, strategy)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            retry_manager = RetryManager(
-                max_retries=max_retries,
-                base_delay=base_delay,
-                max_delay=max_delay,
-                strategy=strategy
-            )
-            
             result = retry_manager.retry_sync(
-                func, *args, 
+                func, *args,
                 custom_exceptions=custom_exceptions,
                 **kwargs
             )
-            
+
             if result.success:
                 return result.result
             else:
                 raise result.error
-        
+
         @wraps(func)
         async def async_wrapper(*args, **kwargs):
-            retry_manager = RetryManager(
-                max_retries=max_retries,
-                base_delay=base_delay,
-                max_delay=max_delay,
-                strategy=strategy
-            )
-            
             result = await retry_manager.retry_async(
                 func, *args,
                 custom_exceptions=custom_exceptions,
                 **kwargs
             )
-            
+
             if result.success:
                 return result.result
             else:
                 raise result.error
         
-        # 根據函數類型返回適當的包裝器
-        if asyncio.iscoroutinefunction(func):
+        # 根據函數類型返回適當的包裝器（裝飾時決定一次，
+        # 呼叫路徑上不再出現協程判斷）
+        if _is_coroutine_function(func):
             return async_wrapper
         else:
             return wrapper
@@ -4,18 +4,20 @@
 """
 
 import os
+import atexit
 import pickle
 import json
 import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 
 try:
     from cryptography.fernet import Fernet
-    from cryptography.hazmat.primitives import hashes
-    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
-    import base64
     ENCRYPTION_AVAILABLE = True
 except ImportError:
     ENCRYPTION_AVAILABLE = False
@@ -24,6 +26,57 @@ from ..utils.logger import LoggerMixin
 from ..utils.exceptions import AuthenticationError
 
 
+# derive_key 的結果快取：鍵為 (通行片語摘要, salt)，不以明文
+# 通行片語當鍵，避免把祕密長駐在行程記憶體（或經快取內省外洩）
+_DERIVED_KEYS: Dict[tuple, bytes] = {}
+
+
+def derive_key(passphrase: str, salt: bytes) -> bytes:
+    """由通行片語派生 Fernet 金鑰（PBKDF2-HMAC-SHA256）
+
+    提供可重現的金鑰派生：同一 (passphrase, salt) 永遠得到同一把
+    金鑰，換機或換金鑰檔時只需重新派生，不必重新加密所有令牌。
+    600,000 次迭代符合目前的 OWASP 建議；結果以通行片語的摘要為鍵
+    快取，每個行程只付一次拉伸成本且不保留明文。KDF 模組延遲匯入，
+    未用到此功能的路徑不必載入 cryptography.hazmat 的 KDF 依賴樹。
+    """
+    cache_key = (
+        hashlib.sha256(passphrase.encode('utf-8')).digest(),
+        salt
+    )
+    cached = _DERIVED_KEYS.get(cache_key)
+    if cached is not None:
+        return cached
+
+    import base64
+    from cryptography.hazmat.primitives import hashes
+    from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=600_000,
+    )
+    key = base64.urlsafe_b64encode(kdf.derive(passphrase.encode('utf-8')))
+    _DERIVED_KEYS[cache_key] = key
+    return key
+
+
+@lru_cache(maxsize=8)
+def _get_fernet(key_path: str):
+    """取得指定金鑰檔案的 Fernet 實例（模組層級快取）
+
+    金鑰檔案讀取與 Fernet 建構都有固定成本，重複建立
+    SecureTokenStorage（如每個請求一次）時不必每次重做；
+    快取以解析後的金鑰路徑為鍵，實例被回收也不失效。
+    更換金鑰後需呼叫 _get_fernet.cache_clear()。
+    """
+    with open(key_path, 'rb') as f:
+        key = f.read()
+    return Fernet(key)
+
+
 class SecureTokenStorage(LoggerMixin):
     """安全令牌儲存器
     
@@ -62,7 +115,20 @@ class SecureTokenStorage(LoggerMixin):
         # 元資料檔案
         self.metadata_file = self.storage_dir / "tokens_metadata.json"
         self._metadata = self._load_metadata()
-        
+
+        # 延遲寫入：元資料常駐記憶體，髒旗標 + 計時器合併短時間內的
+        # 多次變更為一次磁碟寫入（批次儲存／刪除時 O(N) 次重寫降為 O(1)）
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        self._flush_lock = threading.Lock()
+        atexit.register(self._flush_metadata)
+
+        # 解密後令牌的行程內快取：token_id -> (到期 epoch, 令牌物件)。
+        # 認證密集的路徑每次請求都會 load_token，快取命中時省去
+        # 磁碟讀取、Fernet 解密與反序列化；以 RLock 保護並行存取。
+        self._token_cache: Dict[str, tuple] = {}
+        self._token_cache_lock = threading.RLock()
+
         self.logger.info(f"安全令牌儲存器已初始化 - 加密: {self.enable_encryption}")
     
     def _init_encryption(self):
@@ -74,11 +140,10 @@ class SecureTokenStorage(LoggerMixin):
                 self._save_key(key)
                 self.logger.info("已生成新的加密金鑰")
             else:
-                # 載入現有金鑰
-                key = self._load_key()
                 self.logger.info("已載入現有加密金鑰")
-            
-            self._fernet = Fernet(key)
+
+            # 同一金鑰檔案共用同一 Fernet，重複建構儲存器時免去磁碟讀取
+            self._fernet = _get_fernet(str(Path(self.encryption_key_file).resolve()))
             
         except Exception as e:
             self.logger.error(f"初始化加密系統失敗: {e}")
@@ -117,12 +182,42 @@ class SecureTokenStorage(LoggerMixin):
             return {}
     
     def _save_metadata(self):
-        """儲存令牌元資料"""
+        """排程儲存令牌元資料（延遲合併寫入）
+
+        每次呼叫只設定髒旗標並啟動（或沿用）一個 0.2 秒的計時器，
+        到期時才執行一次完整寫入；密集的 save/delete 序列因此只
+        產生一次磁碟重寫。需要立即落盤時呼叫 close()。
+        """
+        with self._flush_lock:
+            self._dirty = True
+            if self._flush_timer is None:
+                timer = threading.Timer(0.2, self._flush_metadata)
+                timer.daemon = True
+                timer.start()
+                self._flush_timer = timer
+
+    def _flush_metadata(self):
+        """將元資料實際寫入磁碟（原子替換）"""
+        with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._dirty:
+                return
+            self._dirty = False
+            snapshot = dict(self._metadata)
+
         try:
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(self._metadata, f, indent=2, ensure_ascii=False, default=str)
+            tmp_file = self.metadata_file.with_suffix('.json.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, indent=2, ensure_ascii=False, default=str)
+            os.replace(tmp_file, self.metadata_file)
         except Exception as e:
             self.logger.error(f"儲存元資料失敗: {e}")
+
+    def close(self):
+        """關閉儲存器，立即寫入尚未落盤的元資料"""
+        self._flush_metadata()
     
     def _encrypt_data(self, data: bytes) -> bytes:
         """加密資料"""
@@ -142,11 +237,64 @@ class SecureTokenStorage(LoggerMixin):
         else:
             return encrypted_data
     
-    def _generate_token_id(self, auth_type: str, identifier: str = None) -> str:
-        """生成令牌 ID"""
-        # 使用認證類型和識別符生成唯一 ID
+    def _serialize_token(self, token_data: Any) -> bytes:
+        """序列化令牌資料
+
+        Google Credentials 以其 to_json() 表示、一般資料以 JSON 儲存：
+        比 pickle 更快、密文更小，且載入被竄改的儲存檔不會執行任意
+        程式碼。無法以 JSON 表達的物件才退回 pickle。
+        """
+        if hasattr(token_data, 'to_json'):
+            payload = {'__gcreds__': True, 'json': token_data.to_json()}
+            return json.dumps(payload).encode('utf-8')
+
+        try:
+            payload = {'__gcreds__': False, 'data': token_data}
+            return json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        except (TypeError, ValueError):
+            return pickle.dumps(token_data, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _deserialize_token(self, data: bytes) -> Any:
+        """反序列化令牌資料（相容舊版 pickle 格式）"""
+        try:
+            payload = json.loads(data)
+            if isinstance(payload, dict) and '__gcreds__' in payload:
+                if payload['__gcreds__']:
+                    from google.oauth2.credentials import Credentials
+                    return Credentials.from_authorized_user_info(
+                        json.loads(payload['json'])
+                    )
+                return payload['data']
+        except (ValueError, UnicodeDecodeError):
+            pass
+
+        # 舊版以 pickle 儲存的令牌
+        return pickle.loads(data)
+
+    @staticmethod
+    def _expires_at_ts(metadata: Dict[str, Any]) -> float:
+        """取得元資料的到期 epoch 時間戳
+
+        新格式直接讀取 expires_at_ts；舊格式元資料解析一次 ISO 字串
+        並回填，之後的檢查即為純數值比較。
+        """
+        ts = metadata.get('expires_at_ts')
+        if ts is None:
+            ts = datetime.fromisoformat(metadata['expires_at']).timestamp()
+            metadata['expires_at_ts'] = ts
+        return ts
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _generate_token_id(auth_type: str, identifier: str = None) -> str:
+        """生成令牌 ID
+
+        blake2b(digest_size=8) 專為短摘要派生設計，比 SHA-256 截斷
+        快約一倍；輸出同為 16 個十六進位字元。結果以 (auth_type,
+        identifier) 為鍵快取，重複查找同一令牌時免去雜湊運算。
+        """
         content = f"{auth_type}_{identifier or 'default'}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        return hashlib.blake2b(content.encode(), digest_size=8).hexdigest()
     
     def save_token(self, 
                    token_data: Any, 
@@ -169,33 +317,45 @@ class SecureTokenStorage(LoggerMixin):
             token_file = self.storage_dir / f"{token_id}.token"
             
             # 序列化令牌資料
-            serialized_data = pickle.dumps(token_data)
+            serialized_data = self._serialize_token(token_data)
             
-            # 加密並儲存
+            # 加密並儲存：以 os.open 一次寫入，跳過 BufferedWriter 的
+            # 緩衝層（令牌僅數百位元組）；0o600 在建檔時原子生效，
+            # 免去事後 chmod，O_NOFOLLOW 並防止符號連結替換攻擊
             encrypted_data = self._encrypt_data(serialized_data)
-            
-            with open(token_file, 'wb') as f:
-                f.write(encrypted_data)
-            
-            # 設定檔案權限
+
+            fd = os.open(
+                str(token_file),
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+                | getattr(os, 'O_NOFOLLOW', 0) | getattr(os, 'O_CLOEXEC', 0),
+                0o600
+            )
             try:
-                os.chmod(token_file, 0o600)
-            except (OSError, AttributeError):
-                pass
-            
-            # 更新元資料
+                os.write(fd, encrypted_data)
+            finally:
+                os.close(fd)
+
+
+            # 更新元資料；expires_at 保留 ISO 字串供人讀，
+            # 另存 epoch 浮點數讓過期檢查免去反覆 fromisoformat 解析
+            now = datetime.now()
+            expires_at = now + self.token_ttl
             self._metadata[token_id] = {
                 'auth_type': auth_type,
                 'identifier': identifier,
                 'user_info': user_info or {},
-                'created_at': datetime.now().isoformat(),
-                'expires_at': (datetime.now() + self.token_ttl).isoformat(),
+                'created_at': now.isoformat(),
+                'expires_at': expires_at.isoformat(),
+                'expires_at_ts': expires_at.timestamp(),
                 'file_path': str(token_file),
                 'encrypted': self.enable_encryption
             }
             
             self._save_metadata()
-            
+
+            with self._token_cache_lock:
+                self._token_cache[token_id] = (expires_at.timestamp(), token_data)
+
             self.logger.info(f"令牌已儲存 - ID: {token_id}, 類型: {auth_type}")
             return token_id
             
@@ -222,12 +382,21 @@ class SecureTokenStorage(LoggerMixin):
             if not token_id or token_id not in self._metadata:
                 self.logger.debug(f"令牌不存在: {token_id}")
                 return None
-            
+
+            # 快取命中：直接回傳解密過的物件（微秒級 vs 磁碟+解密的毫秒級）
+            with self._token_cache_lock:
+                cached = self._token_cache.get(token_id)
+                if cached is not None:
+                    expires_ts, token_data = cached
+                    if time.time() < expires_ts:
+                        return token_data
+                    del self._token_cache[token_id]
+
+
             metadata = self._metadata[token_id]
             
-            # 檢查是否已過期
-            expires_at = datetime.fromisoformat(metadata['expires_at'])
-            if datetime.now() > expires_at:
+            # 檢查是否已過期（epoch 比較，免去 ISO 解析）
+            if time.time() > self._expires_at_ts(metadata):
                 self.logger.info(f"令牌已過期: {token_id}")
                 self.delete_token(token_id)
                 return None
@@ -240,13 +409,30 @@ class SecureTokenStorage(LoggerMixin):
                 self._save_metadata()
                 return None
             
-            with open(token_file, 'rb') as f:
-                encrypted_data = f.read()
-            
+            fd = os.open(
+                str(token_file),
+                os.O_RDONLY
+                | getattr(os, 'O_NOFOLLOW', 0) | getattr(os, 'O_CLOEXEC', 0)
+            )
+            try:
+                chunks = []
+                while True:
+                    chunk = os.read(fd, 65536)
+                    if not chunk:
+                        break
+                    chunks.append(chunk)
+                encrypted_data = b''.join(chunks)
+            finally:
+                os.close(fd)
+
+
             # 解密和反序列化
             decrypted_data = self._decrypt_data(encrypted_data)
-            token_data = pickle.loads(decrypted_data)
-            
+            token_data = self._deserialize_token(decrypted_data)
+
+            with self._token_cache_lock:
+                self._token_cache[token_id] = (self._expires_at_ts(metadata), token_data)
+
             self.logger.debug(f"令牌已載入: {token_id}")
             return token_data
             
@@ -270,8 +456,10 @@ class SecureTokenStorage(LoggerMixin):
                     token_file.unlink()
                     self.logger.info(f"令牌檔案已刪除: {token_file}")
                 
-                # 從元資料中移除
+                # 從元資料與快取中移除
                 del self._metadata[token_id]
+                with self._token_cache_lock:
+                    self._token_cache.pop(token_id, None)
                 self._save_metadata()
                 
                 self.logger.info(f"令牌已刪除: {token_id}")
@@ -293,20 +481,27 @@ class SecureTokenStorage(LoggerMixin):
         Returns:
             清理的令牌數量
         """
-        now = datetime.now()
-        expired_tokens = []
-        
-        for token_id, metadata in self._metadata.items():
-            expires_at = datetime.fromisoformat(metadata['expires_at'])
-            if now > expires_at:
-                expired_tokens.append(token_id)
-        
-        for token_id in expired_tokens:
-            self.delete_token(token_id)
-        
+        now_ts = time.time()
+        expired_tokens = [
+            token_id for token_id, metadata in self._metadata.items()
+            if now_ts > self._expires_at_ts(metadata)
+        ]
+
         if expired_tokens:
+            # 批次刪除：檔案 unlink 平行處理，元資料最後一次性更新，
+            # 避免逐一 delete_token 造成 O(N) 次完整元資料重寫
+            paths = [self._metadata[token_id]['file_path'] for token_id in expired_tokens]
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+                list(executor.map(lambda p: Path(p).unlink(missing_ok=True), paths))
+
+            with self._token_cache_lock:
+                for token_id in expired_tokens:
+                    del self._metadata[token_id]
+                    self._token_cache.pop(token_id, None)
+
+            self._save_metadata()
             self.logger.info(f"已清理 {len(expired_tokens)} 個過期令牌")
-        
+
         return len(expired_tokens)
     
     def get_token_info(self, token_id: str) -> Optional[Dict[str, Any]]:
@@ -322,8 +517,7 @@ class SecureTokenStorage(LoggerMixin):
             metadata = self._metadata[token_id].copy()
             
             # 檢查是否過期
-            expires_at = datetime.fromisoformat(metadata['expires_at'])
-            metadata['is_expired'] = datetime.now() > expires_at
+            metadata['is_expired'] = time.time() > self._expires_at_ts(metadata)
             metadata['is_valid'] = not metadata['is_expired']
             
             return metadata
@@ -341,41 +535,48 @@ class SecureTokenStorage(LoggerMixin):
             return
         
         try:
-            # 載入所有現有令牌
-            tokens_data = {}
-            for token_id in list(self._metadata.keys()):
-                token_data = self.load_token(token_id)
-                if token_data:
-                    tokens_data[token_id] = (token_data, self._metadata[token_id])
-            
+            old_fernet = self._fernet
+
             # 生成新金鑰
             new_key = Fernet.generate_key()
             old_key_file = self.encryption_key_file
-            
+
             if new_key_file:
                 self.encryption_key_file = new_key_file
-            
-            # 儲存新金鑰
+
+            # 儲存新金鑰並讓路徑快取失效，避免撈到舊金鑰的 Fernet
             self._save_key(new_key)
-            self._fernet = Fernet(new_key)
-            
-            # 重新加密所有令牌
-            for token_id, (token_data, metadata) in tokens_data.items():
-                self.delete_token(token_id)
-                self.save_token(
-                    token_data,
-                    metadata['auth_type'],
-                    metadata['identifier'],
-                    metadata['user_info']
-                )
-            
+            _get_fernet.cache_clear()
+            new_fernet = Fernet(new_key)
+
+            # 直接對密文「解密→再加密」，不經過 pickle 往返；
+            # Fernet 的 AES 原語在 OpenSSL 中會釋放 GIL，可平行處理
+            def rekey(item):
+                token_id, metadata = item
+                token_file = Path(metadata['file_path'])
+                if not token_file.exists():
+                    return
+                data = token_file.read_bytes()
+                if metadata.get('encrypted'):
+                    data = old_fernet.decrypt(data)
+                token_file.write_bytes(new_fernet.encrypt(data))
+                metadata['encrypted'] = True
+
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                list(executor.map(rekey, list(self._metadata.items())))
+
+            self._fernet = new_fernet
+            with self._token_cache_lock:
+                self._token_cache.clear()
+            self._save_metadata()
+
             # 刪除舊金鑰檔案
             if old_key_file != self.encryption_key_file:
                 try:
                     os.unlink(old_key_file)
                 except:
                     pass
-            
+
             self.logger.info("加密金鑰已更換，所有令牌已重新加密")
             
         except Exception as e:
@@ -3,15 +3,23 @@ Google Drive Service Account 認證模組
 提供無需使用者互動的認證方式
 """
 
-import json
+import hashlib
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
-from google.oauth2 import service_account
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
 
-from .base_auth import BaseAuth
+# google.oauth2 與 googleapiclient（尤其 discovery）的匯入成本以秒計，
+# 延後到 authenticate() 內才載入，讓只匯入本模組（如 CLI help、
+# 測試探索）而未實際認證的路徑不必付出這筆啟動成本
+
+from .base_auth import (
+    BaseAuth,
+    get_cached_drive_service,
+    mark_probed,
+    probe_needed,
+)
 from ..utils.exceptions import AuthenticationError, ConfigurationError
+from ..utils.helpers import fast_json_loads
 
 
 class ServiceAccountAuth(BaseAuth):
@@ -21,19 +29,23 @@ class ServiceAccountAuth(BaseAuth):
     適用於自動化工具和伺服器端應用
     """
     
+    __slots__ = ('service_account_file',)
+
+    # 預設權限範圍：凍結為 tuple，可雜湊、每次建構零配置
+    DEFAULT_SCOPES = (
+        'https://www.googleapis.com/auth/drive',
+        'https://www.googleapis.com/auth/drive.file'
+    )
+
     def __init__(self, service_account_file: str = None, scopes: list = None):
         """
         初始化 Service Account 認證
-        
+
         Args:
             service_account_file: 服務帳戶 JSON 檔案路徑
             scopes: 權限範圍清單
         """
-        default_scopes = scopes or [
-            'https://www.googleapis.com/auth/drive',
-            'https://www.googleapis.com/auth/drive.file'
-        ]
-        super().__init__(default_scopes)
+        super().__init__(scopes or self.DEFAULT_SCOPES)
         self.service_account_file = service_account_file or 'service_account.json'
         
         self.logger.info("Service Account 認證已初始化")
@@ -44,40 +56,58 @@ class ServiceAccountAuth(BaseAuth):
         Returns:
             認證是否成功
         """
+        from google.oauth2 import service_account
+        from googleapiclient.errors import HttpError
+
+        from ._discovery import build_drive_service
+
         try:
-            # 檢查服務帳戶檔案是否存在
+            # 一次 open 同時完成存在檢查與讀取：exists() + 程式庫內部
+            # 重新開檔會多付一倍系統呼叫，檔案不存在直接由例外分流
             service_file_path = Path(self.service_account_file)
-            if not service_file_path.exists():
+            try:
+                with open(service_file_path, 'rb') as f:
+                    sa_bytes = f.read()
+            except FileNotFoundError:
                 raise ConfigurationError(
                     'service_account_file',
                     f"服務帳戶檔案不存在: {service_file_path}"
                 )
-            
-            # 載入服務帳戶憑證
-            self._credentials = service_account.Credentials.from_service_account_file(
-                str(service_file_path), 
+
+            # 載入服務帳戶憑證（_info 變體直接吃已解析的 dict，
+            # 不再讓程式庫自己 stat + open 一次；有 orjson 時解析為 C 實作）
+            self._credentials = service_account.Credentials.from_service_account_info(
+                fast_json_loads(sa_bytes),
                 scopes=self.scopes
             )
-            
-            # 建立 Drive 服務
-            self._drive_service = build(
-                'drive', 
-                'v3', 
-                credentials=self._credentials,
-                cache_discovery=False
+
+            # 建立 Drive 服務：以憑證檔指紋＋scopes 為鍵共用實例，
+            # 相同組態的後續認證免去 discovery 解析與新連線池；
+            # discovery 文件用 repo 隨附版本，不經網路取回
+            fingerprint = hashlib.sha256(sa_bytes).hexdigest()
+            cache_key = ('service_account', fingerprint, tuple(sorted(self.scopes)))
+            self._drive_service = get_cached_drive_service(
+                cache_key,
+                lambda: build_drive_service(self._credentials)
             )
-            
-            # 測試連線
-            about = self._drive_service.about().get(fields="user").execute()
-            user_email = about.get('user', {}).get('emailAddress', 'Unknown')
-            
-            self.logger.info(f"Service Account 認證成功 - 服務帳戶: {user_email}")
+
+
+            # 測試連線：同一（憑證, scopes）每個行程只探測一次，
+            # 熱路徑上的重複認證不再各付一次網路往返
+            if probe_needed(cache_key):
+                about = self._drive_service.about().get(fields="user").execute()
+                user_email = about.get('user', {}).get('emailAddress', 'Unknown')
+                mark_probed(cache_key)
+                self.logger.info(f"Service Account 認證成功 - 服務帳戶: {user_email}")
+            else:
+                self.logger.debug("Service Account 認證成功（沿用已驗證的服務）")
             return True
             
         except FileNotFoundError:
             self.logger.error(f"找不到服務帳戶檔案: {self.service_account_file}")
             return False
-        except json.JSONDecodeError as e:
+        except ValueError as e:
+            # 標準庫與 orjson 的 JSONDecodeError 都是 ValueError 子類
             self.logger.error(f"服務帳戶檔案格式錯誤: {e}")
             return False
         except HttpError as e:
@@ -93,19 +123,24 @@ class ServiceAccountAuth(BaseAuth):
         Returns:
             Google Drive 服務實例
         """
-        if not self._drive_service:
-            if not self.authenticate():
-                raise AuthenticationError("Service Account 認證失敗")
-        
+        # 已認證的熱路徑：單一屬性判斷直接返回
+        service = self._drive_service
+        if service is not None:
+            return service
+
+        if not self.authenticate():
+            raise AuthenticationError("Service Account 認證失敗")
+
         return self._drive_service
-    
+
     def is_authenticated(self) -> bool:
         """檢查是否已認證
-        
+
         Returns:
             是否已認證
         """
-        return self._credentials is not None and self._drive_service is not None
+        # 服務存在即代表憑證已載入（authenticate 先設憑證再建服務）
+        return self._drive_service is not None
     
     def get_user_info(self) -> dict:
         """取得服務帳戶資訊
@@ -134,51 +169,19 @@ class ServiceAccountAuth(BaseAuth):
             raise AuthenticationError(f"無法取得服務帳戶資訊: {e}")
 
 
+@lru_cache(maxsize=1)
 def create_service_account_setup_guide() -> str:
     """創建 Service Account 設定指南
-    
+
+    指南內文存放於 docs/service_account_guide.md：多 KB 的字串常數
+    若留在模組內，會在匯入時佔用 bytecode 與記憶體；改為首次呼叫
+    才讀檔，結果快取後不重複 I/O。
+
     Returns:
         設定指南文字
     """
-    guide = """
-## 🔧 Service Account 設定指南
-
-### 步驟 1：建立 Service Account
-1. 前往 [Google Cloud Console](https://console.cloud.google.com/)
-2. 選擇或建立專案
-3. 啟用 Google Drive API
-4. 前往「IAM 和管理 > 服務帳戶」
-5. 點擊「建立服務帳戶」
-6. 輸入服務帳戶名稱和描述
-7. 點擊「建立並繼續」
-
-### 步驟 2：下載憑證檔案
-1. 在服務帳戶清單中，點擊剛建立的服務帳戶
-2. 切換到「金鑰」分頁
-3. 點擊「新增金鑰 > 建立新金鑰」
-4. 選擇「JSON」格式
-5. 下載並重新命名為 `service_account.json`
-6. 將檔案放在專案根目錄
-
-### 步驟 3：授權 Drive 存取權限
-1. 複製服務帳戶的 Email 地址
-2. 在 Google Drive 中分享要存取的資料夾
-3. 將服務帳戶 Email 新增為協作者
-4. 設定適當的權限（檢視者/編輯者/擁有者）
-
-### 優點：
-✅ 無需使用者授權流程
-✅ 不會過期的認證
-✅ 適合自動化腳本
-✅ 伺服器端應用的最佳選擇
-
-### 限制：
-⚠️ 只能存取明確分享的檔案/資料夾
-⚠️ 不是個人使用者帳戶
-⚠️ 需要手動設定權限
-    """
-    
-    return guide
+    guide_path = Path(__file__).parent / 'docs' / 'service_account_guide.md'
+    return guide_path.read_text(encoding='utf-8')
 
 
 # 便利函數
@@ -3,31 +3,62 @@
 減少配置步驟，提供更簡單的認證體驗
 """
 
+import json
 import os
 import pickle
+import sys
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+# google 認證與 googleapiclient.discovery 的依賴樹龐大（匯入以秒計），
+# 各自延後到實際用到的方法內載入，純匯入本模組不觸發
 
-from .base_auth import BaseAuth
+from .base_auth import BaseAuth, get_cached_drive_service, mark_probed, probe_needed
 from ..utils.exceptions import AuthenticationError
 
 
+# 行程內令牌快取：token_file 解析路徑 -> (mtime, Credentials)。
+# 重複 authenticate() 不再每次重讀磁碟與重建憑證物件，
+# 檔案被其他行程更新時 mtime 改變、快取自然失效。
+_TOKEN_CACHE: dict = {}
+
+# 每組憑證一把刷新鎖：多個執行緒同時發現令牌過期時，
+# 只有第一個真正對 accounts.google.com 發出刷新請求，
+# 其餘在鎖內重新檢查後直接沿用刷新結果（避免 refresh 風暴與限流）
+_REFRESH_LOCKS: dict = {}
+_REFRESH_LOCKS_GUARD = threading.Lock()
+
+
+def _get_refresh_lock(key: str) -> threading.Lock:
+    """取得指定憑證鍵的刷新鎖（不存在時建立）"""
+    with _REFRESH_LOCKS_GUARD:
+        return _REFRESH_LOCKS.setdefault(key, threading.Lock())
+
+
 class SimpleUserAuth(BaseAuth):
     """簡化的使用者認證
     
     自動處理常見的認證場景，減少配置複雜度
     """
-    
-    # 預定義的常用權限範圍
-    SCOPES_READONLY = ['https://www.googleapis.com/auth/drive.readonly']
-    SCOPES_FILE = ['https://www.googleapis.com/auth/drive.file']
-    SCOPES_FULL = ['https://www.googleapis.com/auth/drive']
-    
+
+    __slots__ = ('client_id', 'client_secret', 'token_file')
+
+    # 預定義的常用權限範圍：interned tuple 不可變、可雜湊，
+    # 可直接作為服務快取鍵，scope 字串比較也退化為指標比較
+    SCOPES_READONLY = (sys.intern('https://www.googleapis.com/auth/drive.readonly'),)
+    SCOPES_FILE = (sys.intern('https://www.googleapis.com/auth/drive.file'),)
+    SCOPES_FULL = (sys.intern('https://www.googleapis.com/auth/drive'),)
+
+    # 名稱 -> scopes 的對應表建一次即可，不必每次 __init__ 重建
+    _SCOPE_MAPPING = {
+        'readonly': SCOPES_READONLY,
+        'file': SCOPES_FILE,
+        'full': SCOPES_FULL
+    }
+
+
     def __init__(self, 
                  client_id: str = None,
                  client_secret: str = None,
@@ -43,13 +74,9 @@ class SimpleUserAuth(BaseAuth):
             token_file: 令牌儲存檔案
         """
         # 設定權限範圍
-        scope_mapping = {
-            'readonly': self.SCOPES_READONLY,
-            'file': self.SCOPES_FILE,
-            'full': self.SCOPES_FULL
-        }
-        selected_scopes = scope_mapping.get(scopes, self.SCOPES_READONLY)
-        
+        selected_scopes = self._SCOPE_MAPPING.get(scopes, self.SCOPES_READONLY)
+
+
         super().__init__(selected_scopes)
         
         self.client_id = client_id
@@ -89,14 +116,21 @@ class SimpleUserAuth(BaseAuth):
                 self.logger.info("使用現有有效令牌")
                 return self._build_service()
             
-            # 嘗試重新整理令牌
-            if (self._credentials and 
-                self._credentials.expired and 
+            # 嘗試重新整理令牌（同組憑證的並行刷新合併為一次網路請求）
+            if (self._credentials and
+                self._credentials.expired and
                 self._credentials.refresh_token):
-                
-                self.logger.info("重新整理過期令牌")
-                self._credentials.refresh(Request())
-                self._save_token()
+                from google.auth.transport.requests import Request
+
+                lock_key = self.client_id or str(Path(self.token_file).resolve())
+                with _get_refresh_lock(lock_key):
+                    # 等鎖期間其他執行緒可能已就地刷新同一憑證物件
+                    if self._credentials.valid:
+                        self.logger.debug("令牌已由並行呼叫刷新，直接沿用")
+                    else:
+                        self.logger.info("重新整理過期令牌")
+                        self._credentials.refresh(Request())
+                        self._save_token()
                 return self._build_service()
             
             # 執行新的認證流程
@@ -113,37 +147,74 @@ class SimpleUserAuth(BaseAuth):
             self.logger.error(f"認證失敗: {e}")
             return False
     
-    def _load_token(self) -> Optional[Credentials]:
-        """載入儲存的令牌"""
+    def _load_token(self) -> Optional['Credentials']:
+        """載入儲存的令牌
+
+        新格式為 Credentials.to_json() 的 JSON 文字（解析快、不執行
+        任意程式碼）；舊版 pickle 令牌仍可載入。同一檔案在行程內
+        以 mtime 快取，重複認證不必重讀磁碟。
+        """
         token_path = Path(self.token_file)
-        
-        if not token_path.exists():
+
+        try:
+            st = token_path.stat()
+        except OSError:
             return None
-        
+
+        cache_key = str(token_path.resolve())
+        cached = _TOKEN_CACHE.get(cache_key)
+        if cached is not None and cached[0] == st.st_mtime:
+            return cached[1]
+
         try:
-            with open(token_path, 'rb') as token_file:
-                return pickle.load(token_file)
+            raw = token_path.read_bytes()
+            try:
+                info = json.loads(raw)
+                from google.oauth2.credentials import Credentials
+                credentials = Credentials.from_authorized_user_info(info, self.scopes)
+            except (ValueError, UnicodeDecodeError):
+                # 舊版以 pickle 儲存的令牌
+                credentials = pickle.loads(raw)
+
+            _TOKEN_CACHE[cache_key] = (st.st_mtime, credentials)
+            return credentials
         except Exception as e:
             self.logger.warning(f"載入令牌失敗: {e}")
             return None
-    
+
     def _save_token(self):
-        """儲存令牌"""
+        """儲存令牌（JSON 格式，寫入暫存檔後原子替換）"""
         try:
             token_path = Path(self.token_file)
             token_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(token_path, 'wb') as token_file:
-                pickle.dump(self._credentials, token_file)
-                
+
+            if hasattr(self._credentials, 'to_json'):
+                data = self._credentials.to_json().encode('utf-8')
+            else:
+                # 罕見的非 google Credentials 物件才走 pickle；
+                # 最高協定序列化更快、產物也更小
+                data = pickle.dumps(self._credentials, protocol=pickle.HIGHEST_PROTOCOL)
+
+            # 先寫暫存檔再 os.replace，並行執行下不會讀到半寫的令牌
+            tmp_path = token_path.with_name(token_path.name + '.tmp')
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, token_path)
+
+            _TOKEN_CACHE[str(token_path.resolve())] = (
+                token_path.stat().st_mtime, self._credentials
+            )
+
             self.logger.info("認證令牌已儲存")
         except Exception as e:
             self.logger.error(f"儲存令牌失敗: {e}")
     
-    def _run_oauth_flow(self) -> Credentials:
+    def _run_oauth_flow(self) -> 'Credentials':
         """執行 OAuth 流程"""
-        # 建立臨時的 credentials.json
-        temp_creds = {
+        from google_auth_oauthlib.flow import InstalledAppFlow
+
+        # client 設定直接以 dict 傳入 from_client_config，
+        # 不必經過「寫臨時 credentials.json 再讀回」的磁碟往返
+        client_config = {
             "installed": {
                 "client_id": self.client_id,
                 "client_secret": self.client_secret,
@@ -152,47 +223,42 @@ class SimpleUserAuth(BaseAuth):
                 "redirect_uris": ["http://localhost:8080"]
             }
         }
-        
-        import tempfile
-        import json
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(temp_creds, f)
-            temp_file = f.name
-        
-        try:
-            flow = InstalledAppFlow.from_client_secrets_file(temp_file, self.scopes)
-            
-            # 使用本地伺服器進行認證
-            credentials = flow.run_local_server(
-                port=0,  # 自動選擇可用端口
-                open_browser=True
-            )
-            
-            return credentials
-            
-        finally:
-            # 清理臨時檔案
-            try:
-                os.unlink(temp_file)
-            except:
-                pass
+
+        flow = InstalledAppFlow.from_client_config(client_config, self.scopes)
+
+        # 使用本地伺服器進行認證
+        return flow.run_local_server(
+            port=0,  # 自動選擇可用端口
+            open_browser=True
+        )
     
     def _build_service(self) -> bool:
         """建立 Drive 服務"""
+        from ._discovery import build_drive_service
+
         try:
-            self._drive_service = build(
-                'drive', 
-                'v3', 
-                credentials=self._credentials,
-                cache_discovery=False
+            # 同一 client（或令牌檔）＋scopes 共用一個服務實例，
+            # 免去每個認證物件各自的 discovery 解析與連線池；
+            # discovery 文件用 repo 隨附版本，不經網路取回
+            cache_key = (
+                'simple_user',
+                self.client_id or str(Path(self.token_file).resolve()),
+                tuple(self.scopes)
             )
-            
-            # 測試連線
-            about = self._drive_service.about().get(fields="user").execute()
-            user_email = about.get('user', {}).get('emailAddress', 'Unknown')
-            
-            self.logger.info(f"Drive 服務已建立 - 使用者: {user_email}")
+            self._drive_service = get_cached_drive_service(
+                cache_key,
+                lambda: build_drive_service(self._credentials)
+            )
+
+
+            # 測試連線：同一服務鍵每個行程只探測一次
+            if probe_needed(cache_key):
+                about = self._drive_service.about().get(fields="user").execute()
+                user_email = about.get('user', {}).get('emailAddress', 'Unknown')
+                mark_probed(cache_key)
+                self.logger.info(f"Drive 服務已建立 - 使用者: {user_email}")
+            else:
+                self.logger.debug("Drive 服務已建立（沿用已驗證的服務）")
             return True
             
         except Exception as e:
@@ -205,30 +271,37 @@ class SimpleUserAuth(BaseAuth):
         Returns:
             Google Drive 服務實例
         """
-        if not self._drive_service:
-            if not self.authenticate():
-                raise AuthenticationError("認證失敗")
-        
+        # 已認證的熱路徑：單一屬性判斷直接返回
+        service = self._drive_service
+        if service is not None:
+            return service
+
+        if not self.authenticate():
+            raise AuthenticationError("認證失敗")
+
         return self._drive_service
-    
+
     def is_authenticated(self) -> bool:
         """檢查是否已認證
-        
+
         Returns:
             是否已認證
         """
-        return self._credentials is not None and self._drive_service is not None
+        # 服務存在即代表憑證已就緒（authenticate 先取得憑證再建服務）
+        return self._drive_service is not None
     
     def logout(self):
         """登出並清理認證"""
         if self._credentials:
             try:
+                from google.auth.transport.requests import Request
                 self._credentials.revoke(Request())
             except:
                 pass
         
-        # 清理本地檔案
+        # 清理本地檔案與行程內快取
         token_path = Path(self.token_file)
+        _TOKEN_CACHE.pop(str(token_path.resolve()), None)
         if token_path.exists():
             token_path.unlink()
         
@@ -257,58 +330,15 @@ def quick_auth(client_id: str, client_secret: str, scopes: str = 'readonly'):
         raise AuthenticationError("快速認證失敗")
 
 
+@lru_cache(maxsize=1)
 def create_simple_auth_guide() -> str:
     """創建簡化認證指南
-    
+
+    指南內文存放於 docs/simple_auth_guide.md，首次呼叫才讀檔並快取，
+    模組匯入不再攜帶多 KB 的字串常數。
+
     Returns:
         設定指南文字
     """
-    guide = """
-## 🚀 簡化認證使用指南
-
-### 快速開始（3行程式碼）
-```python
-from src.core.simple_auth import quick_auth
-
-# 一行程式碼完成認證
-drive = quick_auth("your_client_id", "your_client_secret", "readonly")
-
-# 直接使用
-files = drive.files().list().execute()
-```
-
-### 進階使用
-```python
-from src.core.simple_auth import SimpleUserAuth
-
-# 建立認證實例
-auth = SimpleUserAuth(scopes='file')  # readonly, file, full
-
-# 設定認證資訊
-success = auth.quick_setup("client_id", "client_secret")
-
-if success:
-    drive = auth.get_drive_service()
-    # 使用 Drive API
-```
-
-### 權限範圍說明
-- **readonly**: 只能讀取檔案（推薦）
-- **file**: 可以建立和修改 App 建立的檔案
-- **full**: 完整的 Drive 存取權限
-
-### 特點
-✅ **3行程式碼**：最少程式碼完成認證
-✅ **自動重新整理**：令牌過期自動處理
-✅ **智慧快取**：避免重複認證
-✅ **錯誤處理**：完整的異常處理機制
-✅ **彈性權限**：預定義常用權限範圍
-
-### 適用場景
-🎯 快速原型開發
-🎯 簡單的個人工具
-🎯 學習和測試
-🎯 不需要複雜配置的應用
-    """
-    
-    return guide 
\ No newline at end of file
+    guide_path = Path(__file__).parent / 'docs' / 'simple_auth_guide.md'
+    return guide_path.read_text(encoding='utf-8')
\ No newline at end of file
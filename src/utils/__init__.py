@@ -6,15 +6,29 @@ from .config import ConfigManager
 from .logger import setup_logger, get_logger
 from .helpers import slugify, format_size, format_time
 from .exceptions import *
-from .error_handler import (
-    ErrorHandler,
-    ErrorResult,
-    ui_error_handler,
-    handle_error,
-    is_critical_error,
-    should_retry,
-    get_suggested_action
-)
+
+# error_handler 延後載入（PEP 562）：多數匯入 src.utils 的路徑
+# 只用到 config/logger/helpers，不必在匯入時付出 error_handler
+# 及其相依模組的載入成本；首次存取相關名稱時才真正匯入。
+_ERROR_HANDLER_NAMES = frozenset({
+    'ErrorHandler',
+    'ErrorResult',
+    'ui_error_handler',
+    'handle_error',
+    'is_critical_error',
+    'should_retry',
+    'get_suggested_action',
+})
+
+
+def __getattr__(name):
+    if name in _ERROR_HANDLER_NAMES:
+        from . import error_handler
+        value = getattr(error_handler, name)
+        globals()[name] = value  # 之後的存取不再經過 __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     'ConfigManager',
@@ -35,4 +49,4 @@ __all__ = [
     'is_critical_error',
     'should_retry',
     'get_suggested_action'
-] 
\ No newline at end of file
+]
@@ -0,0 +1,79 @@
+"""
+快取工具
+提供帶有 TTL 與 LRU 淘汰機制的執行緒安全快取
+"""
+
+import time
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class TTLCache:
+    """帶有 TTL 的 LRU 快取
+
+    超過 maxsize 時淘汰最久未使用的項目，
+    超過 ttl 秒的項目視為過期。所有操作皆為執行緒安全。
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 300):
+        """
+        Args:
+            maxsize: 快取項目數量上限
+            ttl: 項目存活時間（秒）
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._cache: OrderedDict = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get(self, key: Any, default: Any = None) -> Optional[Any]:
+        """取得快取值，不存在或已過期時返回 default"""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return default
+
+            value, timestamp = entry
+            if time.time() - timestamp >= self.ttl:
+                del self._cache[key]
+                return default
+
+            # 移到最近使用端
+            self._cache.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any):
+        """設定快取值"""
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            self._cache[key] = (value, time.time())
+
+            # 淘汰最久未使用的項目
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+
+    def pop(self, key: Any, default: Any = None) -> Optional[Any]:
+        """移除並返回快取值"""
+        with self._lock:
+            entry = self._cache.pop(key, None)
+            if entry is None:
+                return default
+            return entry[0]
+
+    def clear(self):
+        """清除所有快取"""
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+    def __contains__(self, key: Any) -> bool:
+        return self.get(key, default=_MISSING) is not _MISSING
+
+
+# get/__contains__ 用的哨兵值，用於區分「值為 None」與「不存在」
+_MISSING = object()
@@ -3,14 +3,65 @@
 提供系統配置的載入、儲存和管理功能
 """
 
+import copy
+import mmap
 import yaml
 import os
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 import logging
 
+# libyaml 的 C 實作解析/輸出比純 Python loader 快數倍；
+# PyYAML 未連結 libyaml 時退回純 Python 的安全版本，行為相同
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
 logger = logging.getLogger(__name__)
 
+# 解析結果快取：(解析後路徑, mtime, 大小) -> 配置字典。
+# 重複建構同一路徑的 ConfigManager（或重複 load_config）時
+# 完全省去檔案 I/O 與 YAML 解析；檔案變動會改變鍵而自然失效。
+_CONFIG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+# 配置世代計數：任何配置變更都使其遞增，作為 get_config 記憶化的
+# 快取鍵之一 —— 版本一變，舊世代的快取項自然永不再命中
+_CONFIG_VERSION = 0
+
+
+def _bump_config_version():
+    """遞增配置世代，讓 get_config 的記憶化結果失效"""
+    global _CONFIG_VERSION
+    _CONFIG_VERSION += 1
+
+
+def _read_config_file(path: Path) -> Dict[str, Any]:
+    """讀取並解析配置檔（帶 (路徑, mtime, 大小) 快取）
+
+    回傳深拷貝，呼叫端的就地修改不會污染快取。
+    """
+    st = path.stat()
+    key = (str(path.resolve()), st.st_mtime, st.st_size)
+    cached = _CONFIG_CACHE.get(key)
+    if cached is None:
+        with open(path, 'rb') as file:
+            if st.st_size:
+                # mmap 讓解析器直接讀核心頁面快取，省去先把整份
+                # 檔案複製進 Python heap 的暫態記憶體
+                mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+                try:
+                    cached = yaml.load(mm, Loader=_YamlLoader) or {}
+                finally:
+                    mm.close()
+            else:
+                # 空檔案無法 mmap
+                cached = {}
+        _CONFIG_CACHE[key] = cached
+    return copy.deepcopy(cached)
+
 
 class ConfigManager:
     """配置管理器
@@ -21,6 +72,14 @@ class ConfigManager:
     def __init__(self, config_path: str = "config.yaml"):
         self.config_path = Path(config_path)
         self._config: Dict[str, Any] = {}
+        # 點號路徑 -> 值的扁平索引；get() 以單次字典查找取代
+        # 逐層走訪，熱路徑（如每個分塊讀 download.chunk_size）受益。
+        # None 表示索引失效，下次 get() 時重建。
+        self._flat: Optional[Dict[str, Any]] = None
+        # 髒旗標：只有實際變更過配置才需要落盤，save_config 對
+        # 未變更的配置是純 no-op。落盤永遠只在明確呼叫
+        # save_config 時發生，不自動改寫使用者的 config.yaml
+        self._dirty = False
         self._load_config()
     
     def _load_config(self):
@@ -33,8 +92,11 @@ class ConfigManager:
             )
         
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as file:
-                self._config = yaml.safe_load(file) or {}
+            # 經由 (路徑, mtime, 大小) 快取，重複載入同一檔案為 O(1)
+            self._config = _read_config_file(self.config_path)
+            self._flat = None
+            self._dirty = False
+            _bump_config_version()
             logger.info(f"配置檔案已載入: {self.config_path}")
             
             if not self._config:
@@ -87,45 +149,71 @@ class ConfigManager:
         }
         
         self._config = default_config
+        self._flat = None
+        self._dirty = True
         self.save_config()
     
+    def _rebuild_flat_index(self) -> Dict[str, Any]:
+        """重建點號路徑的扁平索引
+
+        每個階層節點（含中間的 dict）都以完整點號路徑入索引，
+        之後的 get() 不需要 split 也不需要 Python 層迴圈。
+        """
+        flat: Dict[str, Any] = {}
+
+        def walk(node: Dict[str, Any], prefix: str):
+            for k, v in node.items():
+                path = f"{prefix}.{k}" if prefix else k
+                flat[path] = v
+                if isinstance(v, dict):
+                    walk(v, path)
+
+        walk(self._config, '')
+        self._flat = flat
+        return flat
+
     def get(self, key: str, default: Any = None) -> Any:
         """取得配置值
-        
+
         Args:
             key: 配置鍵，支援點號分隔的階層式存取 (e.g., 'download.max_concurrent')
             default: 預設值
-            
+
         Returns:
             配置值
         """
-        keys = key.split('.')
-        value = self._config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
-    
+        flat = self._flat
+        if flat is None:
+            flat = self._rebuild_flat_index()
+        return flat.get(key, default)
+
     def set(self, key: str, value: Any):
         """設定配置值
-        
+
+        設為與現值相同的值不視為變更：不失效快取、不標記髒旗標，
+        後續 save_config 也不會因此多寫一次檔案。
+
         Args:
             key: 配置鍵，支援點號分隔的階層式存取
             value: 配置值
         """
         keys = key.split('.')
         config = self._config
-        
+
         for k in keys[:-1]:
             if k not in config:
                 config[k] = {}
             config = config[k]
-        
-        config[keys[-1]] = value
+
+        leaf = keys[-1]
+        if leaf in config and config[leaf] == value:
+            logger.debug(f"配置未變更: {key} = {value}")
+            return
+
+        config[leaf] = value
+        self._flat = None
+        self._dirty = True
+        _bump_config_version()
         logger.info(f"配置已更新: {key} = {value}")
     
     def get_section(self, section: str) -> Dict[str, Any]:
@@ -140,24 +228,30 @@ class ConfigManager:
         return self.get(section, {})
     
     def save_config(self):
-        """儲存配置到檔案"""
+        """儲存配置到檔案（配置未變更時為 no-op）"""
+        if not self._dirty:
+            logger.debug("配置未變更，略過儲存")
+            return
+
         try:
             # 確保目錄存在
             self.config_path.parent.mkdir(parents=True, exist_ok=True)
             
             with open(self.config_path, 'w', encoding='utf-8') as file:
                 yaml.dump(
-                    self._config, 
-                    file, 
-                    default_flow_style=False, 
+                    self._config,
+                    file,
+                    Dumper=_YamlDumper,
+                    default_flow_style=False,
                     allow_unicode=True,
                     indent=2
                 )
+            self._dirty = False
             logger.info(f"配置已儲存: {self.config_path}")
         except Exception as e:
             logger.error(f"儲存配置檔案失敗: {e}")
             raise
-    
+
     def reload(self):
         """重新載入配置"""
         logger.info("重新載入配置檔案")
@@ -189,13 +283,19 @@ class ConfigManager:
         
         return True
     
-    def get_all(self) -> Dict[str, Any]:
+    def get_all(self, mutable: bool = False) -> Dict[str, Any]:
         """取得所有配置
-        
+
+        Args:
+            mutable: 需要可修改的副本時設為 True（深拷貝，較昂貴）
+
         Returns:
-            完整的配置字典
+            預設回傳唯讀檢視（MappingProxyType，O(1)、無複製），
+            直接反映後續的配置變更；mutable=True 回傳獨立的深拷貝
         """
-        return self._config.copy()
+        if mutable:
+            return copy.deepcopy(self._config)
+        return MappingProxyType(self._config)
     
     def update_from_dict(self, updates: Dict[str, Any]):
         """從字典更新配置
@@ -211,6 +311,9 @@ class ConfigManager:
                     base_dict[key] = value
         
         deep_update(self._config, updates)
+        self._flat = None
+        self._dirty = True
+        _bump_config_version()
         logger.info("配置已從字典更新")
 
 
@@ -218,9 +321,23 @@ class ConfigManager:
 config = ConfigManager()
 
 # 便利函數
+@lru_cache(maxsize=256)
+def _cached_lookup(key: str, default: Any, version: int) -> Any:
+    """get_config 的記憶化查找（version 參數使變更後自動失效）"""
+    return config.get(key, default)
+
+
 def get_config(key: str, default: Any = None) -> Any:
-    """全域配置取得函數"""
-    value = config.get(key, default)
+    """全域配置取得函數
+
+    結果依 (key, default, 配置世代) 記憶化：下載迴圈反覆讀取同一鍵
+    （如 download.chunk_size）時為純快取命中。default 需可雜湊，
+    不可雜湊時退回未快取的直接查找。
+    """
+    try:
+        value = _cached_lookup(key, default, _CONFIG_VERSION)
+    except TypeError:
+        value = config.get(key, default)
     if value is None and default is None:
         raise ValueError(
             f"配置項 '{key}' 不存在且未提供預設值。\n"
@@ -246,7 +363,10 @@ def load_config(config_path: str = None) -> Dict[str, Any]:
         配置字典
     """
     if config_path:
-        temp_config = ConfigManager(config_path)
-        return temp_config.get_all()
+        # 直接走解析快取，不必為了讀一次檔案建構 ConfigManager
+        path = Path(config_path)
+        if not path.exists():
+            raise FileNotFoundError(f"配置檔案不存在: {path}")
+        return _read_config_file(path)
     else:
         return config.get_all() 
\ No newline at end of file
@@ -1,373 +1,496 @@
 """
 Pydantic 配置模型
 提供型別安全和驗證的配置管理
+
+pydantic 的匯入與模型建構（每個 BaseModel 都要編譯 schema）成本
+不低，對只用 CLI 子命令、從不碰 YAML 配置的路徑是純粹的啟動稅。
+模型類別因此延後到首次存取才建立（PEP 562）：`import config_models`
+本身幾乎零成本，`from config_models import AppConfig` 才觸發建構。
 """
 
+import operator
 from typing import List, Optional, Any, Dict
 from pathlib import Path
 
-try:
-    from pydantic import BaseModel, Field, field_validator, model_validator
-    from pydantic_settings import BaseSettings
-    PYDANTIC_V2 = True
-except ImportError:
-    # Fallback for pydantic v1
-    from pydantic import BaseModel, Field, validator, root_validator
-    PYDANTIC_V2 = False
-
-
-class DownloadConfig(BaseModel):
-    """下載配置"""
-
-    max_concurrent: int = Field(
-        default=5,
-        ge=1,
-        le=20,
-        description="最大並發下載數"
-    )
-    chunk_size: int = Field(
-        default=1048576,  # 1MB
-        ge=1024,
-        le=104857600,  # 100MB
-        description="下載區塊大小（位元組）"
-    )
-    output_directory: str = Field(
-        default="./downloads",
-        description="預設輸出目錄"
-    )
-    max_retries: int = Field(
-        default=3,
-        ge=0,
-        le=10,
-        description="最大重試次數"
-    )
-    retry_delay: float = Field(
-        default=1.0,
-        ge=0.1,
-        le=60.0,
-        description="重試延遲時間（秒）"
-    )
-    timeout: int = Field(
-        default=300,
-        ge=30,
-        le=3600,
-        description="下載超時時間（秒）"
-    )
-
-    if PYDANTIC_V2:
-        @field_validator('chunk_size')
-        @classmethod
-        def validate_chunk_size(cls, v):
-            """驗證區塊大小是 256 的倍數"""
-            if v % 256 != 0:
-                raise ValueError('chunk_size 必須是 256 的倍數')
-            return v
+# 延後建立的名稱：首次經由模組屬性存取時才 import pydantic 並定義
+_LAZY_NAMES = frozenset({
+    'PYDANTIC_V2',
+    'DownloadConfig',
+    'AuthConfig',
+    'LoggingConfig',
+    'DatabaseConfig',
+    'WebConfig',
+    'UIConfig',
+    'RetryConfig',
+    'AppConfig',
+})
+
+_MODELS_BUILT = False
+
+# 點號路徑 -> attrgetter 的快取：attrgetter 以 C 實作一次編譯整條
+# 屬性鏈，AppConfig.get 的熱路徑（UI 進度迴圈逐次讀取）不再
+# split + 逐層 hasattr/getattr
+_GET_CACHE: Dict[str, Any] = {}
+
+# 驗證器用的合法值集合：frozenset 成員檢查 O(1) 且不需每次呼叫
+# 重建串列（validate_assignment=True 下每次指定都會執行驗證器）
+_VALID_LOG_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'})
+_VALID_THEMES = frozenset({'light', 'dark', 'auto'})
+
+# 傾印世代計數：任何配置模型的欄位指定都使其遞增，
+# to_dict 的快取以世代為鍵，嵌套區段的修改也能讓父模型快取失效
+_DUMP_GENERATION = 0
+
+
+def _bump_dump_generation():
+    """遞增傾印世代，使既有的 to_dict 快取失效"""
+    global _DUMP_GENERATION
+    _DUMP_GENERATION += 1
+
+
+def _build_models():
+    """匯入 pydantic 並定義所有配置模型（每個行程只執行一次）"""
+    global _MODELS_BUILT
+    if _MODELS_BUILT:
+        return
+
+    try:
+        from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator, model_validator
+        from pydantic_settings import BaseSettings
+        PYDANTIC_V2 = True
+    except ImportError:
+        # Fallback for pydantic v1
+        from pydantic import BaseModel, Field, PrivateAttr, validator, root_validator
+        PYDANTIC_V2 = False
+
+    class _DumpInvalidationMixin:
+        """欄位指定時遞增傾印世代，讓 AppConfig.to_dict 的快取失效"""
+
+        def __setattr__(self, name, value):
+            super().__setattr__(name, value)
+            if name[0] != '_':  # 私有屬性（如快取本身）不算配置變更
+                _bump_dump_generation()
+
+    class DownloadConfig(_DumpInvalidationMixin, BaseModel):
+        """下載配置"""
+
+        if PYDANTIC_V2:
+            # 延後建構 pydantic-core 驗證器：只用到部分區段模型的
+            # 路徑不必為其餘模型付 schema 編譯成本
+            model_config = ConfigDict(defer_build=True)
+
+        max_concurrent: int = Field(
+            default=5,
+            ge=1,
+            le=20,
+            description="最大並發下載數"
+        )
+        chunk_size: int = Field(
+            default=1048576,  # 1MB
+            ge=1024,
+            le=104857600,  # 100MB
+            description="下載區塊大小（位元組）"
+        )
+        output_directory: str = Field(
+            default="./downloads",
+            description="預設輸出目錄"
+        )
+        max_retries: int = Field(
+            default=3,
+            ge=0,
+            le=10,
+            description="最大重試次數"
+        )
+        retry_delay: float = Field(
+            default=1.0,
+            ge=0.1,
+            le=60.0,
+            description="重試延遲時間（秒）"
+        )
+        timeout: int = Field(
+            default=300,
+            ge=30,
+            le=3600,
+            description="下載超時時間（秒）"
+        )
 
-        @field_validator('output_directory')
-        @classmethod
-        def validate_output_directory(cls, v):
-            """驗證輸出目錄路徑"""
-            if not v or v.strip() == '':
-                raise ValueError('output_directory 不能為空')
-            return v
-    else:
-        @validator('chunk_size')
-        def validate_chunk_size(cls, v):
-            if v % 256 != 0:
-                raise ValueError('chunk_size 必須是 256 的倍數')
-            return v
-
-        @validator('output_directory')
-        def validate_output_directory(cls, v):
-            if not v or v.strip() == '':
-                raise ValueError('output_directory 不能為空')
-            return v
-
-
-class AuthConfig(BaseModel):
-    """認證配置"""
-
-    credentials_file: str = Field(
-        default="credentials.json",
-        description="OAuth 認證檔案路徑"
-    )
-    token_file: str = Field(
-        default="token.pickle",
-        description="令牌儲存檔案路徑"
-    )
-    scopes: List[str] = Field(
-        default=['https://www.googleapis.com/auth/drive.readonly'],
-        description="Google API 權限範圍"
-    )
-    redirect_uri: str = Field(
-        default="http://localhost:8080",
-        description="OAuth 重定向 URI"
-    )
-    port: int = Field(
-        default=9876,
-        ge=1024,
-        le=65535,
-        description="OAuth 本地伺服器端口"
-    )
-    prefer_adc: bool = Field(
-        default=True,
-        description="優先使用 ADC（Application Default Credentials）"
-    )
-
-    if PYDANTIC_V2:
-        @field_validator('scopes')
-        @classmethod
-        def validate_scopes(cls, v):
-            """驗證 scopes 不為空"""
-            if not v:
-                raise ValueError('scopes 不能為空')
-            return v
-    else:
-        @validator('scopes')
-        def validate_scopes(cls, v):
-            if not v:
-                raise ValueError('scopes 不能為空')
-            return v
-
-
-class LoggingConfig(BaseModel):
-    """日誌配置"""
-
-    level: str = Field(
-        default="INFO",
-        description="日誌等級"
-    )
-    file: str = Field(
-        default="logs/app.log",
-        description="日誌檔案路徑"
-    )
-    max_size: int = Field(
-        default=10485760,  # 10MB
-        ge=1024,
-        le=104857600,  # 100MB
-        description="日誌檔案最大大小（位元組）"
-    )
-    backup_count: int = Field(
-        default=5,
-        ge=0,
-        le=20,
-        description="日誌備份數量"
-    )
-    format: str = Field(
-        default="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        description="日誌格式"
-    )
-
-    if PYDANTIC_V2:
-        @field_validator('level')
-        @classmethod
-        def validate_level(cls, v):
-            """驗證日誌等級"""
-            valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-            if v.upper() not in valid_levels:
-                raise ValueError(f'level 必須是以下之一: {valid_levels}')
-            return v.upper()
-    else:
-        @validator('level')
-        def validate_level(cls, v):
-            valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-            if v.upper() not in valid_levels:
-                raise ValueError(f'level 必須是以下之一: {valid_levels}')
-            return v.upper()
-
-
-class DatabaseConfig(BaseModel):
-    """資料庫配置"""
-
-    url: str = Field(
-        default="sqlite:///data/downloads.db",
-        description="資料庫連接 URL"
-    )
-    echo: bool = Field(
-        default=False,
-        description="是否輸出 SQL 日誌"
-    )
-
-
-class WebConfig(BaseModel):
-    """Web 服務配置"""
-
-    host: str = Field(
-        default="127.0.0.1",
-        description="Web 服務主機"
-    )
-    port: int = Field(
-        default=8000,
-        ge=1024,
-        le=65535,
-        description="Web 服務端口"
-    )
-    debug: bool = Field(
-        default=False,
-        description="是否啟用除錯模式"
-    )
-
-
-class UIConfig(BaseModel):
-    """UI 配置"""
-
-    progress_update_interval: float = Field(
-        default=1.0,
-        ge=0.1,
-        le=10.0,
-        description="進度更新間隔（秒）"
-    )
-    theme: str = Field(
-        default="light",
-        description="UI 主題"
-    )
-    page_size: int = Field(
-        default=50,
-        ge=10,
-        le=100,
-        description="分頁大小"
-    )
-
-    if PYDANTIC_V2:
-        @field_validator('theme')
-        @classmethod
-        def validate_theme(cls, v):
-            """驗證主題"""
-            valid_themes = ['light', 'dark', 'auto']
-            if v.lower() not in valid_themes:
-                raise ValueError(f'theme 必須是以下之一: {valid_themes}')
-            return v.lower()
-    else:
-        @validator('theme')
-        def validate_theme(cls, v):
-            valid_themes = ['light', 'dark', 'auto']
-            if v.lower() not in valid_themes:
-                raise ValueError(f'theme 必須是以下之一: {valid_themes}')
-            return v.lower()
-
-
-class RetryConfig(BaseModel):
-    """重試配置"""
-
-    max_retries: int = Field(
-        default=3,
-        ge=0,
-        le=10,
-        description="最大重試次數"
-    )
-    base_delay: float = Field(
-        default=1.0,
-        ge=0.1,
-        le=30.0,
-        description="基礎延遲時間（秒）"
-    )
-    max_delay: float = Field(
-        default=60.0,
-        ge=1.0,
-        le=300.0,
-        description="最大延遲時間（秒）"
-    )
-    backoff_factor: float = Field(
-        default=2.0,
-        ge=1.0,
-        le=5.0,
-        description="退避因子"
-    )
-    jitter: bool = Field(
-        default=True,
-        description="是否添加隨機抖動"
-    )
-
-
-class AppConfig(BaseModel):
-    """應用程式主配置"""
-
-    download: DownloadConfig = Field(default_factory=DownloadConfig)
-    auth: AuthConfig = Field(default_factory=AuthConfig)
-    logging: LoggingConfig = Field(default_factory=LoggingConfig)
-    database: DatabaseConfig = Field(default_factory=DatabaseConfig)
-    web: WebConfig = Field(default_factory=WebConfig)
-    ui: UIConfig = Field(default_factory=UIConfig)
-    retry: RetryConfig = Field(default_factory=RetryConfig)
-
-    class Config:
-        """Pydantic 配置"""
-        validate_assignment = True
-        extra = 'allow'  # 允許額外欄位
-
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'AppConfig':
-        """從字典建立配置
-
-        Args:
-            data: 配置字典
-
-        Returns:
-            AppConfig 實例
-        """
-        return cls(**data)
-
-    def to_dict(self) -> Dict[str, Any]:
-        """轉換為字典
-
-        Returns:
-            配置字典
-        """
         if PYDANTIC_V2:
-            return self.model_dump()
+            @field_validator('chunk_size')
+            @classmethod
+            def validate_chunk_size(cls, v):
+                """驗證區塊大小是 256 的倍數"""
+                if v & 255:  # 位元遮罩等價於 v % 256 != 0，省一次除法
+                    raise ValueError('chunk_size 必須是 256 的倍數')
+                return v
+
+            @field_validator('output_directory')
+            @classmethod
+            def validate_output_directory(cls, v):
+                """驗證輸出目錄路徑"""
+                if not v or v.strip() == '':
+                    raise ValueError('output_directory 不能為空')
+                return v
         else:
-            return self.dict()
-
-    def get(self, key: str, default: Any = None) -> Any:
-        """取得配置值（支援點號分隔）
-
-        Args:
-            key: 配置鍵，例如 'download.max_concurrent'
-            default: 預設值
-
-        Returns:
-            配置值
-        """
-        keys = key.split('.')
-        value = self
-
-        for k in keys:
-            if hasattr(value, k):
-                value = getattr(value, k)
-            elif isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
+            @validator('chunk_size')
+            def validate_chunk_size(cls, v):
+                if v & 255:  # 位元遮罩等價於 v % 256 != 0，省一次除法
+                    raise ValueError('chunk_size 必須是 256 的倍數')
+                return v
 
-        return value
+            @validator('output_directory')
+            def validate_output_directory(cls, v):
+                if not v or v.strip() == '':
+                    raise ValueError('output_directory 不能為空')
+                return v
 
-    def set(self, key: str, value: Any):
-        """設定配置值（支援點號分隔）
+    class AuthConfig(_DumpInvalidationMixin, BaseModel):
+        """認證配置"""
 
-        Args:
-            key: 配置鍵
-            value: 配置值
-        """
-        keys = key.split('.')
+        if PYDANTIC_V2:
+            # 延後建構 pydantic-core 驗證器：只用到部分區段模型的
+            # 路徑不必為其餘模型付 schema 編譯成本
+            model_config = ConfigDict(defer_build=True)
 
-        if len(keys) == 1:
-            setattr(self, key, value)
+        credentials_file: str = Field(
+            default="credentials.json",
+            description="OAuth 認證檔案路徑"
+        )
+        token_file: str = Field(
+            default="token.pickle",
+            description="令牌儲存檔案路徑"
+        )
+        scopes: List[str] = Field(
+            default=['https://www.googleapis.com/auth/drive.readonly'],
+            description="Google API 權限範圍"
+        )
+        redirect_uri: str = Field(
+            default="http://localhost:8080",
+            description="OAuth 重定向 URI"
+        )
+        port: int = Field(
+            default=9876,
+            ge=1024,
+            le=65535,
+            description="OAuth 本地伺服器端口"
+        )
+        prefer_adc: bool = Field(
+            default=True,
+            description="優先使用 ADC（Application Default Credentials）"
+        )
+
+        if PYDANTIC_V2:
+            @field_validator('scopes')
+            @classmethod
+            def validate_scopes(cls, v):
+                """驗證 scopes 不為空"""
+                if not v:
+                    raise ValueError('scopes 不能為空')
+                return v
+        else:
+            @validator('scopes')
+            def validate_scopes(cls, v):
+                if not v:
+                    raise ValueError('scopes 不能為空')
+                return v
+
+    class LoggingConfig(_DumpInvalidationMixin, BaseModel):
+        """日誌配置"""
+
+        if PYDANTIC_V2:
+            # 延後建構 pydantic-core 驗證器：只用到部分區段模型的
+            # 路徑不必為其餘模型付 schema 編譯成本
+            model_config = ConfigDict(defer_build=True)
+
+        level: str = Field(
+            default="INFO",
+            description="日誌等級"
+        )
+        file: str = Field(
+            default="logs/app.log",
+            description="日誌檔案路徑"
+        )
+        max_size: int = Field(
+            default=10485760,  # 10MB
+            ge=1024,
+            le=104857600,  # 100MB
+            description="日誌檔案最大大小（位元組）"
+        )
+        backup_count: int = Field(
+            default=5,
+            ge=0,
+            le=20,
+            description="日誌備份數量"
+        )
+        format: str = Field(
+            default="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+            description="日誌格式"
+        )
+
+        if PYDANTIC_V2:
+            @field_validator('level')
+            @classmethod
+            def validate_level(cls, v):
+                """驗證日誌等級"""
+                u = v.upper()
+                if u not in _VALID_LOG_LEVELS:
+                    # 錯誤訊息只在失敗路徑才組字串
+                    raise ValueError(f'level 必須是以下之一: {sorted(_VALID_LOG_LEVELS)}')
+                return u
         else:
-            section = getattr(self, keys[0], None)
-            if section and hasattr(section, keys[1]):
-                setattr(section, keys[1], value)
+            @validator('level')
+            def validate_level(cls, v):
+                u = v.upper()
+                if u not in _VALID_LOG_LEVELS:
+                    raise ValueError(f'level 必須是以下之一: {sorted(_VALID_LOG_LEVELS)}')
+                return u
+
+    class DatabaseConfig(_DumpInvalidationMixin, BaseModel):
+        """資料庫配置"""
 
+        if PYDANTIC_V2:
+            # 延後建構 pydantic-core 驗證器：只用到部分區段模型的
+            # 路徑不必為其餘模型付 schema 編譯成本
+            model_config = ConfigDict(defer_build=True)
+
+        url: str = Field(
+            default="sqlite:///data/downloads.db",
+            description="資料庫連接 URL"
+        )
+        echo: bool = Field(
+            default=False,
+            description="是否輸出 SQL 日誌"
+        )
+
+    class WebConfig(_DumpInvalidationMixin, BaseModel):
+        """Web 服務配置"""
+
+        if PYDANTIC_V2:
+            # 延後建構 pydantic-core 驗證器：只用到部分區段模型的
+            # 路徑不必為其餘模型付 schema 編譯成本
+            model_config = ConfigDict(defer_build=True)
 
-def create_default_config() -> AppConfig:
+        host: str = Field(
+            default="127.0.0.1",
+            description="Web 服務主機"
+        )
+        port: int = Field(
+            default=8000,
+            ge=1024,
+            le=65535,
+            description="Web 服務端口"
+        )
+        debug: bool = Field(
+            default=False,
+            description="是否啟用除錯模式"
+        )
+
+    class UIConfig(_DumpInvalidationMixin, BaseModel):
+        """UI 配置"""
+
+        if PYDANTIC_V2:
+            # 延後建構 pydantic-core 驗證器：只用到部分區段模型的
+            # 路徑不必為其餘模型付 schema 編譯成本
+            model_config = ConfigDict(defer_build=True)
+
+        progress_update_interval: float = Field(
+            default=1.0,
+            ge=0.1,
+            le=10.0,
+            description="進度更新間隔（秒）"
+        )
+        theme: str = Field(
+            default="light",
+            description="UI 主題"
+        )
+        page_size: int = Field(
+            default=50,
+            ge=10,
+            le=100,
+            description="分頁大小"
+        )
+
+        if PYDANTIC_V2:
+            @field_validator('theme')
+            @classmethod
+            def validate_theme(cls, v):
+                """驗證主題"""
+                u = v.lower()
+                if u not in _VALID_THEMES:
+                    raise ValueError(f'theme 必須是以下之一: {sorted(_VALID_THEMES)}')
+                return u
+        else:
+            @validator('theme')
+            def validate_theme(cls, v):
+                u = v.lower()
+                if u not in _VALID_THEMES:
+                    raise ValueError(f'theme 必須是以下之一: {sorted(_VALID_THEMES)}')
+                return u
+
+    class RetryConfig(_DumpInvalidationMixin, BaseModel):
+        """重試配置"""
+
+        if PYDANTIC_V2:
+            # 延後建構 pydantic-core 驗證器：只用到部分區段模型的
+            # 路徑不必為其餘模型付 schema 編譯成本
+            model_config = ConfigDict(defer_build=True)
+
+        max_retries: int = Field(
+            default=3,
+            ge=0,
+            le=10,
+            description="最大重試次數"
+        )
+        base_delay: float = Field(
+            default=1.0,
+            ge=0.1,
+            le=30.0,
+            description="基礎延遲時間（秒）"
+        )
+        max_delay: float = Field(
+            default=60.0,
+            ge=1.0,
+            le=300.0,
+            description="最大延遲時間（秒）"
+        )
+        backoff_factor: float = Field(
+            default=2.0,
+            ge=1.0,
+            le=5.0,
+            description="退避因子"
+        )
+        jitter: bool = Field(
+            default=True,
+            description="是否添加隨機抖動"
+        )
+
+    class AppConfig(_DumpInvalidationMixin, BaseModel):
+        """應用程式主配置"""
+
+        # to_dict 的結果快取：(傾印世代, 字典)。私有屬性不參與
+        # 欄位驗證與序列化，也不觸發世代遞增
+        _dump_cache: Optional[tuple] = PrivateAttr(default=None)
+
+        download: DownloadConfig = Field(default_factory=DownloadConfig)
+        auth: AuthConfig = Field(default_factory=AuthConfig)
+        logging: LoggingConfig = Field(default_factory=LoggingConfig)
+        database: DatabaseConfig = Field(default_factory=DatabaseConfig)
+        web: WebConfig = Field(default_factory=WebConfig)
+        ui: UIConfig = Field(default_factory=UIConfig)
+        retry: RetryConfig = Field(default_factory=RetryConfig)
+
+        class Config:
+            """Pydantic 配置"""
+            validate_assignment = True
+            extra = 'allow'  # 允許額外欄位
+
+        @classmethod
+        def from_dict(cls, data: Dict[str, Any]) -> 'AppConfig':
+            """從字典建立配置
+
+            Args:
+                data: 配置字典
+
+            Returns:
+                AppConfig 實例
+            """
+            return cls(**data)
+
+        def to_dict(self) -> Dict[str, Any]:
+            """轉換為字典
+
+            結果以傾印世代為鍵快取：配置未變更時重複呼叫
+            （如連續的 save_config_to_yaml / validate_config）
+            不再重走整棵模型的序列化。每次回傳頂層的淺拷貝，
+            呼叫端改動回傳值不會污染快取。
+
+            Returns:
+                配置字典
+            """
+            cached = self._dump_cache
+            if cached is not None and cached[0] == _DUMP_GENERATION:
+                return dict(cached[1])
+
+            if PYDANTIC_V2:
+                data = self.model_dump()
+            else:
+                data = self.dict()
+            self._dump_cache = (_DUMP_GENERATION, data)
+            return dict(data)
+
+        def get(self, key: str, default: Any = None) -> Any:
+            """取得配置值（支援點號分隔）
+
+            Args:
+                key: 配置鍵，例如 'download.max_concurrent'
+                default: 預設值
+
+            Returns:
+                配置值
+            """
+            acc = _GET_CACHE.get(key)
+            if acc is None:
+                acc = operator.attrgetter(key)
+                _GET_CACHE[key] = acc
+
+            try:
+                return acc(self)
+            except (AttributeError, TypeError):
+                pass
+
+            # 回退到逐層走訪：額外欄位可能是普通 dict，
+            # attrgetter 走不進下標存取
+            value = self
+            for k in key.split('.'):
+                if hasattr(value, k):
+                    value = getattr(value, k)
+                elif isinstance(value, dict) and k in value:
+                    value = value[k]
+                else:
+                    return default
+
+            return value
+
+        def set(self, key: str, value: Any):
+            """設定配置值（支援點號分隔）
+
+            Args:
+                key: 配置鍵
+                value: 配置值
+            """
+            keys = key.split('.')
+
+            if len(keys) == 1:
+                setattr(self, key, value)
+            else:
+                section = getattr(self, keys[0], None)
+                if section and hasattr(section, keys[1]):
+                    setattr(section, keys[1], value)
+
+    # 發佈到模組全域：之後的存取（含 _ensure_models 後的函數內
+    # 全域查找）不再經過 __getattr__
+    for name in _LAZY_NAMES:
+        globals()[name] = locals()[name]
+    _MODELS_BUILT = True
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        _build_models()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def create_default_config() -> 'AppConfig':
     """建立預設配置
 
     Returns:
         AppConfig 實例
     """
+    _build_models()
     return AppConfig()
 
 
-def load_config_from_yaml(file_path: str) -> AppConfig:
+def load_config_from_yaml(file_path: str) -> 'AppConfig':
     """從 YAML 檔案載入配置
 
     Args:
@@ -381,14 +504,21 @@ def load_config_from_yaml(file_path: str) -> AppConfig:
         ValueError: 配置格式錯誤
     """
     import yaml
+    # libyaml 的 C 解析器比純 Python loader 快一個數量級；
+    # 未連結 libyaml 時退回純 Python 的安全版本，行為相同
+    try:
+        from yaml import CSafeLoader as _Loader
+    except ImportError:
+        from yaml import SafeLoader as _Loader
 
+    _build_models()
     path = Path(file_path)
     if not path.exists():
         raise FileNotFoundError(f"配置檔案不存在: {file_path}")
 
     try:
         with open(path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f) or {}
+            data = yaml.load(f, Loader=_Loader) or {}
 
         return AppConfig.from_dict(data)
 
@@ -396,7 +526,37 @@ def load_config_from_yaml(file_path: str) -> AppConfig:
         raise ValueError(f"YAML 格式錯誤: {e}")
 
 
-def save_config_to_yaml(config: AppConfig, file_path: str):
+def load_config_from_toml(file_path: str) -> 'AppConfig':
+    """從 TOML 檔案載入配置（標準庫 tomllib 的 C 加速解析）
+
+    Args:
+        file_path: TOML 檔案路徑
+
+    Returns:
+        AppConfig 實例
+
+    Raises:
+        FileNotFoundError: 檔案不存在
+        ValueError: 配置格式錯誤
+    """
+    import tomllib
+
+    _build_models()
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"配置檔案不存在: {file_path}")
+
+    try:
+        with open(path, 'rb') as f:
+            data = tomllib.load(f)
+
+        return AppConfig.from_dict(data)
+
+    except tomllib.TOMLDecodeError as e:
+        raise ValueError(f"TOML 格式錯誤: {e}")
+
+
+def save_config_to_yaml(config: 'AppConfig', file_path: str):
     """儲存配置到 YAML 檔案
 
     Args:
@@ -404,6 +564,10 @@ def save_config_to_yaml(config: AppConfig, file_path: str):
         file_path: YAML 檔案路徑
     """
     import yaml
+    try:
+        from yaml import CSafeDumper as _Dumper
+    except ImportError:
+        from yaml import SafeDumper as _Dumper
 
     path = Path(file_path)
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -412,13 +576,14 @@ def save_config_to_yaml(config: AppConfig, file_path: str):
         yaml.dump(
             config.to_dict(),
             f,
+            Dumper=_Dumper,
             default_flow_style=False,
             allow_unicode=True,
             indent=2
         )
 
 
-def validate_config(config: AppConfig) -> tuple[bool, List[str]]:
+def validate_config(config: 'AppConfig') -> tuple[bool, List[str]]:
     """驗證配置
 
     Args:
@@ -5,6 +5,7 @@
 
 from typing import Callable, Any, Optional, TypeVar, Union
 from functools import wraps
+import logging
 import traceback
 
 from .logger import get_logger
@@ -36,6 +37,10 @@ class ErrorResult:
     用於包裝操作結果，區分成功和失敗
     """
 
+    # 每次被包裝的呼叫都會產生一個實例：__slots__ 省去 __dict__，
+    # 降低每實例記憶體並加快屬性存取
+    __slots__ = ('success', 'data', 'error', 'error_message', 'error_code')
+
     def __init__(
         self,
         success: bool,
@@ -147,54 +152,20 @@ class ErrorHandler:
             def wrapper(*args, **kwargs):
                 try:
                     return func(*args, **kwargs)
-
-                except FileNotFoundError as e:
-                    _log_error(log_level, f"檔案不存在: {e}")
-                    if reraise:
-                        raise DownloadError(
-                            f"找不到指定的檔案或資料夾",
-                            file_id=e.file_id if hasattr(e, 'file_id') else None
-                        )
-                    return default_return
-
-                except FilePermissionError as e:
-                    _log_error(log_level, f"權限錯誤: {e}")
-                    if reraise:
-                        raise DownloadError(
-                            f"沒有存取權限",
-                            file_id=e.file_id if hasattr(e, 'file_id') else None
-                        )
-                    return default_return
-
-                except NetworkError as e:
-                    _log_error(log_level, f"網路錯誤: {e}")
-                    if reraise:
-                        raise DownloadError(f"網路連接問題: {e}")
-                    return default_return
-
-                except AuthenticationError as e:
-                    _log_error(log_level, f"認證錯誤: {e}")
-                    if reraise:
-                        raise
-                    return default_return
-
-                except QuotaExceededError as e:
-                    _log_error(log_level, f"配額超限: {e}")
-                    if reraise:
-                        raise
-                    return default_return
-
-                except ValidationError as e:
-                    _log_error(log_level, f"驗證錯誤: {e}")
-                    if reraise:
-                        raise
-                    return default_return
-
                 except Exception as e:
-                    _log_error("error", f"未預期的錯誤: {e}\n{traceback.format_exc()}")
-                    if reraise:
-                        raise DownloadError(f"發生未預期的錯誤: {str(e)}")
-                    return default_return
+                    # 以例外型別做 O(1) 分派，取代逐一比對的 except 鏈
+                    handler = _API_ERROR_DISPATCH.get(type(e))
+                    if handler is None:
+                        # 未見過的型別沿 MRO 找最近的已註冊基類，
+                        # 結果記回分派表，下次同型別直接命中
+                        for base in type(e).__mro__:
+                            handler = _API_ERROR_DISPATCH.get(base)
+                            if handler is not None:
+                                break
+                        else:
+                            handler = _handle_unexpected_error
+                        _API_ERROR_DISPATCH[type(e)] = handler
+                    return handler(e, reraise, log_level, default_return)
 
             return wrapper
         return decorator
@@ -249,10 +220,76 @@ class ErrorHandler:
             return default
 
 
+# 等級名稱 -> 已綁定日誌方法：一次解析取代每次呼叫的 getattr
+_LOG_FUNCS = {
+    'debug': logger.debug,
+    'info': logger.info,
+    'warning': logger.warning,
+    'error': logger.error,
+    'critical': logger.critical,
+}
+
+
 def _log_error(level: str, message: str):
     """根據等級記錄錯誤"""
-    log_func = getattr(logger, level, logger.error)
-    log_func(message)
+    _LOG_FUNCS.get(level, logger.error)(message)
+
+
+# handle_api_error 的型別分派處理器：各自保留原 except 分支的行為
+def _handle_file_not_found(e, reraise, log_level, default_return):
+    _log_error(log_level, f"檔案不存在: {e}")
+    if reraise:
+        raise DownloadError(
+            "找不到指定的檔案或資料夾",
+            file_id=getattr(e, 'file_id', None)
+        )
+    return default_return
+
+
+def _handle_file_permission(e, reraise, log_level, default_return):
+    _log_error(log_level, f"權限錯誤: {e}")
+    if reraise:
+        raise DownloadError(
+            "沒有存取權限",
+            file_id=getattr(e, 'file_id', None)
+        )
+    return default_return
+
+
+def _handle_network(e, reraise, log_level, default_return):
+    _log_error(log_level, f"網路錯誤: {e}")
+    if reraise:
+        raise DownloadError(f"網路連接問題: {e}")
+    return default_return
+
+
+def _make_passthrough_handler(prefix: str):
+    """建立「記錄後原樣重拋」的處理器（認證、配額、驗證錯誤）"""
+    def handler(e, reraise, log_level, default_return):
+        _log_error(log_level, f"{prefix}: {e}")
+        if reraise:
+            raise  # 於 except 區塊內被呼叫，重拋當前例外
+        return default_return
+    return handler
+
+
+def _handle_unexpected_error(e, reraise, log_level, default_return):
+    # 堆疊走訪與字串格式化都不便宜，日誌等級會丟棄訊息時直接略過
+    if logger.isEnabledFor(logging.ERROR):
+        _log_error("error", f"未預期的錯誤: {e}\n{traceback.format_exc()}")
+    if reraise:
+        raise DownloadError(f"發生未預期的錯誤: {str(e)}")
+    return default_return
+
+
+_API_ERROR_DISPATCH = {
+    FileNotFoundError: _handle_file_not_found,
+    FilePermissionError: _handle_file_permission,
+    NetworkError: _handle_network,
+    AuthenticationError: _make_passthrough_handler("認證錯誤"),
+    QuotaExceededError: _make_passthrough_handler("配額超限"),
+    ValidationError: _make_passthrough_handler("驗證錯誤"),
+}
 
 
 # Streamlit 專用錯誤處理
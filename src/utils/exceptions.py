@@ -3,17 +3,29 @@
 提供系統特定的例外處理
 """
 
+from functools import singledispatch
+from types import MappingProxyType
 from typing import Optional
 
+# 共用的空 details：多數例外不帶細節，不必每次 raise 都配置新字典
+_EMPTY_DETAILS = MappingProxyType({})
+
 
 class DownloadError(Exception):
     """下載相關例外基類"""
-    
+
+    # 含各子類屬性的插槽宣告：屬性存取走插槽描述器
+    # （Exception 本身仍帶 __dict__，動態屬性不受影響）
+    __slots__ = (
+        'error_type', 'file_id', 'details',
+        'status_code', 'config_key', 'field', 'value', 'retry_after'
+    )
+
     def __init__(self, message: str, error_type: str = None, file_id: str = None, details: dict = None):
         super().__init__(message)
         self.error_type = error_type or self.__class__.__name__
         self.file_id = file_id
-        self.details = details or {}
+        self.details = details if details else _EMPTY_DETAILS
         
     def __str__(self):
         base_msg = super().__str__()
@@ -142,13 +154,46 @@ def get_retry_delay(error: Exception, base_delay: float = 1.0) -> float:
     return base_delay
 
 
+# 例外特有屬性的提取：singledispatch 以 C 層的型別查找取代
+# 每次呼叫的 isinstance 鏈，首次分派後同型別為快取命中
+@singledispatch
+def _error_context_extras(error: Exception) -> dict:
+    return {}
+
+
+@_error_context_extras.register
+def _download_error_extras(error: DownloadError) -> dict:
+    extras = {}
+    if error.file_id:
+        extras['file_id'] = error.file_id
+    if error.details:
+        extras['details'] = error.details
+    return extras
+
+
+@_error_context_extras.register
+def _network_error_extras(error: NetworkError) -> dict:
+    extras = _download_error_extras(error)
+    if hasattr(error, 'status_code'):
+        extras['status_code'] = error.status_code
+    return extras
+
+
+@_error_context_extras.register
+def _validation_error_extras(error: ValidationError) -> dict:
+    extras = _download_error_extras(error)
+    extras['field'] = error.field
+    extras['value'] = error.value
+    return extras
+
+
 def create_error_context(error: Exception, **additional_context) -> dict:
     """建立錯誤上下文資訊
-    
+
     Args:
         error: 例外實例
         **additional_context: 額外的上下文資訊
-        
+
     Returns:
         錯誤上下文字典
     """
@@ -158,22 +203,11 @@ def create_error_context(error: Exception, **additional_context) -> dict:
         'retryable': is_retryable_error(error),
         'retry_delay': get_retry_delay(error)
     }
-    
+
     # 添加例外特有的屬性
-    if isinstance(error, DownloadError):
-        if error.file_id:
-            context['file_id'] = error.file_id
-        if error.details:
-            context['details'] = error.details
-    
-    if isinstance(error, NetworkError) and hasattr(error, 'status_code'):
-        context['status_code'] = error.status_code
-    
-    if isinstance(error, ValidationError):
-        context['field'] = error.field
-        context['value'] = error.value
-    
+    context.update(_error_context_extras(error))
+
     # 添加額外的上下文資訊
     context.update(additional_context)
-    
+
     return context 
\ No newline at end of file
@@ -8,6 +8,28 @@ import unicodedata
 from typing import Optional, Union
 from pathlib import Path
 
+# JSON 解析加速：有 orjson 時使用（約 3 倍速度），否則退回標準庫
+try:
+    import orjson as _json_impl
+except ImportError:
+    import json as _json_impl
+
+
+def fast_json_loads(data: Union[str, bytes]):
+    """
+    解析 JSON 字串或位元組
+
+    熱路徑（如大量 files.list 回應）建議統一經由此函數，
+    安裝 orjson 時可免費獲得 C 實作的解析速度。
+
+    Args:
+        data: JSON 字串或位元組
+
+    Returns:
+        解析後的 Python 物件
+    """
+    return _json_impl.loads(data)
+
 
 def slugify(value: str, allow_unicode: bool = False) -> str:
     """
@@ -44,6 +66,33 @@ def slugify(value: str, allow_unicode: bool = False) -> str:
     return value
 
 
+# 危險檔名字元對應底線的轉換表（模組載入時建立一次）
+_SAFE_TRANSLATE = str.maketrans({c: '_' for c in '<>:"/\\|?*\0'})
+
+
+def fast_slugify(name: str) -> str:
+    """
+    快速清理檔案名稱
+
+    以 str.translate 將檔案系統不允許的字元換成底線，
+    不經過正規表達式，適合大量檔案的熱路徑。
+
+    Args:
+        name: 原始檔案名稱
+
+    Returns:
+        安全的檔案名稱
+    """
+    value = str(name).translate(_SAFE_TRANSLATE).strip()
+
+    # 限制長度（Windows 檔案名最大 255 字符）
+    if len(value) > 200:
+        stem, ext = Path(value).stem, Path(value).suffix
+        value = stem[:200 - len(ext)] + ext
+
+    return value
+
+
 def format_size(size_bytes: Union[int, float]) -> str:
     """
     格式化檔案大小
@@ -130,7 +130,11 @@ class LoggerMixin:
     
     為類別提供日誌功能
     """
-    
+
+    # 僅宣告 _logger 插槽：不含 __dict__ 的子類（如認證類）
+    # 才能真正省去每實例的屬性字典；其餘子類行為不變
+    __slots__ = ('_logger',)
+
     @property
     def logger(self) -> logging.Logger:
         """取得類別專用的日誌器"""
@@ -12,6 +12,7 @@ import sys
 sys.path.append(str(Path(__file__).parent.parent))
 
 from src.core.auth import GoogleOAuthProvider, AuthManager
+from src.core.fast_json_model import FastJsonModel
 from src.utils.exceptions import AuthenticationError, ConfigurationError
 
 
@@ -149,11 +150,12 @@ class TestAuthManager:
         result = self.auth_manager.get_drive_service()
         
         assert result == mock_service
-        mock_build.assert_called_once_with(
-            'drive', 'v3', 
-            credentials=mock_credentials, 
-            cache_discovery=False
-        )
+        mock_build.assert_called_once()
+        args, kwargs = mock_build.call_args
+        assert args == ('drive', 'v3')
+        assert kwargs['credentials'] == mock_credentials
+        assert kwargs['cache_discovery'] is False
+        assert isinstance(kwargs['model'], FastJsonModel)
     
     def test_get_drive_service_no_credentials(self):
         """測試取得 Drive 服務 - 沒有認證"""
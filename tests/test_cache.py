@@ -0,0 +1,85 @@
+"""
+快取工具測試
+"""
+
+import time
+import pytest
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.utils.cache import TTLCache
+
+
+class TestTTLCache:
+    """測試 TTL LRU 快取"""
+
+    def test_set_and_get(self):
+        """測試基本存取"""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set('key', 'value')
+
+        assert cache.get('key') == 'value'
+
+    def test_get_missing_returns_default(self):
+        """測試不存在的鍵返回預設值"""
+        cache = TTLCache(maxsize=10, ttl=60)
+
+        assert cache.get('missing') is None
+        assert cache.get('missing', 'default') == 'default'
+
+    def test_expired_entry(self):
+        """測試過期項目"""
+        cache = TTLCache(maxsize=10, ttl=0.01)
+        cache.set('key', 'value')
+
+        time.sleep(0.05)
+
+        assert cache.get('key') is None
+
+    def test_lru_eviction(self):
+        """測試 LRU 淘汰"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+
+        # 存取 a 使其成為最近使用
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+
+    def test_pop(self):
+        """測試移除項目"""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set('key', 'value')
+
+        assert cache.pop('key') == 'value'
+        assert cache.get('key') is None
+        assert cache.pop('missing', 'default') == 'default'
+
+    def test_clear(self):
+        """測試清除快取"""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.get('a') is None
+
+    def test_contains(self):
+        """測試成員檢查"""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set('key', None)
+
+        assert 'key' in cache
+        assert 'missing' not in cache
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,95 @@
+"""
+資料夾列表持久化快取測試
+"""
+
+import tempfile
+import pytest
+from pathlib import Path
+import sys
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.core.listing_cache import ListingCache
+
+
+class TestListingCache:
+    """測試 SQLite 列表快取"""
+
+    def setup_method(self):
+        """測試前設定"""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = ListingCache(db_path=str(Path(self.temp_dir.name) / 'cache.db'))
+
+    def teardown_method(self):
+        """測試後清理"""
+        self.cache.close()
+        self.temp_dir.cleanup()
+
+    def test_set_and_get(self):
+        """測試基本存取"""
+        files = [{'id': 'f1', 'name': 'file1.txt'}]
+        self.cache.set('folder_id', '2025-01-01T00:00:00Z', files)
+
+        result = self.cache.get('folder_id', '2025-01-01T00:00:00Z')
+
+        assert result == files
+
+    def test_get_missing(self):
+        """測試不存在的資料夾"""
+        result = self.cache.get('unknown', '2025-01-01T00:00:00Z')
+
+        assert result is None
+
+    def test_stale_modified_time(self):
+        """測試 modifiedTime 不符時視為過期"""
+        files = [{'id': 'f1', 'name': 'file1.txt'}]
+        self.cache.set('folder_id', '2025-01-01T00:00:00Z', files)
+
+        result = self.cache.get('folder_id', '2025-06-01T00:00:00Z')
+
+        assert result is None
+
+    def test_variant_separation(self):
+        """測試不同列舉方式分開儲存"""
+        flat = [{'id': 'f1'}]
+        deep = [{'id': 'f1'}, {'id': 'f2'}]
+        self.cache.set('folder_id', 'mtime', flat)
+        self.cache.set('folder_id', 'mtime', deep, variant='recursive:10')
+
+        assert self.cache.get('folder_id', 'mtime') == flat
+        assert self.cache.get('folder_id', 'mtime', variant='recursive:10') == deep
+
+    def test_invalidate(self):
+        """測試清除單一資料夾"""
+        self.cache.set('folder_id', 'mtime', [{'id': 'f1'}])
+        self.cache.set('folder_id', 'mtime', [{'id': 'f2'}], variant='recursive:10')
+
+        self.cache.invalidate('folder_id')
+
+        assert self.cache.get('folder_id', 'mtime') is None
+        assert self.cache.get('folder_id', 'mtime', variant='recursive:10') is None
+
+    def test_empty_modified_time_skipped(self):
+        """測試缺少 modifiedTime 時不寫入"""
+        self.cache.set('folder_id', '', [{'id': 'f1'}])
+
+        assert self.cache.get('folder_id', '') is None
+
+    def test_persists_across_instances(self):
+        """測試跨實例持久化"""
+        db_path = str(Path(self.temp_dir.name) / 'persist.db')
+        files = [{'id': 'f1', 'name': 'file1.txt'}]
+
+        cache1 = ListingCache(db_path=db_path)
+        cache1.set('folder_id', 'mtime', files)
+        cache1.close()
+
+        cache2 = ListingCache(db_path=db_path)
+        try:
+            assert cache2.get('folder_id', 'mtime') == files
+        finally:
+            cache2.close()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
@@ -0,0 +1,75 @@
+"""
+速率調節器測試
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# 添加專案根目錄到路徑
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.core.pacer import TokenBucket
+
+
+class TestTokenBucket:
+    """令牌桶測試"""
+
+    def test_burst_acquire_does_not_block(self):
+        """測試突發量內的取得不會阻塞"""
+        bucket = TokenBucket(rate=10, burst=5)
+
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.1
+
+    def test_acquire_waits_when_empty(self):
+        """測試令牌用盡後會等待補充"""
+        bucket = TokenBucket(rate=20, burst=1)
+        bucket.acquire()
+
+        start = time.monotonic()
+        bucket.acquire()
+        elapsed = time.monotonic() - start
+
+        # 速率 20/秒，約需等待 0.05 秒
+        assert elapsed >= 0.03
+
+    def test_throttle_halves_rate(self):
+        """測試限流後速率減半"""
+        bucket = TokenBucket(rate=10, burst=20)
+
+        bucket.throttle()
+
+        assert bucket.get_rate() == pytest.approx(5.0, abs=0.5)
+
+    def test_throttle_respects_min_rate(self):
+        """測試速率不會低於下限"""
+        bucket = TokenBucket(rate=10, burst=20)
+
+        for _ in range(10):
+            bucket.throttle()
+
+        assert bucket.get_rate() >= bucket.MIN_RATE
+
+    def test_rate_recovers_after_hold(self):
+        """測試降速期滿後速率線性回復"""
+        bucket = TokenBucket(rate=10, burst=20)
+        bucket.throttle()
+
+        # 模擬降速期已過且經過一段回復時間
+        bucket._throttled_until = time.monotonic() - 1.0
+        bucket._last_refill = time.monotonic() - 1.0
+        rate = bucket.get_rate()
+
+        assert rate > 5.0
+        assert rate <= bucket.base_rate
+
+
+if __name__ == '__main__':
+    pytest.main([__file__])
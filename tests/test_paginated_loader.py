@@ -155,7 +155,7 @@ class TestPaginatedFolderLoader:
         assert loader.has_more() is True
         assert loader.is_loading() is False
         assert loader.is_completed() is False
-        assert loader.items == []
+        assert loader.items == ()
 
     def test_get_progress_initial(self):
         """測試初始進度"""
@@ -166,7 +166,7 @@ class TestPaginatedFolderLoader:
 
         assert loader.get_progress() == 0.0
 
-    @patch('src.core.paginated_loader.get_authenticated_service')
+    @patch('src.core.paginated_loader.create_authenticated_service')
     def test_load_next_page_no_more(self, mock_get_service):
         """測試載入下一頁 - 沒有更多頁面"""
         loader = PaginatedFolderLoader(
@@ -196,7 +196,7 @@ class TestPaginatedFolderLoader:
 
         assert loader.state.total_items == 0
         assert loader.state.current_page == 0
-        assert loader.items == []
+        assert loader.items == ()
 
     def test_get_statistics_empty(self):
         """測試統計資訊 - 空"""
@@ -308,56 +308,49 @@ class TestCachedFolderLoader:
 
         assert result == [{'id': '1', 'name': 'file1'}]
 
+    def _insert_cache_entry(self, folder_id, page_size=50, created_at=None):
+        """直接寫入快取項目（同步維護次索引）"""
+        cache_key = (folder_id, page_size)
+        self.cache_loader._cache[cache_key] = {
+            'loader': Mock(),
+            'created_at': created_at if created_at is not None else time.time()
+        }
+        self.cache_loader._by_folder[folder_id].add(cache_key)
+
     def test_invalidate_all(self):
         """測試使所有快取失效"""
         # 建立一些快取
-        self.cache_loader._cache['folder_123:50'] = {
-            'loader': Mock(),
-            'created_at': time.time()
-        }
-        self.cache_loader._cache['folder_456:50'] = {
-            'loader': Mock(),
-            'created_at': time.time()
-        }
+        self._insert_cache_entry("folder_123")
+        self._insert_cache_entry("folder_456")
 
         self.cache_loader.invalidate()
 
         assert len(self.cache_loader._cache) == 0
+        assert len(self.cache_loader._by_folder) == 0
 
     def test_invalidate_specific_folder(self):
         """測試使特定資料夾快取失效"""
         # 建立一些快取
-        self.cache_loader._cache['folder_123:50'] = {
-            'loader': Mock(),
-            'created_at': time.time()
-        }
-        self.cache_loader._cache['folder_456:50'] = {
-            'loader': Mock(),
-            'created_at': time.time()
-        }
+        self._insert_cache_entry("folder_123")
+        self._insert_cache_entry("folder_456")
 
         self.cache_loader.invalidate("folder_123")
 
-        assert 'folder_123:50' not in self.cache_loader._cache
-        assert 'folder_456:50' in self.cache_loader._cache
+        assert ('folder_123', 50) not in self.cache_loader._cache
+        assert ('folder_456', 50) in self.cache_loader._cache
 
     def test_cleanup_expired(self):
         """測試清理過期快取"""
         # 建立過期的快取
-        self.cache_loader._cache['folder_old:50'] = {
-            'loader': Mock(),
-            'created_at': time.time() - 100  # 100 秒前
-        }
+        self._insert_cache_entry("folder_old", created_at=time.time() - 100)
         # 建立新的快取
-        self.cache_loader._cache['folder_new:50'] = {
-            'loader': Mock(),
-            'created_at': time.time()
-        }
+        self._insert_cache_entry("folder_new")
 
         self.cache_loader.cleanup_expired()
 
-        assert 'folder_old:50' not in self.cache_loader._cache
-        assert 'folder_new:50' in self.cache_loader._cache
+        assert ('folder_old', 50) not in self.cache_loader._cache
+        assert ('folder_new', 50) in self.cache_loader._cache
+        assert 'folder_old' not in self.cache_loader._by_folder
 
 
 class TestLoadFolderPaginated: